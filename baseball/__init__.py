@@ -1,3 +1,5 @@
+from baseball.version import __version__
+
 from baseball.fetch_game import (get_game_from_url,
                                  get_game_xml_from_url,
                                  get_game_dict_from_url,
@@ -5,13 +7,41 @@ from baseball.fetch_game import (get_game_from_url,
                                  write_svg_from_file_range,
                                  write_game_svg_and_html,
                                  get_game_generator_from_file_range,
+                                 get_parallel_game_generator_from_file_range,
                                  get_game_list_from_file_range,
+                                 get_pitch_generator_from_file_range,
                                  generate_today_game_svgs,
-                                 write_games_for_date)
+                                 run_live_scoreboard,
+                                 write_games_for_date,
+                                 benchmark_decoder_backends)
 
 from baseball.process_game_xml import MLB_TEAM_CODE_DICT
 
-from baseball.baseball import (PlayerAppearance,
+from baseball.process_game_json import (update_game_obj,
+                                        set_box_score_source,
+                                        verify_box_scores)
+
+from baseball.schedule_index import (update_schedule_index,
+                                     set_schedule_index_path)
+
+from baseball.fetch_http import set_http_cache_dir
+
+from baseball.live_feed import set_statsapi_url
+
+from baseball.season_stats import (get_season_stats_from_file_range,
+                                   get_season_stats_from_game_list)
+
+from baseball.game_cache import set_game_cache_dir
+
+from baseball.game_transport import get_compact_game, get_game_from_compact
+
+from baseball.decoders import set_decoder_backends
+
+from baseball.archive_manifest import (build_archive_manifest,
+                                       update_archive_manifest)
+
+from baseball.baseball import (set_lazy_game_stats,
+                               PlayerAppearance,
                                Player,
                                Team,
                                Game,
@@ -21,5 +51,6 @@ from baseball.baseball import (PlayerAppearance,
 from baseball.baseball_events import (Substitution,
                                       Switch,
                                       Pitch,
+                                      PitchRecord,
                                       Pickoff,
                                       RunnerAdvance)
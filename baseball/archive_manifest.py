@@ -0,0 +1,206 @@
+from bisect import bisect_left, bisect_right
+from json import dumps, loads
+from os import listdir, replace, stat
+from os.path import abspath, exists, getmtime, isdir, join
+
+from dateutil.parser import parse
+
+from baseball.process_game_xml import MLB_REVERSE_TEAM_CODE_DICT
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+GAME_FILE_SUFFIX_LIST = ['boxscore.xml', 'players.xml',
+                         'inning/inning_all.xml', 'live']
+
+MANIFEST_DICT = {}
+MANIFEST_REFRESH_SET = set()
+
+def get_manifest_path(input_dir):
+    return join(abspath(input_dir), MANIFEST_FILENAME)
+
+def get_day_dir(year, month, day):
+    return '{}/month_{}/day_{}'.format(year, month, day)
+
+def get_game_mtime(game_path):
+    mtime_list = [getmtime(join(game_path, suffix))
+                  for suffix in GAME_FILE_SUFFIX_LIST
+                  if exists(join(game_path, suffix))]
+
+    return max(mtime_list) if mtime_list else None
+
+def get_day_game_list(input_path, year, month, day, with_mtime=False):
+    game_list = []
+    day_dir = get_day_dir(year, month, day)
+    day_path = '{}/{}/'.format(input_path, day_dir)
+    if isdir(day_path):
+        for subfile in listdir(day_path):
+            if subfile.startswith('gid_'):
+                away_code, home_code, game_num = subfile.split('_')[-3:]
+                away_code = away_code[:-3]
+                home_code = home_code[:-3]
+                away_team = MLB_REVERSE_TEAM_CODE_DICT.get(away_code,
+                                                           away_code.upper())
+
+                home_team = MLB_REVERSE_TEAM_CODE_DICT.get(home_code,
+                                                           home_code.upper())
+
+                if away_team and home_team and listdir(day_path + subfile):
+                    game_dict = {
+                        'game_id': '-'.join([year, month, day, away_team,
+                                             home_team, game_num]),
+                        'date': '-'.join([year, month, day]),
+                        'away_team': away_team,
+                        'home_team': home_team,
+                        'game_number': game_num,
+                        'era': 'xml' if int(year) < 2019 else 'json',
+                        'path': '{}/{}'.format(day_dir, subfile),
+                    }
+
+                    if with_mtime:
+                        game_dict['mtime'] = get_game_mtime(day_path + subfile)
+
+                    game_list.append(game_dict)
+
+    return game_list
+
+def get_filename_tuple(input_path, game_dict):
+    game_path = '{}/{}/'.format(input_path, game_dict['path'])
+
+    return (game_dict['game_id'],
+            game_path + 'boxscore.xml',
+            game_path + 'players.xml',
+            game_path + 'inning/inning_all.xml',
+            game_path + 'live')
+
+def load_archive_manifest(input_dir):
+    manifest_path = get_manifest_path(input_dir)
+    manifest = None
+    if exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as filehandle:
+            manifest = loads(filehandle.read())
+
+        if manifest.get('version') != MANIFEST_VERSION:
+            manifest = None
+
+    MANIFEST_DICT[manifest_path] = manifest
+
+    return manifest
+
+def write_archive_manifest(input_dir, manifest):
+    manifest_path = get_manifest_path(input_dir)
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as filehandle:
+        filehandle.write(dumps(manifest, sort_keys=True))
+
+    replace(temp_path, manifest_path)
+    MANIFEST_DICT[manifest_path] = manifest
+
+def get_archive_manifest(input_dir):
+    manifest_path = get_manifest_path(input_dir)
+    if manifest_path not in MANIFEST_DICT:
+        load_archive_manifest(input_dir)
+
+    return MANIFEST_DICT[manifest_path]
+
+def year_is_in_range(year, start_year, end_year):
+    return not ((start_year and int(year) < start_year) or
+                (end_year and int(year) > end_year))
+
+def update_archive_manifest(input_dir, start_year=None, end_year=None,
+                            check_days=False):
+    input_path = abspath(input_dir)
+    manifest_path = get_manifest_path(input_dir)
+    manifest = (get_archive_manifest(input_dir) or
+                {'version': MANIFEST_VERSION, 'day_dict': {}, 'date_list': []})
+
+    day_dict = manifest['day_dict']
+    is_changed = manifest.pop('month_dict', None) is not None
+    year_list = sorted(year for year in listdir(input_path)
+                       if year.isdigit() and isdir(join(input_path, year)))
+
+    date_set = set()
+    for year in year_list:
+        if not year_is_in_range(year, start_year, end_year):
+            continue
+
+        MANIFEST_REFRESH_SET.add((manifest_path, int(year)))
+        for month_dir in sorted(listdir(join(input_path, year))):
+            month_path = join(input_path, year, month_dir)
+            if not (month_dir.startswith('month_') and isdir(month_path)):
+                continue
+
+            for day_dir in sorted(listdir(month_path)):
+                if not day_dir.startswith('day_'):
+                    continue
+
+                month = month_dir.split('_')[-1]
+                day = day_dir.split('_')[-1]
+                day_mtime = stat(join(month_path, day_dir)).st_mtime
+                date_str = '-'.join([year, month, day])
+                date_set.add(date_str)
+                if (check_days or
+                        day_dict.get(date_str, {}).get('mtime') != day_mtime):
+                    day_dict[date_str] = {
+                        'mtime': day_mtime,
+                        'game_list': get_day_game_list(input_path, year, month,
+                                                       day, with_mtime=True)
+                    }
+
+                    is_changed = True
+
+    for date_str in list(day_dict):
+        if (year_is_in_range(date_str.split('-')[0], start_year, end_year) and
+                date_str not in date_set):
+            del day_dict[date_str]
+            is_changed = True
+
+    if is_changed or not exists(manifest_path):
+        manifest['date_list'] = sorted(day_dict)
+        write_archive_manifest(input_dir, manifest)
+
+    return manifest
+
+def refresh_archive_manifest(input_dir, start_year, end_year):
+    manifest_path = get_manifest_path(input_dir)
+    stale_year_list = [year for year in range(start_year, end_year + 1)
+                       if (manifest_path, year) not in MANIFEST_REFRESH_SET]
+
+    if stale_year_list:
+        update_archive_manifest(input_dir, stale_year_list[0],
+                                stale_year_list[-1])
+
+        MANIFEST_REFRESH_SET.update((manifest_path, year)
+                                    for year in stale_year_list)
+
+    return get_archive_manifest(input_dir)
+
+def build_archive_manifest(input_dir):
+    return update_archive_manifest(input_dir, check_days=True)
+
+def get_manifest_game_list(start_date_str, end_date_str, input_dir):
+    start_date = parse(start_date_str)
+    end_date = parse(end_date_str)
+    manifest = refresh_archive_manifest(input_dir, start_date.year,
+                                        end_date.year)
+
+    date_list = manifest['date_list']
+    start_index = bisect_left(date_list, '{:04d}-{:02d}-{:02d}'.format(
+        start_date.year, start_date.month, start_date.day
+    ))
+
+    end_index = bisect_right(date_list, '{:04d}-{:02d}-{:02d}'.format(
+        end_date.year, end_date.month, end_date.day
+    ))
+
+    return [game_dict
+            for date_str in date_list[start_index:end_index]
+            for game_dict in manifest['day_dict'][date_str]['game_list']]
+
+def get_manifest_filename_list(start_date_str, end_date_str, input_dir):
+    input_path = abspath(input_dir)
+
+    return [get_filename_tuple(input_path, game_dict)
+            for game_dict in get_manifest_game_list(start_date_str,
+                                                    end_date_str,
+                                                    input_dir)]
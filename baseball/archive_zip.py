@@ -0,0 +1,127 @@
+from os import getpid, stat
+from os.path import abspath, isfile
+from re import compile as re_compile
+from zipfile import ZipFile
+
+from baseball.process_game_xml import MLB_REVERSE_TEAM_CODE_DICT
+
+ZIP_SUFFIX = '.zip'
+
+ZIP_MEMBER_PATTERN = re_compile(
+    r'^(.*?)(\d{4})/month_(\d{2})/day_(\d{2})/(gid_[^/]+)/.+[^/]$'
+)
+
+ZIP_HANDLE_DICT = {}
+ZIP_INDEX_DICT = {}
+
+def is_zip_path(input_dir):
+    return input_dir.lower().endswith(ZIP_SUFFIX) and isfile(input_dir)
+
+def split_zip_path(path):
+    zip_index = path.lower().find(ZIP_SUFFIX + '/')
+    if zip_index == -1:
+        return None, path
+
+    return (path[:zip_index + len(ZIP_SUFFIX)],
+            path[zip_index + len(ZIP_SUFFIX) + 1:])
+
+def get_zip_file(zip_path):
+    handle_key = (getpid(), zip_path)
+    zip_file = ZIP_HANDLE_DICT.get(handle_key)
+    if zip_file is None:
+        zip_file = ZipFile(zip_path)
+        ZIP_HANDLE_DICT[handle_key] = zip_file
+
+    return zip_file
+
+def get_zip_index(zip_path):
+    zip_path = abspath(zip_path)
+    zip_index = ZIP_INDEX_DICT.get(zip_path)
+    if zip_index is None:
+        zip_index = {'day_dict': {}, 'member_dict': {}}
+        game_dir_set = set()
+        for zip_info in get_zip_file(zip_path).infolist():
+            zip_index['member_dict'][zip_info.filename] = zip_info
+            match = ZIP_MEMBER_PATTERN.match(zip_info.filename)
+            if match:
+                prefix, year, month, day, subfile = match.groups()
+                game_dir = '{}{}/month_{}/day_{}/{}'.format(prefix, year,
+                                                            month, day,
+                                                            subfile)
+
+                if game_dir not in game_dir_set:
+                    game_dir_set.add(game_dir)
+                    zip_index['day_dict'].setdefault(
+                        '-'.join([year, month, day]), []
+                    ).append((year, month, day, subfile, game_dir))
+
+        ZIP_INDEX_DICT[zip_path] = zip_index
+
+    return zip_index
+
+def get_zip_day_game_list(zip_path, year, month, day):
+    game_list = []
+    zip_index = get_zip_index(zip_path)
+    for _, _, _, subfile, game_dir in zip_index['day_dict'].get(
+            '-'.join([year, month, day]), []):
+        away_code, home_code, game_num = subfile.split('_')[-3:]
+        away_code = away_code[:-3]
+        home_code = home_code[:-3]
+        away_team = MLB_REVERSE_TEAM_CODE_DICT.get(away_code,
+                                                   away_code.upper())
+
+        home_team = MLB_REVERSE_TEAM_CODE_DICT.get(home_code,
+                                                   home_code.upper())
+
+        if away_team and home_team:
+            game_list.append({
+                'game_id': '-'.join([year, month, day, away_team, home_team,
+                                     game_num]),
+                'date': '-'.join([year, month, day]),
+                'away_team': away_team,
+                'home_team': home_team,
+                'game_number': game_num,
+                'era': 'xml' if int(year) < 2019 else 'json',
+                'path': game_dir,
+            })
+
+    return game_list
+
+def get_zip_member_info(path):
+    zip_path, member_name = split_zip_path(path)
+    if zip_path is None or not isfile(zip_path):
+        return None
+
+    return get_zip_index(zip_path)['member_dict'].get(member_name)
+
+def archive_file_exists(path):
+    if split_zip_path(path)[0]:
+        return get_zip_member_info(path) is not None
+
+    return isfile(path)
+
+def open_archive_file(path):
+    zip_path, member_name = split_zip_path(path)
+    if zip_path:
+        return get_zip_file(abspath(zip_path)).open(member_name)
+
+    return open(path, 'rb')
+
+def read_archive_file(path):
+    zip_path, member_name = split_zip_path(path)
+    if zip_path:
+        return get_zip_file(abspath(zip_path)).read(member_name).decode(
+            'utf-8'
+        )
+
+    with open(path, 'r', encoding='utf-8') as filehandle:
+        return filehandle.read()
+
+def get_archive_file_fingerprint(path):
+    zip_info = get_zip_member_info(path)
+    if zip_info:
+        return [str(zip_info.file_size), str(zip_info.CRC)]
+
+    file_stat = stat(path)
+
+    return [str(file_stat.st_size), str(file_stat.st_mtime_ns)]
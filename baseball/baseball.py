@@ -1,5 +1,7 @@
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
 from json import dumps
+from os import environ
 from textwrap import TextWrapper
 from re import search, sub, findall, escape
 
@@ -7,11 +9,16 @@ from pytz import timezone
 
 from baseball.baseball_events import RunnerAdvance
 from baseball.generate_svg import get_game_svg_str
-from baseball.stats import (get_all_pitcher_stats,
-                            get_all_batter_stats,
+from baseball.stats import (add_batter_stats,
+                            add_pitcher_stats,
+                            get_pitcher_box_score_dict,
+                            get_pitcher_box_score_dict_from_stats,
+                            get_batter_box_score_dict,
+                            get_batter_box_score_dict_from_stats,
                             get_box_score_total,
                             get_team_stats,
-                            get_half_inning_stats)
+                            process_half_inning_stats,
+                            set_game_states)
 
 POSITION_CODE_DICT = {'pitcher': 1,
                       'catcher': 2,
@@ -128,6 +135,18 @@ STADIUM_TIMEZONE_DICT = {
 
 EASTERN_TIMEZONE_STR = 'America/New_York'
 
+DescriptionParse = namedtuple('DescriptionParse',
+                              ['description', 'play_code', 'is_fly_out',
+                               'throws_str', 'defense_suffix', 'error_str',
+                               'runner_name_list'])
+
+LAZY_GAME_STATS_DICT = {
+    'is_lazy': environ.get('BASEBALL_LAZY_GAME_STATS', '') == '1'
+}
+
+def set_lazy_game_stats(is_lazy=True):
+    LAZY_GAME_STATS_DICT['is_lazy'] = bool(is_lazy)
+
 def strip_this_suffix(pattern, suffix, input_str):
     match = search(pattern, input_str)
     while match:
@@ -160,6 +179,97 @@ def strip_suffixes(input_str):
     return input_str
 
 
+@lru_cache(maxsize=4096)
+def get_initial_last_name_key(player_name):
+    player_name = sub(r' Jr$', '', player_name.strip(' .'))
+    player_name = sub(r' Sr$', '', player_name.strip(' .'))
+    player_name = sub(r' II$', '', player_name.strip())
+    player_name = sub(r' III$', '', player_name.strip())
+    player_name = sub(r' IV$', '', player_name.strip())
+
+    player_name = strip_suffixes(player_name.strip())
+    first_name_initial = player_name[0]
+    last_name = player_name.split()[-1]
+
+    return first_name_initial + last_name
+
+
+@lru_cache(maxsize=16384)
+def parse_description(plate_appearance_description):
+    description = strip_suffixes(plate_appearance_description)
+    runner_name_list = tuple(findall(
+        (r'([A-Z][\w\'-]+\s+(?:[A-Z,a-z][\w\'-]+\s+)?'
+         r'(?:[A-Z,a-z][\w\'-]+\s+)?[A-Z][\w\'-]+)\s+'
+         r'(?:out at|(?:was )?picked off and caught stealing|'
+         r'(?:was )?caught stealing|(?:was )?picked off|'
+         r'(?:was )?doubled off)'
+         r' +(\w+)'),
+        description
+    ))
+
+    play_str = description.split('. ')[0]
+    play_code = None
+    for keyword, this_code in PLAY_CODE_ORDERED_DICT.items():
+        if keyword in play_str.lower():
+            play_code = this_code
+
+    throws_str = description
+    suffix_str = ''
+    if '. ' in throws_str:
+        throws_str, suffix_str = throws_str.split('. ', 1)
+
+    if ', deflected' in throws_str:
+        throws_str = throws_str.split(', deflected')[0]
+
+    if ', assist' in throws_str:
+        throws_str = throws_str.split(', assist')[0]
+
+    if ': ' in throws_str:
+        throws_str = throws_str.split(': ')[1]
+
+    error_str = None
+    if 'error' in plate_appearance_description:
+        error_list = plate_appearance_description.split(' error by ')[1:2]
+        defense_player = error_list[0].split()[:1] if error_list else None
+        if defense_player and defense_player[0] in POSITION_CODE_DICT:
+            error_str = 'E' + str(POSITION_CODE_DICT[defense_player[0]])
+    elif 'catcher interference' in plate_appearance_description:
+        error_str = 'E2'
+
+    return DescriptionParse(
+        description,
+        play_code,
+        ' out to ' in play_str,
+        '-'.join(PlateAppearance.get_defense_code_order(throws_str)),
+        PlateAppearance.get_defense_suffix(suffix_str),
+        error_str,
+        runner_name_list
+    )
+
+class LazyAttribute:
+    def __init__(self, setter_name):
+        self.setter_name = setter_name
+        self.attribute_name = None
+
+    def __set_name__(self, owner, name):
+        self.attribute_name = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        if self.attribute_name not in obj.__dict__:
+            if not obj.lazy_stats:
+                return None
+
+            getattr(obj, self.setter_name)()
+
+        return obj.__dict__[self.attribute_name]
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attribute_name] = value
+
+
 class PlayerAppearance:
     def __init__(self, player_obj, position, start_inning_num,
                  start_inning_half, start_inning_batter_num):
@@ -290,6 +400,8 @@ class Team:
         self.player_id_dict = {}
         self.player_name_dict = {}
         self.player_last_name_dict = {}
+        self.player_name_index_dict = {}
+        self.resolved_name_dict = {}
 
     def _asdict(self):
         return (
@@ -306,25 +418,22 @@ class Team:
             player_id = player_key
             player = self.player_id_dict.get(player_id)
         elif isinstance(player_key, str):
-            player_name = player_key
-            player_name_no_spaces = ''.join(player_name.split())
-            for player_name_key in self.player_name_dict:
-                if player_name_no_spaces in player_name_key:
-                    player = self.player_name_dict[player_name_key]
+            if player_key in self.resolved_name_dict:
+                return self.resolved_name_dict[player_key]
 
+            player_name_no_spaces = ''.join(player_key.split())
+            player = self.player_name_index_dict.get(player_name_no_spaces)
             if not player:
-                player_name = sub(r' Jr$', '', player_name.strip(' .'))
-                player_name = sub(r' Sr$', '', player_name.strip(' .'))
-                player_name = sub(r' II$', '', player_name.strip())
-                player_name = sub(r' III$', '', player_name.strip())
-                player_name = sub(r' IV$', '', player_name.strip())
-
-                player_name = strip_suffixes(player_name.strip())
-                first_name_initial = player_name[0]
-                last_name = player_name.split()[-1]
-
-                initial_plus_last_name = first_name_initial + last_name
-                player = self.player_last_name_dict.get(initial_plus_last_name)
+                for player_name_key in self.player_name_dict:
+                    if player_name_no_spaces in player_name_key:
+                        player = self.player_name_dict[player_name_key]
+
+            if not player:
+                player = self.player_last_name_dict.get(
+                    get_initial_last_name_key(player_key)
+                )
+
+            self.resolved_name_dict[player_key] = player
         else:
             raise ValueError(
                 'Player key: {player_key} must be either int or str'.format(
@@ -348,19 +457,42 @@ class Team:
             last_name = last_name.split()[1]
 
         self.player_id_dict[player.mlb_id] = player
-        self.player_name_dict[''.join(player.full_name().split())] = player
+        self.add_player_name(''.join(player.full_name().split()), player)
         self.player_last_name_dict[player.first_name[0] + last_name] = player
 
         if '-' in last_name:
             last_half_name = last_name.split('-')[1]
-            self.player_name_dict[
-                '{}{}'.format(player.first_name, last_half_name)
-            ] = player
+            self.add_player_name(
+                '{}{}'.format(player.first_name, last_half_name), player
+            )
 
             self.player_last_name_dict[
                 player.first_name[0] + last_half_name
             ] = player
 
+        self.resolved_name_dict = {}
+
+    def add_player_name(self, player_name_key, player):
+        if player_name_key in self.player_name_dict:
+            self.player_name_dict[player_name_key] = player
+            self.set_player_name_index()
+        else:
+            self.player_name_dict[player_name_key] = player
+            for indexed_name_key in self.player_name_index_dict:
+                if indexed_name_key in player_name_key:
+                    self.player_name_index_dict[indexed_name_key] = player
+
+            self.player_name_index_dict[player_name_key] = player
+
+    def set_player_name_index(self):
+        self.player_name_index_dict = {}
+        for player_name_key, player in self.player_name_dict.items():
+            for indexed_name_key in self.player_name_index_dict:
+                if indexed_name_key in player_name_key:
+                    self.player_name_index_dict[indexed_name_key] = player
+
+            self.player_name_index_dict[player_name_key] = player
+
     def __contains__(self, player_key):
         return bool(self.find_player(player_key))
 
@@ -402,21 +534,23 @@ class Team:
 
 
 class Game:
+    away_batter_box_score_dict = LazyAttribute('set_batting_box_score_dict')
+    home_batter_box_score_dict = LazyAttribute('set_batting_box_score_dict')
+    away_pitcher_box_score_dict = LazyAttribute('set_pitching_box_score_dict')
+    home_pitcher_box_score_dict = LazyAttribute('set_pitching_box_score_dict')
+    away_team_stats = LazyAttribute('set_team_stats')
+    home_team_stats = LazyAttribute('set_team_stats')
+
     def __init__(self, home_team, away_team, location, game_date_str):
         self.home_team = home_team
         self.away_team = away_team
         self.location = location or ''
         self.game_date_str = game_date_str
 
+        self.lazy_stats = LAZY_GAME_STATS_DICT['is_lazy']
         self.start_datetime = None
         self.end_datetime = None
         self.inning_list = []
-        self.away_batter_box_score_dict = None
-        self.home_batter_box_score_dict = None
-        self.away_pitcher_box_score_dict = None
-        self.home_pitcher_box_score_dict = None
-        self.away_team_stats = None
-        self.home_team_stats = None
         self.attendance = None
         self.temp = None
         self.weather = None
@@ -426,6 +560,10 @@ class Game:
         self.is_suspended = False
         self.is_doubleheader = False
         self.is_today = True
+        self.play_count = None
+        self.pending_play_tuple = None
+        self.box_score_diff_list = None
+        self.half_stat_dict = None
 
     def json(self):
         return dumps(self._asdict())
@@ -503,45 +641,143 @@ class Game:
                     )
 
     def set_pitching_box_score_dict(self):
-        self.away_pitcher_box_score_dict = OrderedDict([])
-        self.home_pitcher_box_score_dict = OrderedDict([])
-
-        tuple_list = [
-            (self.away_pitcher_box_score_dict, self.away_team, 'bottom'),
-            (self.home_pitcher_box_score_dict, self.home_team, 'top'),
-        ]
-
-        for box_score_dict, team, inning_half_str in tuple_list:
-            for pitcher_appearance in team.pitcher_list:
-                pitcher = pitcher_appearance.player_obj
-                box_score_dict[pitcher] = (
-                    get_all_pitcher_stats(self, team, pitcher, inning_half_str)
-                )
+        self.away_pitcher_box_score_dict = get_pitcher_box_score_dict(
+            self, self.away_team, 'bottom'
+        )
+
+        self.home_pitcher_box_score_dict = get_pitcher_box_score_dict(
+            self, self.home_team, 'top'
+        )
 
     def set_batting_box_score_dict(self):
-        self.away_batter_box_score_dict = OrderedDict([])
-        self.home_batter_box_score_dict = OrderedDict([])
-
-        tuple_list = [
-            (self.away_batter_box_score_dict, self.away_team, 'top'),
-            (self.home_batter_box_score_dict, self.home_team, 'bottom'),
-        ]
-
-        for box_score_dict, team, inning_half_str in tuple_list:
-            for batting_order_list in team.batting_order_list_list:
-                for batter_appearance in batting_order_list:
-                    batter = batter_appearance.player_obj
-                    if batter not in box_score_dict:
-                        box_score_dict[batter] = (
-                            get_all_batter_stats(self, batter, inning_half_str)
-                        )
+        self.away_batter_box_score_dict = get_batter_box_score_dict(
+            self, self.away_team, 'top'
+        )
+
+        self.home_batter_box_score_dict = get_batter_box_score_dict(
+            self, self.home_team, 'bottom'
+        )
 
+        for box_score_dict in [self.away_batter_box_score_dict,
+                               self.home_batter_box_score_dict]:
             box_score_dict['TOTAL'] = get_box_score_total(box_score_dict)
 
     def set_team_stats(self):
         self.away_team_stats = get_team_stats(self, 'top')
         self.home_team_stats = get_team_stats(self, 'bottom')
 
+    def get_half_stat_tuple(self, inning_num, inning_half_str):
+        batter_stat_dict = {}
+        pitcher_stat_dict = {}
+        if inning_num <= len(self.inning_list):
+            inning = self.inning_list[inning_num - 1]
+            if inning_half_str == 'top':
+                inning_half = inning.top_half_appearance_list or []
+            else:
+                inning_half = inning.bottom_half_appearance_list or []
+
+            add_batter_stats(batter_stat_dict, inning_half)
+            add_pitcher_stats(pitcher_stat_dict, inning_half)
+
+        return batter_stat_dict, pitcher_stat_dict
+
+    def update_half_stat_dict(self, inning_key_set):
+        if self.half_stat_dict is None:
+            self.half_stat_dict = {
+                (inning_num, inning_half_str): self.get_half_stat_tuple(
+                    inning_num, inning_half_str
+                )
+                for inning_num in range(1, len(self.inning_list) + 1)
+                for inning_half_str in ['top', 'bottom']
+            }
+
+            return None
+
+        inning_key_set = inning_key_set | set(
+            inning_key for inning_key in self.half_stat_dict
+            if inning_key[0] > len(self.inning_list)
+        )
+
+        player_set = set()
+        for inning_num, inning_half_str in inning_key_set:
+            for stat_dict in self.half_stat_dict.pop(
+                    (inning_num, inning_half_str), ({}, {})):
+                player_set.update(stat_dict)
+
+            half_stat_tuple = self.get_half_stat_tuple(inning_num,
+                                                       inning_half_str)
+
+            if inning_num <= len(self.inning_list):
+                self.half_stat_dict[(inning_num, inning_half_str)] = (
+                    half_stat_tuple
+                )
+
+            for stat_dict in half_stat_tuple:
+                player_set.update(stat_dict)
+
+        return player_set
+
+    def get_half_stat_dict_list(self, inning_half_str, stat_index):
+        return [stat_tuple[stat_index]
+                for (_, this_half_str), stat_tuple in
+                self.half_stat_dict.items()
+                if this_half_str == inning_half_str]
+
+    def update_batting_box_score_dict(self, player_set):
+        self.away_batter_box_score_dict = get_batter_box_score_dict_from_stats(
+            self.away_team, self.get_half_stat_dict_list('top', 0),
+            self.away_batter_box_score_dict, player_set
+        )
+
+        self.home_batter_box_score_dict = get_batter_box_score_dict_from_stats(
+            self.home_team, self.get_half_stat_dict_list('bottom', 0),
+            self.home_batter_box_score_dict, player_set
+        )
+
+        for box_score_dict in [self.away_batter_box_score_dict,
+                               self.home_batter_box_score_dict]:
+            box_score_dict['TOTAL'] = get_box_score_total(box_score_dict)
+
+    def update_pitching_box_score_dict(self, player_set):
+        self.away_pitcher_box_score_dict = (
+            get_pitcher_box_score_dict_from_stats(
+                self.away_team, self.get_half_stat_dict_list('bottom', 1),
+                self.away_pitcher_box_score_dict, player_set
+            )
+        )
+
+        self.home_pitcher_box_score_dict = (
+            get_pitcher_box_score_dict_from_stats(
+                self.home_team, self.get_half_stat_dict_list('top', 1),
+                self.home_pitcher_box_score_dict, player_set
+            )
+        )
+
+    def update_stats(self, inning_key_set):
+        has_batting_box_score = '_away_batter_box_score_dict' in self.__dict__
+        has_pitching_box_score = (
+            '_away_pitcher_box_score_dict' in self.__dict__
+        )
+
+        if has_batting_box_score or has_pitching_box_score:
+            player_set = self.update_half_stat_dict(inning_key_set)
+            if has_batting_box_score:
+                self.update_batting_box_score_dict(player_set)
+
+            if has_pitching_box_score:
+                self.update_pitching_box_score_dict(player_set)
+
+        if '_away_team_stats' in self.__dict__:
+            inning_half_str_set = set(
+                inning_half_str for _, inning_half_str in inning_key_set
+            )
+
+            if 'top' in inning_half_str_set:
+                self.away_team_stats = get_team_stats(self, 'top')
+
+            if 'bottom' in inning_half_str_set:
+                self.home_team_stats = get_team_stats(self, 'bottom')
+
     def __repr__(self):
         return_str = '{}\n'.format(self.location)
         if self.start_datetime and self.end_datetime:
@@ -595,15 +831,41 @@ class Game:
 
 
 class Inning:
+    top_half_inning_stats = LazyAttribute('set_half_inning_stats')
+    bottom_half_inning_stats = LazyAttribute('set_half_inning_stats')
+    top_half_team_stats = LazyAttribute('set_half_inning_stats')
+    bottom_half_team_stats = LazyAttribute('set_half_inning_stats')
+
     def __init__(self, top_half_appearance_list, bottom_half_appearance_list):
         self.top_half_appearance_list = top_half_appearance_list
         self.bottom_half_appearance_list = bottom_half_appearance_list
+        self.lazy_stats = True
+        self.set_game_states()
+
+    def set_game_states(self):
+        set_game_states(self.top_half_appearance_list)
+        set_game_states(self.bottom_half_appearance_list)
+
+    def set_half_inning_stats(self):
         (self.top_half_inning_stats,
-         self.bottom_half_inning_stats) = (
-             get_half_inning_stats(top_half_appearance_list,
-                                   bottom_half_appearance_list)
+         self.top_half_team_stats) = process_half_inning_stats(
+             self.top_half_appearance_list
+         )
+
+        (self.bottom_half_inning_stats,
+         self.bottom_half_team_stats) = process_half_inning_stats(
+             self.bottom_half_appearance_list
          )
 
+    def reset_half_inning_stats(self):
+        for attribute_name in ['_top_half_inning_stats',
+                               '_bottom_half_inning_stats',
+                               '_top_half_team_stats',
+                               '_bottom_half_team_stats']:
+            self.__dict__.pop(attribute_name, None)
+
+        self.set_game_states()
+
     def _asdict(self):
         if self.bottom_half_appearance_list:
             bottom_half_appearance_dict_list = [
@@ -651,6 +913,8 @@ class PlateAppearance:
         self.inning_outs = inning_outs
         self.scoring_runners_list = scoring_runners_list
         self.runners_batted_in_list = runners_batted_in_list
+        self.start_game_state = None
+        self.end_game_state = None
         self.out_runners_list = self.get_out_runners_list(
             self.plate_appearance_description,
             self.batting_team,
@@ -777,16 +1041,8 @@ class PlateAppearance:
     @staticmethod
     def get_out_runners_list(plate_appearance_description, batting_team,
                              event_list, batter):
-        description = strip_suffixes(plate_appearance_description)
-        runner_name_list = findall(
-            (r'([A-Z][\w\'-]+\s+(?:[A-Z,a-z][\w\'-]+\s+)?'
-             r'(?:[A-Z,a-z][\w\'-]+\s+)?[A-Z][\w\'-]+)\s+'
-             r'(?:out at|(?:was )?picked off and caught stealing|'
-             r'(?:was )?caught stealing|(?:was )?picked off|'
-             r'(?:was )?doubled off)'
-             r' +(\w+)'),
-            description
-        )
+        description_parse = parse_description(plate_appearance_description)
+        runner_name_list = list(description_parse.runner_name_list)
 
         runner_in_list = False
         for event in event_list:
@@ -809,7 +1065,7 @@ class PlateAppearance:
         runner_tuple_list = []
         for name, base in runner_name_list:
             search_pattern = escape(name) + r' (?:was )?doubled off'
-            if findall(search_pattern, description):
+            if search(search_pattern, description_parse.description):
                 base = INCREMENT_BASE_DICT[base]
 
             runner_tuple_list.append(
@@ -819,26 +1075,9 @@ class PlateAppearance:
         return runner_tuple_list
 
     def get_throws_str(self):
-        description_str = strip_suffixes(self.plate_appearance_description)
-        suffix_str = ''
-
-        if '. ' in description_str:
-            description_str, suffix_str = description_str.split('. ', 1)
+        description_parse = parse_description(self.plate_appearance_description)
 
-        if ', deflected' in description_str:
-            description_str = description_str.split(', deflected')[0]
-
-        if ', assist' in description_str:
-            description_str = description_str.split(', assist')[0]
-
-        if ': ' in description_str:
-            description_str = description_str.split(': ')[1]
-
-        defense_code_order = self.get_defense_code_order(description_str)
-        defense_str = '-'.join(defense_code_order)
-        defense_suffix = self.get_defense_suffix(suffix_str)
-
-        return defense_str, defense_suffix
+        return description_parse.throws_str, description_parse.defense_suffix
 
     def get_hit_location(self):
         play_str = self.get_play_str()
@@ -852,14 +1091,8 @@ class PlateAppearance:
         return hit_location
 
     def get_play_str(self):
-        description_str = strip_suffixes(self.plate_appearance_description)
-        if '. ' in description_str:
-            description_str = description_str.split('. ')[0]
-
-        code = None
-        for keyword, this_code in PLAY_CODE_ORDERED_DICT.items():
-            if keyword in description_str.lower():
-                code = this_code
+        description_parse = parse_description(self.plate_appearance_description)
+        code = description_parse.play_code
 
         for keyword, this_code in [('Sac Fly', 'SF'), ('Sac Bunt', 'SH')]:
             if keyword in self.plate_appearance_summary:
@@ -867,39 +1100,19 @@ class PlateAppearance:
 
         if self.plate_appearance_summary == 'Fan interference':
             code = 'FI'
-        elif ' out to ' in description_str and code is None:
+        elif description_parse.is_fly_out and code is None:
             code = 'F'
         elif not code:
-            disqualified_description = (
-                'out at' in description_str or
-                'singles' in description_str or
-                'doubles' in description_str or
-                'triples' in description_str or
-                'hits a home run' in description_str or
-                'ejected' in description_str or
-                'remains in the game' in description_str or
-                ' replaces ' in description_str or
-                'mound visit' in description_str.lower() or
-                'delay' in description_str.lower()
-            )
-
-            if disqualified_description:
-                code = ''
-            else:
-                code = ''
+            code = ''
 
         return code
 
     def get_error_str(self):
-        error_str = None
-        if 'error' in self.plate_appearance_description:
-            description_str = self.plate_appearance_description
-            description_str = description_str.split(' error by ')[1]
-            defense_player = description_str.split()[0]
-            defense_code = str(POSITION_CODE_DICT[defense_player])
-            error_str = 'E' + defense_code
-        elif 'catcher interference' in self.plate_appearance_description:
-            error_str = 'E2'
+        error_str = parse_description(self.plate_appearance_description).error_str
+        if error_str is None and 'error' in self.plate_appearance_description:
+            raise ValueError('Invalid error description: {}'.format(
+                self.plate_appearance_description
+            ))
 
         return error_str
 
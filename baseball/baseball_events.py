@@ -1,5 +1,20 @@
+from collections import namedtuple
+
 AUTOMATIC_BALL_POSITION = (1.0, 1.0)
 
+PitchRecord = namedtuple('PitchRecord', ['game_id',
+                                         'inning_num',
+                                         'inning_half',
+                                         'pitcher_id',
+                                         'pitcher_name',
+                                         'batter_id',
+                                         'batter_name',
+                                         'pitch_datetime',
+                                         'pitch_description',
+                                         'pitch_type',
+                                         'pitch_speed',
+                                         'pitch_position'])
+
 
 class Substitution:
     def __init__(self, substitution_datetime, incoming_player, outgoing_player,
@@ -100,6 +115,7 @@ class Pitch:
         self.pitch_type = pitch_type
         self.pitch_speed = pitch_speed
         self.pitch_position = pitch_position
+        self.game_state = None
 
     def _asdict(self):
         return (
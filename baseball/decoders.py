@@ -0,0 +1,81 @@
+from json import loads as stdlib_json_loads
+from os import environ
+from xml.etree.ElementTree import (fromstring as stdlib_xml_fromstring,
+                                   iterparse as stdlib_xml_iterparse)
+
+try:
+    from lxml.etree import (XMLParser as LxmlXMLParser,
+                            fromstring as lxml_fromstring,
+                            iterparse as lxml_iterparse)
+except ImportError:
+    LxmlXMLParser = None
+
+try:
+    from orjson import loads as orjson_loads
+except ImportError:
+    orjson_loads = None
+
+XML_BACKEND_LIST = ['lxml', 'stdlib'] if LxmlXMLParser else ['stdlib']
+JSON_BACKEND_LIST = ['orjson', 'stdlib'] if orjson_loads else ['stdlib']
+
+DECODER_BACKEND_DICT = {
+    'xml': environ.get('BASEBALL_XML_BACKEND', XML_BACKEND_LIST[0]),
+    'json': environ.get('BASEBALL_JSON_BACKEND', JSON_BACKEND_LIST[0]),
+}
+
+def set_decoder_backends(xml_backend=None, json_backend=None):
+    if xml_backend:
+        if xml_backend not in XML_BACKEND_LIST:
+            raise ValueError('XML backend not available: {}'.format(
+                xml_backend
+            ))
+
+        DECODER_BACKEND_DICT['xml'] = xml_backend
+
+    if json_backend:
+        if json_backend not in JSON_BACKEND_LIST:
+            raise ValueError('JSON backend not available: {}'.format(
+                json_backend
+            ))
+
+        DECODER_BACKEND_DICT['json'] = json_backend
+
+    return dict(DECODER_BACKEND_DICT)
+
+def get_xml_backend():
+    if DECODER_BACKEND_DICT['xml'] in XML_BACKEND_LIST:
+        return DECODER_BACKEND_DICT['xml']
+
+    return 'stdlib'
+
+def get_json_backend():
+    if DECODER_BACKEND_DICT['json'] in JSON_BACKEND_LIST:
+        return DECODER_BACKEND_DICT['json']
+
+    return 'stdlib'
+
+def get_lxml_parser():
+    return LxmlXMLParser(encoding='utf-8', remove_comments=True,
+                         remove_pis=True, huge_tree=True)
+
+def xml_fromstring(xml_str):
+    if get_xml_backend() == 'lxml':
+        if isinstance(xml_str, str):
+            xml_str = xml_str.encode('utf-8')
+
+        return lxml_fromstring(xml_str, get_lxml_parser())
+
+    return stdlib_xml_fromstring(xml_str)
+
+def xml_iterparse(filehandle, events):
+    if get_xml_backend() == 'lxml':
+        return lxml_iterparse(filehandle, events=events, remove_comments=True,
+                              remove_pis=True, huge_tree=True)
+
+    return stdlib_xml_iterparse(filehandle, events=events)
+
+def json_loads(json_str):
+    if get_json_backend() == 'orjson':
+        return orjson_loads(json_str)
+
+    return stdlib_json_loads(json_str)
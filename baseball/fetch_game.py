@@ -1,22 +1,49 @@
+from collections import deque, namedtuple
 from datetime import timedelta, datetime
-from json import loads
-from multiprocessing import Pool
-from os import listdir, makedirs, mkdir
-from os.path import isdir, isfile, exists, abspath, join
+from itertools import islice
+from multiprocessing import Pool, cpu_count
+from os import makedirs, mkdir
+from os.path import exists, abspath, join
+from queue import Queue
 from sys import exc_info
+from time import perf_counter, sleep, time
 from traceback import format_exception
-from xml.etree.ElementTree import fromstring
 
 from dateutil.parser import parse
 from pytz import timezone
-from requests import get
 
 import baseball.process_game_json
+from baseball.archive_manifest import (get_day_game_list, get_filename_tuple,
+                                       get_manifest_filename_list,
+                                       get_manifest_path)
+from baseball.baseball import LAZY_GAME_STATS_DICT
+from baseball.decoders import (DECODER_BACKEND_DICT, JSON_BACKEND_LIST,
+                               XML_BACKEND_LIST, json_loads,
+                               set_decoder_backends, xml_fromstring)
+from baseball.game_cache import (GAME_CACHE_DIR_DICT, read_cached_game,
+                                  write_cached_game)
+from baseball.game_transport import get_compact_game, get_game_from_compact
+from baseball.archive_zip import (archive_file_exists, get_zip_day_game_list,
+                                  is_zip_path, open_archive_file,
+                                  read_archive_file)
+from baseball.fetch_http import (HTTP_CACHE_DIR_DICT,
+                                 NUM_NESTED_FETCH_THREADS,
+                                 game_dict_is_final, get_json,
+                                 get_json_list, get_text, get_text_list,
+                                 map_concurrent)
+from baseball.live_feed import (STATSAPI_URL_DICT, get_live_feed,
+                                get_live_feed_list, get_live_feed_url)
 from baseball.process_game_xml import (MLB_TEAM_CODE_DICT,
                                        MLB_REVERSE_TEAM_CODE_DICT)
+from baseball.schedule_index import (SCHEDULE_INDEX_PATH_DICT,
+                                     get_schedule_game_pk)
 
 EASTERN_TIMEZONE_STR = 'America/New_York'
-NUM_PROCESS_SUBLISTS = 3
+
+SCOREBOARD_POLL_SECONDS = 600
+LIVE_POLL_SECONDS = 10
+DELAYED_POLL_SECONDS = 60
+PREVIEW_POLL_SECONDS = 300
 BOXSCORE_SUFFIX = 'boxscore.xml'
 PLAYERS_SUFFIX = 'players.xml'
 INNING_SUFFIX = 'inning/inning_all.xml'
@@ -24,12 +51,22 @@ INNING_SUFFIX = 'inning/inning_all.xml'
 ALL_GAMES_URL = ('http://gdx.mlb.com/components/game/mlb/year_{year:04d}/'
                  'month_{month:02d}/day_{day:02d}/miniscoreboard.json')
 
-GAME_URL_TEMPLATE = 'http://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live'
-
 MLB_URL_PATTERN = ('http://gd2.mlb.com/components/game/mlb/year_{year}/'
                    'month_{month}/day_{day}/gid_{year}_{month}_{day}_'
                    '{away_mlb_code}mlb_{home_mlb_code}mlb_{game_number}/')
 
+WORKER_CONFIG_DICT_LIST = [GAME_CACHE_DIR_DICT, HTTP_CACHE_DIR_DICT,
+                           SCHEDULE_INDEX_PATH_DICT, STATSAPI_URL_DICT,
+                           DECODER_BACKEND_DICT, LAZY_GAME_STATS_DICT,
+                           baseball.process_game_json.BOX_SCORE_SOURCE_DICT]
+
+GameIndexSummary = namedtuple(
+    'GameIndexSummary',
+    ['game_date_str', 'is_today', 'is_doubleheader', 'is_suspended',
+     'is_postponed', 'start_datetime', 'expected_start_datetime',
+     'timezone_str', 'away_team_name', 'home_team_name']
+)
+
 HTML_INDEX_PAGE = (
     '<html>'
     '<head>'
@@ -363,6 +400,8 @@ def get_generated_html_id_list(game_id_list, today_date_str, output_dir,
 
     output_path = abspath(output_dir)
     game_html_id_tuple_list = []
+    url_tuple_list = []
+    mlb_code_tuple_list = []
 
     for game_id in game_id_list:
         away_mlb_code = game_id.split('_')[-3][:3]
@@ -375,10 +414,19 @@ def get_generated_html_id_list(game_id_list, today_date_str, output_dir,
         home_code = MLB_REVERSE_TEAM_CODE_DICT.get(home_mlb_code,
                                                    home_mlb_code.upper())
 
-        game_id, game = get_game_from_url(today_date_str,
-                                          away_code,
-                                          home_code,
-                                          game_num_str)
+        url_tuple_list.append((today_date_str, away_code, home_code,
+                               game_num_str))
+
+        mlb_code_tuple_list.append((away_mlb_code, home_mlb_code))
+
+    game_tuple_list = map_concurrent(get_game_from_url_tuple, url_tuple_list)
+
+    for url_tuple, mlb_code_tuple, game_tuple in zip(url_tuple_list,
+                                                     mlb_code_tuple_list,
+                                                     game_tuple_list):
+        _, away_code, home_code, game_num_str = url_tuple
+        away_mlb_code, home_mlb_code = mlb_code_tuple
+        game_id, game = game_tuple
 
         if game:
             write_game_svg_and_html(game_id, game, output_path,
@@ -437,9 +485,9 @@ def generate_game_svgs_for_old_datetime(this_datetime, output_dir,
     month = int(this_datetime.month)
     day = int(this_datetime.day)
     year = int(this_datetime.year)
-    all_games_dict = get(
+    all_games_dict = get_json(
         ALL_GAMES_URL.format(month=month, day=day, year=year)
-    ).json()
+    )
 
     if isinstance(all_games_dict['data']['games'].get('game', []), dict):
         all_games_dict['data']['games']['game'] = [
@@ -461,6 +509,13 @@ def generate_game_svgs_for_old_datetime(this_datetime, output_dir,
     write_game_index(object_html_str, this_datetime, output_dir,
                      write_date_html, write_index_html)
 
+def get_game_index_summary(game):
+    return GameIndexSummary(game.game_date_str, game.is_today,
+                            game.is_doubleheader, game.is_suspended,
+                            game.is_postponed, game.start_datetime,
+                            game.expected_start_datetime, game.timezone_str,
+                            game.away_team.name, game.home_team.name)
+
 def get_object_html_str(game_html_id_tuple_list):
     object_html_str = ''
     list_index = 0
@@ -478,8 +533,11 @@ def get_object_html_str(game_html_id_tuple_list):
             else game.expected_start_datetime
         )
 
-        title_str = '{} @ {}<br />'.format(game.away_team.name,
-                                           game.home_team.name)
+        if not isinstance(game, GameIndexSummary):
+            game = get_game_index_summary(game)
+
+        title_str = '{} @ {}<br />'.format(game.away_team_name,
+                                           game.home_team_name)
 
         if start_datetime:
             start_datetime = start_datetime.astimezone(
@@ -533,11 +591,12 @@ def get_object_html_str(game_html_id_tuple_list):
     return object_html_str
 
 def write_games_for_date(this_datetime, output_dir, write_game_html=False,
-                         write_date_html=False, write_index_html=False):
+                         write_date_html=False, write_index_html=False,
+                         use_live_feed=False):
     if this_datetime.year >= 2019:
         generate_game_svgs_for_new_datetime(this_datetime, output_dir,
                                             write_game_html, write_date_html,
-                                            write_index_html)
+                                            write_index_html, use_live_feed)
     else:
         generate_game_svgs_for_old_datetime(this_datetime, output_dir,
                                             write_game_html, write_date_html,
@@ -545,46 +604,28 @@ def write_games_for_date(this_datetime, output_dir, write_game_html=False,
 
 def generate_game_svgs_for_new_datetime(this_datetime, output_dir,
                                         write_game_html, write_date_html,
-                                        write_index_html):
+                                        write_index_html, use_live_feed=False):
     if not exists(output_dir):
         mkdir(output_dir)
 
-    month = this_datetime.month
-    day = this_datetime.day
-    year = this_datetime.year
-    all_games_dict = get(
-        ALL_GAMES_URL.format(month=month, day=day, year=year)
-    ).json()
-
-    if isinstance(all_games_dict['data']['games'].get('game', []), dict):
-        all_games_dict['data']['games']['game'] = [
-            all_games_dict['data']['games']['game']
-        ]
-
-    game_tuple_list = [(x['id'], x['game_pk'])
-                       for x in all_games_dict['data']['games'].get('game', [])]
-
-    game_dict_list = [get(GAME_URL_TEMPLATE.format(game_pk=game_pk)).json()
-                      for _, game_pk in game_tuple_list]
+    game_tuple_list = get_game_tuple_list(this_datetime)
+    if use_live_feed:
+        game_dict_list = get_live_feed_list(
+            [game_pk for _, game_pk in game_tuple_list]
+        )
+    else:
+        game_dict_list = get_json_list(
+            [get_live_feed_url(game_pk) for _, game_pk in game_tuple_list]
+        )
 
     game_html_id_tuple_list = []
     for i, game_dict in enumerate(game_dict_list):
         try:
-            is_doubleheader = game_is_doubleheader(i, game_dict, game_dict_list)
-            game = baseball.process_game_json.get_game_obj(game_dict,
-                                                           is_doubleheader)
-
-            set_game_status(game, this_datetime)
+            game = get_game_from_game_dict(i, game_dict, game_dict_list,
+                                           this_datetime)
 
             if len(game.game_date_str.split('-')) == 6:
                 game_html_id_tuple_list.append((game.game_date_str, game))
-            else:
-                game.game_date_str = '{:04d}-{:02d}-{:02d}-{}'.format(
-                    year, month, day, game.game_date_str
-                )
-
-                if len(game.game_date_str.split('-')) == 6:
-                    game_html_id_tuple_list.append((game.game_date_str, game))
 
             write_game_svg_and_html(game.game_date_str, game, output_dir,
                                     write_game_html)
@@ -601,6 +642,57 @@ def generate_game_svgs_for_new_datetime(this_datetime, output_dir,
     write_game_index(object_html_str, this_datetime, output_dir,
                      write_date_html, write_index_html)
 
+def get_game_tuple_list(this_datetime):
+    month = this_datetime.month
+    day = this_datetime.day
+    year = this_datetime.year
+    all_games_dict = get_json(
+        ALL_GAMES_URL.format(month=month, day=day, year=year)
+    )
+
+    if isinstance(all_games_dict['data']['games'].get('game', []), dict):
+        all_games_dict['data']['games']['game'] = [
+            all_games_dict['data']['games']['game']
+        ]
+
+    game_tuple_list = [(x['id'], x['game_pk'])
+                       for x in all_games_dict['data']['games'].get('game', [])]
+
+    return game_tuple_list
+
+def get_game_from_game_dict(i, game_dict, game_dict_list, this_datetime):
+    is_doubleheader = game_is_doubleheader(i, game_dict, game_dict_list)
+    game = baseball.process_game_json.get_game_obj(game_dict, is_doubleheader)
+
+    set_game_status(game, this_datetime)
+
+    if len(game.game_date_str.split('-')) != 6:
+        game.game_date_str = '{:04d}-{:02d}-{:02d}-{}'.format(
+            this_datetime.year, this_datetime.month, this_datetime.day,
+            game.game_date_str
+        )
+
+    return game
+
+def update_game_from_game_dict(game, i, game_dict, game_dict_list,
+                               this_datetime):
+    if (game and not game_dict_is_final(game_dict) and
+            game.is_doubleheader == game_is_doubleheader(i, game_dict,
+                                                         game_dict_list)):
+        try:
+            updated_game = baseball.process_game_json.update_game_obj(
+                game, game_dict
+            )
+        except:
+            updated_game = None
+
+        if updated_game:
+            set_game_status(updated_game, this_datetime)
+            return updated_game
+
+    return get_game_from_game_dict(i, game_dict, game_dict_list,
+                                   this_datetime)
+
 def game_is_doubleheader(i, game_dict, game_dict_list):
     is_doubleheader = False
     this_id = game_dict['gameData']['game']['id'].split('/')[-1]
@@ -672,45 +764,18 @@ def write_game_index(object_html_str, this_datetime, output_dir,
 
 def get_game_from_date(this_datetime, this_away_code, this_home_code,
                        this_game_number):
-    month = this_datetime.month
-    day = this_datetime.day
-    year = this_datetime.year
-    all_games_dict = get(
-        ALL_GAMES_URL.format(month=month, day=day, year=year)
-    ).json()
-
-    game_tuple_list = [
-        (x['id'], x['game_pk'])
-        for x in all_games_dict['data']['games'].get('game', [])
-    ]
-
-    game_dict_list = [get(GAME_URL_TEMPLATE.format(game_pk=game_pk)).json()
-                      for _, game_pk in game_tuple_list]
+    game_pk, is_doubleheader = get_schedule_game_pk(this_datetime,
+                                                    this_away_code,
+                                                    this_home_code,
+                                                    this_game_number)
 
     game = None
-    for i, game_dict in enumerate(game_dict_list):
-        away_code = (
-            game_dict.get('gameData', {}).get('teams', {}).get(
-                'away', {}).get('abbreviation', {})
-        )
-
-        home_code = (
-            game_dict.get('gameData', {}).get('teams', {}).get(
-                'home', {}).get('abbreviation', {})
-        )
-
-        game_number_is_match = (
-            this_game_number == game_dict.get('gameData', {}).get(
-                'game', {}).get('gameNumber', {})
-        )
-
-        if ((away_code and home_code) and (away_code == this_away_code) and
-                (home_code == this_home_code) and game_number_is_match):
-            is_doubleheader = game_is_doubleheader(i, game_dict, game_dict_list)
-            game = baseball.process_game_json.get_game_obj(game_dict,
-                                                           is_doubleheader)
+    if game_pk:
+        game_dict = get_json(get_live_feed_url(game_pk))
+        game = baseball.process_game_json.get_game_obj(game_dict,
+                                                       is_doubleheader)
 
-            set_game_status(game, this_datetime)
+        set_game_status(game, this_datetime)
 
     return game
 
@@ -745,14 +810,85 @@ def write_game_svg_and_html(game_id, game, output_path, write_html=False):
             with open(output_html_path, 'w') as filehandle:
                 filehandle.write(html_text)
 
+def load_game_from_files_new(live_json_file):
+    this_game = None
+    if archive_file_exists(live_json_file):
+        game_dict = json_loads(read_archive_file(live_json_file))
+        this_game = baseball.process_game_json.get_game_obj(game_dict)
+
+    return this_game
+
+def load_game_from_files_old(boxscore_file, player_file, inning_file):
+    this_game = None
+    if (archive_file_exists(boxscore_file) and
+            archive_file_exists(player_file) and
+            archive_file_exists(inning_file)):
+        boxscore_xml = xml_fromstring(read_archive_file(boxscore_file))
+        player_xml = xml_fromstring(read_archive_file(player_file))
+        with open_archive_file(inning_file) as inning_filehandle:
+            this_game = baseball.process_game_xml.get_game_obj(
+                boxscore_xml,
+                player_xml,
+                baseball.process_game_xml.get_inning_xml_generator(
+                    inning_filehandle
+                )
+            )
+
+    return this_game
+
+def load_game_from_filename_tuple(filename_tuple):
+    game_id, boxscore_file, player_file, inning_file, live_file = filename_tuple
+    if int(game_id.split('-', 1)[0]) < 2019:
+        game = load_game_from_files_old(boxscore_file, player_file,
+                                        inning_file)
+    else:
+        game = load_game_from_files_new(live_file)
+
+    return game
+
+def benchmark_decoder_backends(filename_list, num_repeats=3):
+    backend_time_dict = {}
+    game_json_dict = {}
+    previous_backend_dict = dict(DECODER_BACKEND_DICT)
+    try:
+        for xml_backend in XML_BACKEND_LIST:
+            for json_backend in JSON_BACKEND_LIST:
+                set_decoder_backends(xml_backend, json_backend)
+                start_time = perf_counter()
+                for _ in range(num_repeats):
+                    game_list = [load_game_from_filename_tuple(filename_tuple)
+                                 for filename_tuple in filename_list]
+
+                backend_time_dict[(xml_backend, json_backend)] = (
+                    (perf_counter() - start_time) / num_repeats
+                )
+
+                game_json_dict[(xml_backend, json_backend)] = [
+                    game.json() if game else None for game in game_list
+                ]
+    finally:
+        DECODER_BACKEND_DICT.update(previous_backend_dict)
+
+    mismatch_dict = {
+        backend_tuple: [
+            filename_tuple[0]
+            for filename_tuple, game_json, reference_json in zip(
+                filename_list,
+                game_json_list,
+                game_json_dict[('stdlib', 'stdlib')]
+            )
+            if game_json != reference_json
+        ]
+        for backend_tuple, game_json_list in game_json_dict.items()
+    }
+
+    return backend_time_dict, mismatch_dict
+
 def get_game_from_files_new(live_json_file):
     this_game = None
 
     try:
-        if isfile(live_json_file):
-            live_raw = open(live_json_file, 'r', encoding='utf-8').read()
-            game_dict = loads(live_raw)
-            this_game = baseball.process_game_json.get_game_obj(game_dict)
+        this_game = load_game_from_files_new(live_json_file)
     except:
         exc_type, exc_value, exc_traceback = exc_info()
         lines = format_exception(exc_type, exc_value, exc_traceback)
@@ -767,17 +903,8 @@ def get_game_from_files_old(boxscore_file, player_file, inning_file):
     this_game = None
 
     try:
-        if (isfile(boxscore_file) and isfile(player_file) and
-                isfile(inning_file)):
-            boxscore_raw = open(boxscore_file, 'r', encoding='utf-8').read()
-            boxscore_xml = fromstring(boxscore_raw)
-            player_raw = open(player_file, 'r', encoding='utf-8').read()
-            player_xml = fromstring(player_raw)
-            inning_raw = open(inning_file, 'r', encoding='utf-8').read()
-            inning_xml = fromstring(inning_raw)
-            this_game = baseball.process_game_xml.get_game_obj(boxscore_xml,
-                                                               player_xml,
-                                                               inning_xml)
+        this_game = load_game_from_files_old(boxscore_file, player_file,
+                                             inning_file)
     except:
         exc_type, exc_value, exc_traceback = exc_info()
         lines = format_exception(exc_type, exc_value, exc_traceback)
@@ -792,27 +919,111 @@ def get_game_from_files_old(boxscore_file, player_file, inning_file):
 
 def get_game_from_filename_tuple(filename_tuple):
     game_id, boxscore_file, player_file, inning_file, live_file = filename_tuple
+    game = read_cached_game(filename_tuple)
+    if game:
+        return game_id, game
+
     year = int(game_id.split('-', 1)[0])
     if year < 2019:
         game = get_game_from_files_old(boxscore_file, player_file, inning_file)
     else:
         game = get_game_from_files_new(live_file)
 
+    write_cached_game(filename_tuple, game)
+
     return game_id, game
 
+def get_game_result_from_filename_tuple(filename_tuple):
+    game_id, boxscore_file, player_file, inning_file, live_file = filename_tuple
+    game = read_cached_game(filename_tuple)
+    exception_str = None
+    if not game:
+        try:
+            game = load_game_from_filename_tuple(filename_tuple)
+            write_cached_game(filename_tuple, game)
+        except:
+            exc_type, exc_value, exc_traceback = exc_info()
+            lines = format_exception(exc_type, exc_value, exc_traceback)
+            exception_str = ' '.join(lines)
+
+    return game_id, game, exception_str
+
+def get_compact_game_result_from_filename_tuple(filename_tuple):
+    game_id, game, exception_str = get_game_result_from_filename_tuple(
+        filename_tuple
+    )
+
+    return (game_id, get_compact_game(game) if game else None,
+            exception_str)
+
+def get_game_result_from_compact_result(compact_game_result):
+    game_id, compact_game, exception_str = compact_game_result
+
+    return (game_id,
+            get_game_from_compact(compact_game) if compact_game else None,
+            exception_str)
+
+def load_pitch_records_from_filename_tuple(filename_tuple):
+    game_id, _, player_file, inning_file, live_file = filename_tuple
+    pitch_record_list = []
+    if int(game_id.split('-', 1)[0]) < 2019:
+        if (archive_file_exists(player_file) and
+                archive_file_exists(inning_file)):
+            player_xml = xml_fromstring(read_archive_file(player_file))
+            with open_archive_file(inning_file) as inning_filehandle:
+                pitch_record_list = list(
+                    baseball.process_game_xml.get_pitch_record_generator(
+                        game_id,
+                        player_xml,
+                        baseball.process_game_xml.get_inning_xml_generator(
+                            inning_filehandle
+                        )
+                    )
+                )
+    elif archive_file_exists(live_file):
+        pitch_record_list = list(
+            baseball.process_game_json.get_pitch_record_generator(
+                game_id,
+                json_loads(read_archive_file(live_file))
+            )
+        )
+
+    return pitch_record_list
+
+def get_pitch_result_from_filename_tuple(filename_tuple):
+    pitch_record_list = []
+    exception_str = None
+    try:
+        pitch_record_list = load_pitch_records_from_filename_tuple(
+            filename_tuple
+        )
+    except:
+        exc_type, exc_value, exc_traceback = exc_info()
+        lines = format_exception(exc_type, exc_value, exc_traceback)
+        exception_str = ' '.join(lines)
+
+    return filename_tuple[0], pitch_record_list, exception_str
+
+def get_chunksize(num_items, num_processes):
+    return max(1, num_items // (num_processes * 4))
+
+def get_worker_config():
+    return [dict(config_dict) for config_dict in WORKER_CONFIG_DICT_LIST]
+
+def set_worker_config(config_list):
+    for config_dict, config in zip(WORKER_CONFIG_DICT_LIST, config_list):
+        config_dict.update(config)
+
+def get_process_pool(num_processes):
+    return Pool(num_processes, initializer=set_worker_config,
+                initargs=(get_worker_config(),))
+
 def get_game_generator(filename_list):
     for filename_tuple in filename_list:
         game_id, this_game = get_game_from_filename_tuple(filename_tuple)
         if this_game:
             yield game_id, this_game
 
-def write_game_svg_html_from_filename_tuple(filename_output_path_tuple,
-                                            write_game_html=False):
-    filename_tuple, output_path = filename_output_path_tuple
-    game_id, game = get_game_from_filename_tuple(filename_tuple)
-    if game:
-        write_game_svg_and_html(game_id, game, output_path, write_game_html)
-
 def get_game_from_xml_strings(boxscore_raw_xml, players_raw_xml,
                               inning_raw_xml):
     this_game = None
@@ -820,123 +1031,311 @@ def get_game_from_xml_strings(boxscore_raw_xml, players_raw_xml,
             boxscore_raw_xml != '{"message": "Internal server error"}' and
             players_raw_xml != '{"message": "Internal server error"}' and
             inning_raw_xml != '{"message": "Internal server error"}'):
-        boxscore_xml_obj = fromstring(boxscore_raw_xml)
-        players_xml_obj = fromstring(players_raw_xml)
-        inning_xml_obj = fromstring(inning_raw_xml)
+        boxscore_xml_obj = xml_fromstring(boxscore_raw_xml)
+        players_xml_obj = xml_fromstring(players_raw_xml)
+        inning_xml_obj = xml_fromstring(inning_raw_xml)
         this_game = baseball.process_game_xml.get_game_obj(boxscore_xml_obj,
                                                            players_xml_obj,
                                                            inning_xml_obj)
 
     return this_game
 
+def write_game_from_filename_tuple(filename_output_path_tuple):
+    filename_tuple, output_path, write_game_html = filename_output_path_tuple
+    game_id, game = get_game_from_filename_tuple(filename_tuple)
+    game_summary = None
+    if game:
+        write_game_svg_and_html(game_id, game, output_path, write_game_html)
+        game_summary = get_game_index_summary(game)
+
+    return game_id, game_summary
+
 def write_svg_from_file_range(start_date_str, end_date_str, input_dir,
                               output_dir, write_game_html=False,
-                              write_date_html=False):
+                              write_date_html=False, num_processes=None,
+                              chunksize=None):
     if not exists(output_dir):
         makedirs(output_dir)
 
     output_path = abspath(output_dir)
     filename_output_path_tuple_list = [
-        (filename_tuple, output_path)
+        (filename_tuple, output_path, write_game_html)
         for filename_tuple in get_filename_list(start_date_str,
                                                 end_date_str,
                                                 input_dir)
     ]
 
+    num_processes = num_processes or cpu_count()
+    if num_processes > 1 and len(filename_output_path_tuple_list) > 1:
+        chunksize = chunksize or get_chunksize(
+            len(filename_output_path_tuple_list),
+            num_processes
+        )
+
+        with get_process_pool(
+                min(num_processes, len(filename_output_path_tuple_list))
+        ) as process_pool:
+            game_html_id_tuple_list = process_pool.map(
+                write_game_from_filename_tuple,
+                filename_output_path_tuple_list,
+                chunksize
+            )
+    else:
+        game_html_id_tuple_list = [
+            write_game_from_filename_tuple(filename_output_path_tuple)
+            for filename_output_path_tuple in filename_output_path_tuple_list
+        ]
+
+    date_game_html_id_dict = {}
+    for game_id, game_summary in game_html_id_tuple_list:
+        date_game_html_id_dict.setdefault(game_id[:10], []).append(
+            (game_id, game_summary)
+        )
+
     start_datetime = parse(start_date_str)
     end_datetime = parse(end_date_str)
     day_interval = timedelta(days=1)
     this_datetime = start_datetime
     while this_datetime <= end_datetime:
-        game_html_id_tuple_list = []
-        for tup in filename_output_path_tuple_list:
-            filename_tuple, _ = tup
-            game_id = filename_tuple[0]
-            year_str, month_str, day_str, _, _, _ = game_id.split('-')
-
-            if (int(year_str) == this_datetime.year and
-                    int(month_str) == this_datetime.month and
-                    int(day_str) == this_datetime.day):
-                write_game_svg_html_from_filename_tuple(tup, write_game_html)
-                game_html_id_tuple_list.append(
-                    get_game_from_filename_tuple(filename_tuple)
-                )
+        date_str = '{:04d}-{:02d}-{:02d}'.format(this_datetime.year,
+                                                 this_datetime.month,
+                                                 this_datetime.day)
+
+        object_html_str = get_object_html_str(
+            date_game_html_id_dict.get(date_str, [])
+        )
 
-        object_html_str = get_object_html_str(game_html_id_tuple_list)
         write_game_index(object_html_str, this_datetime, output_dir,
                          write_date_html, False)
 
-        game_html_id_tuple_list = []
         this_datetime += day_interval
 
-def get_filename_list(start_date_str, end_date_str, input_dir):
-    filename_list = []
-    input_path = abspath(input_dir)
-    start_date = parse(start_date_str)
-    end_date = parse(end_date_str)
-    day_delta = timedelta(days=1)
-    this_date = start_date
-    while this_date < end_date + day_delta:
-        year = str(this_date.year)
-        month = str(this_date.month).zfill(2)
-        day = str(this_date.day).zfill(2)
-        filename = '{}/{}/month_{}/day_{}/'.format(input_path, year, month, day)
-        if isdir(filename):
-            file_list = listdir(filename)
-            if file_list:
-                for subfile in file_list:
-                    if subfile.startswith('gid_'):
-                        away_code, home_code, game_num = subfile.split('_')[-3:]
-                        away_code = away_code[:-3]
-                        home_code = home_code[:-3]
-                        away_team, home_team = None, None
-                        away_team = MLB_REVERSE_TEAM_CODE_DICT.get(
-                            away_code, away_code.upper()
-                        )
-                        home_team = MLB_REVERSE_TEAM_CODE_DICT.get(
-                            home_code, home_code.upper()
-                        )
-                        if away_team and home_team:
-                            output_name = '-'.join([year, month, day, away_team,
-                                                    home_team, game_num])
+def get_filter_date_str(date_str):
+    this_date = parse(date_str)
+
+    return '{:04d}-{:02d}-{:02d}'.format(this_date.year, this_date.month,
+                                         this_date.day)
+
+def filename_tuple_is_match(filename_tuple, team=None, opponent=None,
+                            game_number=None, date_set=None):
+    game_id = filename_tuple[0]
+    year, month, day, away_team, home_team, game_num = game_id.split('-')
+    if date_set is not None and '-'.join([year, month, day]) not in date_set:
+        return False
 
-                            subfolder_name = filename + subfile + '/'
-                            if listdir(subfolder_name):
-                                player_filename = subfolder_name + 'players.xml'
-                                boxscore_filename = (subfolder_name +
-                                                     'boxscore.xml')
+    if game_number is not None and int(game_num) != int(game_number):
+        return False
 
-                                inning_filename = (subfolder_name +
-                                                   'inning/inning_all.xml')
+    team_list = [away_team.upper(), home_team.upper()]
+    if team and team.upper() not in team_list:
+        return False
 
-                                live_filename = (subfolder_name + 'live')
+    if opponent:
+        if opponent.upper() not in team_list:
+            return False
 
-                                filename_list.append((output_name,
-                                                      boxscore_filename,
-                                                      player_filename,
-                                                      inning_filename,
-                                                      live_filename))
+        if team and team.upper() == opponent.upper():
+            return False
 
-        this_date += day_delta
+    return True
+
+def get_filename_list(start_date_str, end_date_str, input_dir, team=None,
+                      opponent=None, game_number=None, date_list=None):
+    date_set = None
+    if date_list is not None:
+        date_set = set(get_filter_date_str(date_str) for date_str in date_list)
+        if not date_set:
+            return []
+
+        start_date_str = start_date_str or min(date_set)
+        end_date_str = end_date_str or max(date_set)
+
+    if exists(get_manifest_path(input_dir)):
+        filename_list = get_manifest_filename_list(start_date_str,
+                                                   end_date_str, input_dir)
+    else:
+        if is_zip_path(input_dir):
+            day_game_list_function = get_zip_day_game_list
+        else:
+            day_game_list_function = get_day_game_list
+
+        filename_list = []
+        input_path = abspath(input_dir)
+        start_date = parse(start_date_str)
+        end_date = parse(end_date_str)
+        day_delta = timedelta(days=1)
+        this_date = start_date
+        while this_date < end_date + day_delta:
+            year = str(this_date.year)
+            month = str(this_date.month).zfill(2)
+            day = str(this_date.day).zfill(2)
+            if date_set is None or '-'.join([year, month, day]) in date_set:
+                filename_list.extend(
+                    get_filename_tuple(input_path, game_dict)
+                    for game_dict in day_game_list_function(input_path, year,
+                                                            month, day)
+                )
+
+            this_date += day_delta
+
+    if team or opponent or game_number is not None or date_set is not None:
+        filename_list = [
+            filename_tuple for filename_tuple in filename_list
+            if filename_tuple_is_match(filename_tuple, team, opponent,
+                                       game_number, date_set)
+        ]
 
     return filename_list
 
 def get_game_list_from_file_range(start_date_str, end_date_str, input_dir,
-                                    ):
-    filename_list = get_filename_list(start_date_str, end_date_str, input_dir)
-    process_pool = Pool(NUM_PROCESS_SUBLISTS)
-    #game_tuple_list = process_pool.map(get_game_from_filename_tuple,
-    #                                   filename_list)
-    game_tuple_list = [get_game_from_filename_tuple(filename_tuple)
-                       for filename_tuple in filename_list]
+                                  num_processes=None, chunksize=None,
+                                  return_errors=False, team=None,
+                                  opponent=None, game_number=None,
+                                  date_list=None):
+    filename_list = get_filename_list(start_date_str, end_date_str, input_dir,
+                                      team, opponent, game_number, date_list)
+    num_processes = num_processes or cpu_count()
+    if num_processes > 1 and len(filename_list) > 1:
+        chunksize = chunksize or get_chunksize(len(filename_list),
+                                               num_processes)
+
+        with get_process_pool(
+                min(num_processes, len(filename_list))
+        ) as process_pool:
+            game_result_list = [
+                get_game_result_from_compact_result(compact_game_result)
+                for compact_game_result in process_pool.map(
+                    get_compact_game_result_from_filename_tuple,
+                    filename_list,
+                    chunksize
+                )
+            ]
+    else:
+        game_result_list = [get_game_result_from_filename_tuple(filename_tuple)
+                            for filename_tuple in filename_list]
+
+    game_tuple_list = [(game_id, game)
+                       for game_id, game, _ in game_result_list]
+
+    error_tuple_list = [(game_id, exception_str)
+                        for game_id, _, exception_str in game_result_list
+                        if exception_str]
+
+    if return_errors:
+        return game_tuple_list, error_tuple_list
+
+    for game_id, exception_str in error_tuple_list:
+        print('{} ({}) {}'.format(datetime.utcnow(), game_id, exception_str))
 
     return game_tuple_list
 
-def get_game_generator_from_file_range(start_date_str, end_date_str, input_dir):
-    filename_list = get_filename_list(start_date_str, end_date_str, input_dir)
+def get_game_generator_from_file_range(start_date_str, end_date_str, input_dir,
+                                       team=None, opponent=None,
+                                       game_number=None, date_list=None):
+    filename_list = get_filename_list(start_date_str, end_date_str, input_dir,
+                                      team, opponent, game_number, date_list)
 
     return get_game_generator(filename_list)
 
+def apply_game_result_async(process_pool, filename_tuple, result_queue,
+                            ordered):
+    if ordered:
+        return process_pool.apply_async(
+            get_compact_game_result_from_filename_tuple,
+            (filename_tuple,)
+        )
+
+    return process_pool.apply_async(
+        get_compact_game_result_from_filename_tuple,
+        (filename_tuple,),
+        callback=result_queue.put,
+        error_callback=result_queue.put
+    )
+
+def get_game_result_generator(process_pool, filename_list, window_size,
+                              ordered=True):
+    filename_iter = iter(filename_list)
+    result_deque = deque()
+    result_queue = Queue()
+    for filename_tuple in islice(filename_iter, window_size):
+        result_deque.append(apply_game_result_async(process_pool,
+                                                    filename_tuple,
+                                                    result_queue, ordered))
+
+    while result_deque:
+        if ordered:
+            game_result = result_deque.popleft().get()
+        else:
+            result_deque.popleft()
+            game_result = result_queue.get()
+            if isinstance(game_result, Exception):
+                raise game_result
+
+        for filename_tuple in islice(filename_iter, 1):
+            result_deque.append(apply_game_result_async(process_pool,
+                                                        filename_tuple,
+                                                        result_queue,
+                                                        ordered))
+
+        yield get_game_result_from_compact_result(game_result)
+
+def get_parallel_game_generator_from_file_range(start_date_str, end_date_str,
+                                                input_dir, num_processes=None,
+                                                window_size=None,
+                                                ordered=True, team=None,
+                                                opponent=None,
+                                                game_number=None,
+                                                date_list=None):
+    filename_list = get_filename_list(start_date_str, end_date_str, input_dir,
+                                      team, opponent, game_number, date_list)
+    num_processes = num_processes or cpu_count()
+    window_size = window_size or num_processes * 2
+    with get_process_pool(num_processes) as process_pool:
+        for game_id, game, exception_str in get_game_result_generator(
+                process_pool, filename_list, window_size, ordered):
+            if exception_str:
+                print('{} ({}) {}'.format(datetime.utcnow(), game_id,
+                                          exception_str))
+            elif game:
+                yield game_id, game
+
+def get_pitch_generator_from_file_range(start_date_str, end_date_str,
+                                        input_dir, num_processes=None,
+                                        chunksize=None, team=None,
+                                        opponent=None, game_number=None,
+                                        date_list=None):
+    filename_list = get_filename_list(start_date_str, end_date_str, input_dir,
+                                      team, opponent, game_number, date_list)
+    num_processes = num_processes or cpu_count()
+    if num_processes > 1 and len(filename_list) > 1:
+        chunksize = chunksize or get_chunksize(len(filename_list),
+                                               num_processes)
+
+        with get_process_pool(
+                min(num_processes, len(filename_list))
+        ) as process_pool:
+            for game_id, pitch_record_list, exception_str in process_pool.imap(
+                    get_pitch_result_from_filename_tuple, filename_list,
+                    chunksize):
+                if exception_str:
+                    print('{} ({}) {}'.format(datetime.utcnow(), game_id,
+                                              exception_str))
+
+                yield from pitch_record_list
+    else:
+        for filename_tuple in filename_list:
+            (game_id,
+             pitch_record_list,
+             exception_str) = get_pitch_result_from_filename_tuple(
+                 filename_tuple
+             )
+
+            if exception_str:
+                print('{} ({}) {}'.format(datetime.utcnow(), game_id,
+                                          exception_str))
+
+            yield from pitch_record_list
+
 def write_svg_from_url(date_str, away_code, home_code, game_number, output_dir):
     if not exists(output_dir):
         makedirs(output_dir)
@@ -950,49 +1349,17 @@ def write_svg_from_url(date_str, away_code, home_code, game_number, output_dir):
 def get_game_dict_from_url(date_str, away_code, home_code, game_number):
     formatted_date_str = get_formatted_date_str(date_str)
     this_datetime = parse(formatted_date_str)
-    month = this_datetime.month
-    day = this_datetime.day
-    year = this_datetime.year
-
-    all_games_dict = get(
-        ALL_GAMES_URL.format(month=month, day=day, year=year)
-    ).json()
-
-    game_tuple_list = [(x['id'], x['game_pk'])
-                       for x in all_games_dict['data']['games'].get('game', [])]
-
-    game_dict_list = [get(GAME_URL_TEMPLATE.format(game_pk=game_pk)).json()
-                      for _, game_pk in game_tuple_list]
+    game_pk, _ = get_schedule_game_pk(this_datetime, away_code, home_code,
+                                      game_number)
 
     return_dict = {}
     game_id = None
-    for game_dict in game_dict_list:
-        this_away_code = (
-            game_dict.get('gameData', {}).get('teams', {}).get(
-                'away', {}).get('abbreviation', {})
-        )
-
-        this_home_code = (
-            game_dict.get('gameData', {}).get('teams', {}).get(
-                'home', {}).get('abbreviation', {})
+    if game_pk:
+        game_id = '-'.join(
+            [formatted_date_str, away_code, home_code, str(game_number)]
         )
 
-        game_number_is_match = (
-            game_number == game_dict.get('gameData', {}).get(
-                'game', {}).get('gameNumber', {})
-        )
-
-        if ((this_away_code and this_home_code) and
-                (away_code == this_away_code) and
-                (home_code == this_home_code) and
-                game_number_is_match):
-
-            game_id = '-'.join(
-                [formatted_date_str, away_code, home_code, str(game_number)]
-            )
-
-            return_dict = game_dict
-            break
+        return_dict = get_json(get_live_feed_url(game_pk))
 
     return game_id, return_dict
 
@@ -1013,13 +1380,16 @@ def get_game_xml_from_url(date_str, away_code, home_code, game_number):
         game_number=game_number
     )
 
-    boxscore_request_text = get(request_url_base + BOXSCORE_SUFFIX).text
+    boxscore_request_text = get_text(request_url_base + BOXSCORE_SUFFIX)
     if boxscore_request_text == 'GameDay - 404 Not Found':
         boxscore_raw_xml, players_raw_xml, inning_raw_xml = None, None, None
     else:
         boxscore_raw_xml = boxscore_request_text
-        players_raw_xml = get(request_url_base + PLAYERS_SUFFIX).text
-        inning_raw_xml = get(request_url_base + INNING_SUFFIX).text
+        players_raw_xml, inning_raw_xml = get_text_list(
+            [request_url_base + PLAYERS_SUFFIX,
+             request_url_base + INNING_SUFFIX],
+            NUM_NESTED_FETCH_THREADS
+        )
 
     return game_id, boxscore_raw_xml, players_raw_xml, inning_raw_xml
 
@@ -1088,17 +1458,28 @@ def get_game_from_url(date_str, away_code, home_code, game_number):
 
     return game_id, this_game
 
-def generate_today_game_svgs(output_dir, write_game_html=False,
-                             write_date_html=False, write_index_html=False):
+def get_game_from_url_tuple(url_tuple):
+    date_str, away_code, home_code, game_number = url_tuple
+
+    return get_game_from_url(date_str, away_code, home_code, game_number)
+
+def get_today_datetime():
     time_shift = timedelta(hours=7)
     today_datetime = datetime.utcnow() - time_shift
+
+    return today_datetime.astimezone(timezone('America/New_York'))
+
+def generate_today_game_svgs(output_dir, write_game_html=False,
+                             write_date_html=False, write_index_html=False):
+    today_datetime = get_today_datetime()
     try:
         write_games_for_date(
-            today_datetime.astimezone(timezone('America/New_York')),
+            today_datetime,
             output_dir,
             write_game_html,
             write_date_html,
-            write_index_html
+            write_index_html,
+            use_live_feed=True
         )
     except:
         exc_type, exc_value, exc_traceback = exc_info()
@@ -1107,3 +1488,193 @@ def generate_today_game_svgs(output_dir, write_game_html=False,
         print('{} ({}) {}'.format(datetime.utcnow(),
                                   str(today_datetime),
                                   exception_str))
+
+def get_feed_signature(game_dict):
+    live_data_dict = game_dict.get('liveData', {})
+    play_list = live_data_dict.get('plays', {}).get('allPlays', [])
+    current_play_dict = live_data_dict.get('plays', {}).get('currentPlay', {})
+
+    return (
+        game_dict.get('metaData', {}).get('timeStamp'),
+        len(play_list),
+        len(current_play_dict.get('playEvents', [])),
+        game_dict.get('gameData', {}).get('status', {}).get('statusCode'),
+    )
+
+def get_poll_seconds(game_dict, now_time):
+    status_dict = game_dict.get('gameData', {}).get('status', {})
+    abstract_state = status_dict.get('abstractGameState')
+    if abstract_state == 'Final':
+        return None
+
+    if 'Delayed' in status_dict.get('detailedState', ''):
+        return DELAYED_POLL_SECONDS
+
+    if abstract_state == 'Live':
+        return LIVE_POLL_SECONDS
+
+    start_time_str = game_dict.get('gameData', {}).get('datetime', {}).get(
+        'dateTime'
+    )
+
+    if start_time_str:
+        seconds_to_start = parse(start_time_str).timestamp() - now_time
+        return max(LIVE_POLL_SECONDS,
+                   min(PREVIEW_POLL_SECONDS, seconds_to_start))
+
+    return PREVIEW_POLL_SECONDS
+
+def get_live_feed_result(game_pk):
+    game_dict = None
+    exception_str = None
+    try:
+        game_dict = get_live_feed(game_pk)
+    except:
+        exc_type, exc_value, exc_traceback = exc_info()
+        lines = format_exception(exc_type, exc_value, exc_traceback)
+        exception_str = ' '.join(lines)
+
+    return game_pk, game_dict, exception_str
+
+def get_fetch_error_poll_seconds(num_fetch_errors):
+    return min(PREVIEW_POLL_SECONDS,
+               LIVE_POLL_SECONDS * 2 ** (num_fetch_errors - 1))
+
+def update_live_games(game_state_dict, game_pk_list, this_datetime,
+                      output_dir, write_game_html):
+    now_time = time()
+    due_game_pk_list = [
+        game_pk for game_pk in game_pk_list
+        if game_state_dict[game_pk]['next_poll_time'] is not None and
+        game_state_dict[game_pk]['next_poll_time'] <= now_time
+    ]
+
+    fetched_game_pk_list = []
+    for game_pk, game_dict, exception_str in map_concurrent(
+            get_live_feed_result, due_game_pk_list):
+        game_state = game_state_dict[game_pk]
+        if exception_str:
+            print('{} ({}) {}'.format(datetime.utcnow(), game_pk,
+                                      exception_str))
+
+            game_state['num_fetch_errors'] += 1
+            game_state['next_poll_time'] = (
+                now_time +
+                get_fetch_error_poll_seconds(game_state['num_fetch_errors'])
+            )
+        else:
+            game_state['game_dict'] = game_dict
+            game_state['num_fetch_errors'] = 0
+            fetched_game_pk_list.append(game_pk)
+
+    game_dict_list = [game_state_dict[game_pk]['game_dict']
+                      for game_pk in game_pk_list]
+
+    num_rendered = 0
+    for game_pk in fetched_game_pk_list:
+        game_state = game_state_dict[game_pk]
+        game_dict = game_state['game_dict']
+        game_state['next_poll_time'] = None
+        try:
+            poll_seconds = get_poll_seconds(game_dict, now_time)
+            if poll_seconds is not None:
+                game_state['next_poll_time'] = now_time + poll_seconds
+
+            signature = get_feed_signature(game_dict)
+            if signature == game_state['signature']:
+                continue
+
+            game = update_game_from_game_dict(game_state['game'],
+                                              game_pk_list.index(game_pk),
+                                              game_dict, game_dict_list,
+                                              this_datetime)
+
+            game_state['game'] = game
+            write_game_svg_and_html(game.game_date_str, game, output_dir,
+                                    write_game_html)
+
+            game_state['signature'] = signature
+            num_rendered += 1
+        except:
+            exc_type, exc_value, exc_traceback = exc_info()
+            lines = format_exception(exc_type, exc_value, exc_traceback)
+            exception_str = ' '.join(lines)
+            print('{} {} {}'.format(datetime.utcnow(), game_pk,
+                                    exception_str))
+
+            if game_state['next_poll_time'] is None:
+                game_state['next_poll_time'] = now_time + PREVIEW_POLL_SECONDS
+
+    return num_rendered
+
+def run_live_scoreboard(output_dir, write_game_html=False,
+                        write_date_html=False, write_index_html=False,
+                        max_iterations=None):
+    if not exists(output_dir):
+        mkdir(output_dir)
+
+    game_state_dict = {}
+    game_pk_list = []
+    date_str = None
+    next_scoreboard_time = 0
+    num_iterations = 0
+    while max_iterations is None or num_iterations < max_iterations:
+        num_iterations += 1
+        today_datetime = get_today_datetime()
+        try:
+            if get_today_date_str(today_datetime) != date_str:
+                date_str = get_today_date_str(today_datetime)
+                game_state_dict = {}
+                next_scoreboard_time = 0
+
+            if next_scoreboard_time <= time():
+                game_pk_list = [
+                    game_pk for _, game_pk in get_game_tuple_list(today_datetime)
+                ]
+
+                for game_pk in game_pk_list:
+                    game_state_dict.setdefault(game_pk,
+                                               {'next_poll_time': 0,
+                                                'signature': None,
+                                                'game_dict': {},
+                                                'game': None,
+                                                'num_fetch_errors': 0})
+
+                next_scoreboard_time = time() + SCOREBOARD_POLL_SECONDS
+
+            num_rendered = update_live_games(game_state_dict, game_pk_list,
+                                             today_datetime, output_dir,
+                                             write_game_html)
+
+            if num_rendered:
+                game_html_id_tuple_list = [
+                    (game_state_dict[game_pk]['game'].game_date_str,
+                     game_state_dict[game_pk]['game'])
+                    for game_pk in game_pk_list
+                    if game_state_dict[game_pk]['game'] and
+                    len(game_state_dict[game_pk][
+                        'game'].game_date_str.split('-')) == 6
+                ]
+
+                write_game_index(get_object_html_str(game_html_id_tuple_list),
+                                 today_datetime, output_dir, write_date_html,
+                                 write_index_html)
+        except:
+            exc_type, exc_value, exc_traceback = exc_info()
+            lines = format_exception(exc_type, exc_value, exc_traceback)
+            exception_str = ' '.join(lines)
+            print('{} ({}) {}'.format(datetime.utcnow(),
+                                      str(today_datetime),
+                                      exception_str))
+
+        if max_iterations is not None and num_iterations >= max_iterations:
+            break
+
+        next_poll_time_list = [
+            game_state['next_poll_time']
+            for game_state in game_state_dict.values()
+            if game_state['next_poll_time'] is not None
+        ]
+
+        sleep(max(1, min(next_poll_time_list + [next_scoreboard_time]) -
+                  time()))
@@ -0,0 +1,183 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import sha1
+from json import dumps, loads
+from os import environ, getpid, makedirs, replace
+from os.path import abspath, dirname, exists, join
+from threading import Lock
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from baseball.decoders import json_loads
+
+NUM_FETCH_THREADS = 16
+NUM_NESTED_FETCH_THREADS = 2
+HTTP_POOL_SIZE = NUM_FETCH_THREADS * NUM_NESTED_FETCH_THREADS
+HTTP_TIMEOUT_SECONDS = 30
+
+HTTP_CACHE_DIR_DICT = {'cache_dir': environ.get('BASEBALL_HTTP_CACHE_DIR')}
+
+FINAL_GAME_STATE_CODE = 'F'
+
+SESSION_DICT = {}
+IN_FLIGHT_DICT = {}
+IN_FLIGHT_LOCK = Lock()
+
+def set_http_cache_dir(cache_dir):
+    HTTP_CACHE_DIR_DICT['cache_dir'] = (
+        abspath(cache_dir) if cache_dir else None
+    )
+
+def get_session():
+    process_id = getpid()
+    session = SESSION_DICT.get(process_id)
+    if session is None:
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=NUM_FETCH_THREADS,
+                              pool_maxsize=HTTP_POOL_SIZE)
+
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        SESSION_DICT.clear()
+        SESSION_DICT[process_id] = session
+
+    return session
+
+def get_response(url, headers=None):
+    return get_session().get(url, headers=headers,
+                             timeout=HTTP_TIMEOUT_SECONDS)
+
+def get_cache_path_tuple(url):
+    url_hash = sha1(url.encode('utf-8')).hexdigest()
+    cache_dir = join(HTTP_CACHE_DIR_DICT['cache_dir'], url_hash[:2])
+
+    return join(cache_dir, url_hash + '.meta'), join(cache_dir, url_hash)
+
+def read_cached_response(url):
+    if not HTTP_CACHE_DIR_DICT['cache_dir']:
+        return None, None
+
+    meta_path, body_path = get_cache_path_tuple(url)
+    if not (exists(meta_path) and exists(body_path)):
+        return None, None
+
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as filehandle:
+            meta_dict = loads(filehandle.read())
+
+        with open(body_path, 'r', encoding='utf-8') as filehandle:
+            body_str = filehandle.read()
+    except (OSError, ValueError):
+        return None, None
+
+    return meta_dict, body_str
+
+def write_file_atomic(path, content_str):
+    temp_path = '{}.{}.tmp'.format(path, getpid())
+    with open(temp_path, 'w', encoding='utf-8') as filehandle:
+        filehandle.write(content_str)
+
+    replace(temp_path, path)
+
+def write_cached_response(url, meta_dict, body_str=None):
+    if not HTTP_CACHE_DIR_DICT['cache_dir']:
+        return
+
+    meta_path, body_path = get_cache_path_tuple(url)
+    try:
+        makedirs(dirname(meta_path), exist_ok=True)
+
+        if body_str is not None:
+            write_file_atomic(body_path, body_str)
+
+        write_file_atomic(meta_path, dumps(meta_dict, sort_keys=True))
+    except OSError:
+        return
+
+def mark_response_immutable(url):
+    meta_dict, _ = read_cached_response(url)
+    if meta_dict and not meta_dict.get('immutable'):
+        meta_dict['immutable'] = True
+        write_cached_response(url, meta_dict)
+
+def get_conditional_header_dict(meta_dict):
+    header_dict = {}
+    if meta_dict.get('etag'):
+        header_dict['If-None-Match'] = meta_dict['etag']
+
+    if meta_dict.get('last_modified'):
+        header_dict['If-Modified-Since'] = meta_dict['last_modified']
+
+    return header_dict
+
+def fetch_text(url):
+    meta_dict, body_str = read_cached_response(url)
+    if meta_dict and meta_dict.get('immutable'):
+        return body_str
+
+    header_dict = get_conditional_header_dict(meta_dict) if meta_dict else {}
+    response = get_response(url, header_dict)
+    if response.status_code == 304 and body_str is not None:
+        return body_str
+
+    if response.status_code == 200:
+        meta_dict = {'url': url,
+                     'etag': response.headers.get('ETag'),
+                     'last_modified': response.headers.get('Last-Modified'),
+                     'immutable': False}
+
+        write_cached_response(url, meta_dict, response.text)
+
+    return response.text
+
+def get_text(url):
+    with IN_FLIGHT_LOCK:
+        future = IN_FLIGHT_DICT.get(url)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            IN_FLIGHT_DICT[url] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        future.set_result(fetch_text(url))
+    except Exception as exception:
+        future.set_exception(exception)
+    finally:
+        with IN_FLIGHT_LOCK:
+            del IN_FLIGHT_DICT[url]
+
+    return future.result()
+
+def game_dict_is_final(json_dict):
+    return (
+        isinstance(json_dict, dict) and
+        json_dict.get('gameData', {}).get('status', {}).get(
+            'codedGameState') == FINAL_GAME_STATE_CODE
+    )
+
+def get_json(url):
+    json_dict = json_loads(get_text(url))
+    if game_dict_is_final(json_dict):
+        mark_response_immutable(url)
+
+    return json_dict
+
+def map_concurrent(function, item_list, num_threads=NUM_FETCH_THREADS):
+    item_list = list(item_list)
+    if len(item_list) < 2 or num_threads < 2:
+        return [function(item) for item in item_list]
+
+    with ThreadPoolExecutor(max_workers=min(num_threads,
+                                            len(item_list))) as executor:
+        result_list = list(executor.map(function, item_list))
+
+    return result_list
+
+def get_text_list(url_list, num_threads=NUM_FETCH_THREADS):
+    return map_concurrent(get_text, url_list, num_threads)
+
+def get_json_list(url_list, num_threads=NUM_FETCH_THREADS):
+    return map_concurrent(get_json, url_list, num_threads)
@@ -0,0 +1,79 @@
+from hashlib import sha1
+from os import environ, getpid, makedirs, replace
+from os.path import abspath, dirname, exists, join
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+
+from baseball.archive_zip import (archive_file_exists,
+                                  get_archive_file_fingerprint)
+from baseball.process_game_json import BOX_SCORE_SOURCE_DICT
+from baseball.version import __version__
+
+GAME_CACHE_DIR_DICT = {'cache_dir': environ.get('BASEBALL_GAME_CACHE_DIR')}
+GAME_CACHE_FORMAT = 6
+
+def set_game_cache_dir(cache_dir):
+    GAME_CACHE_DIR_DICT['cache_dir'] = (
+        abspath(cache_dir) if cache_dir else None
+    )
+
+def get_source_filename_list(filename_tuple):
+    game_id, boxscore_file, player_file, inning_file, live_file = filename_tuple
+    if int(game_id.split('-', 1)[0]) < 2019:
+        return [boxscore_file, player_file, inning_file]
+
+    return [live_file]
+
+def get_game_cache_key(filename_tuple):
+    fingerprint_list = [__version__, str(GAME_CACHE_FORMAT),
+                        filename_tuple[0]]
+    source_filename_list = get_source_filename_list(filename_tuple)
+    if filename_tuple[4] in source_filename_list:
+        fingerprint_list.append(BOX_SCORE_SOURCE_DICT['source'])
+
+    for filename in source_filename_list:
+        fingerprint_list.append(abspath(filename))
+        fingerprint_list.extend(get_archive_file_fingerprint(filename))
+
+    return sha1('\n'.join(fingerprint_list).encode('utf-8')).hexdigest()
+
+def get_game_cache_path(filename_tuple):
+    cache_key = get_game_cache_key(filename_tuple)
+
+    return join(GAME_CACHE_DIR_DICT['cache_dir'], cache_key[:2],
+                cache_key + '.pickle')
+
+def source_files_exist(filename_tuple):
+    return all(archive_file_exists(filename)
+               for filename in get_source_filename_list(filename_tuple))
+
+def read_cached_game(filename_tuple):
+    if not (GAME_CACHE_DIR_DICT['cache_dir'] and
+            source_files_exist(filename_tuple)):
+        return None
+
+    try:
+        cache_path = get_game_cache_path(filename_tuple)
+        if exists(cache_path):
+            with open(cache_path, 'rb') as filehandle:
+                return loads(filehandle.read())
+    except Exception:
+        return None
+
+    return None
+
+def write_cached_game(filename_tuple, game):
+    if not (GAME_CACHE_DIR_DICT['cache_dir'] and game and
+            source_files_exist(filename_tuple)):
+        return
+
+    try:
+        cache_path = get_game_cache_path(filename_tuple)
+        makedirs(dirname(cache_path), exist_ok=True)
+
+        temp_path = '{}.{}.tmp'.format(cache_path, getpid())
+        with open(temp_path, 'wb') as filehandle:
+            filehandle.write(dumps(game, HIGHEST_PROTOCOL))
+
+        replace(temp_path, cache_path)
+    except Exception:
+        return
@@ -0,0 +1,189 @@
+from io import BytesIO
+from pickle import HIGHEST_PROTOCOL, Pickler, Unpickler
+
+from baseball.baseball import Player
+from baseball.baseball_events import (Pickoff, Pitch, RunnerAdvance,
+                                      Substitution, Switch)
+
+COMPACT_GAME_VERSION = 2
+
+COMPACT_FIELD_LIST = [
+    (Player, ('last_name', 'first_name', 'mlb_id', 'obp', 'slg', 'number',
+              'era', 'pitch_hand', 'bat_side')),
+    (Pitch, ('pitch_datetime', 'pitch_description', 'pitch_type',
+             'pitch_speed', 'pitch_position', 'game_state')),
+    (Pickoff, ('pickoff_description', 'pickoff_base',
+               'pickoff_was_successful')),
+    (RunnerAdvance, ('run_description', 'runner', 'start_base', 'end_base',
+                     'runner_scored', 'run_earned', 'is_rbi')),
+    (Substitution, ('substitution_datetime', 'incoming_player',
+                    'outgoing_player', 'batting_order', 'position')),
+    (Switch, ('switch_datetime', 'player', 'old_position_num',
+              'new_position_num', 'new_batting_order'))
+]
+
+COMPACT_TYPE_DICT = {
+    compact_type: type_index
+    for type_index, (compact_type, _) in enumerate(COMPACT_FIELD_LIST)
+}
+
+PLAYER_ID_TAG = 0
+EVENT_LIST_ID_TAG = 1
+EVENT_ID_TAG = 2
+
+class CompactGamePickler(Pickler):
+    def __init__(self, filehandle, compact_state):
+        super().__init__(filehandle, HIGHEST_PROTOCOL)
+        self.compact_state = compact_state
+
+    def persistent_id(self, obj):
+        obj_type = type(obj)
+        if obj_type is Player:
+            return (PLAYER_ID_TAG, get_player_index(obj, self.compact_state))
+
+        if obj_type is list:
+            event_list_index = self.compact_state['event_list_dict'].get(
+                id(obj)
+            )
+
+            if event_list_index is not None:
+                return (EVENT_LIST_ID_TAG, event_list_index)
+        elif obj_type in COMPACT_TYPE_DICT:
+            event_index_tuple = self.compact_state['event_dict'].get(id(obj))
+            if event_index_tuple is not None:
+                return (EVENT_ID_TAG, event_index_tuple)
+
+        return None
+
+class CompactGameUnpickler(Unpickler):
+    def __init__(self, filehandle, compact_state):
+        super().__init__(filehandle)
+        self.compact_state = compact_state
+
+    def persistent_load(self, pid):
+        tag, index = pid
+        if tag == PLAYER_ID_TAG:
+            return self.compact_state['player_list'][index]
+
+        if tag == EVENT_LIST_ID_TAG:
+            return self.compact_state['event_list_list'][index]
+
+        if tag == EVENT_ID_TAG:
+            event_list_index, event_index = index
+            return self.compact_state['event_list_list'][event_list_index][
+                event_index
+            ]
+
+        raise ValueError('Invalid compact game reference: {}'.format(pid))
+
+def get_event_list_list(game):
+    event_list_dict = {}
+    for inning in game.inning_list:
+        for inning_half in [inning.top_half_appearance_list,
+                            inning.bottom_half_appearance_list]:
+            for plate_appearance in inning_half or []:
+                event_list = plate_appearance.event_list
+                if all(type(event) in COMPACT_TYPE_DICT
+                       for event in event_list):
+                    event_list_dict.setdefault(id(event_list), event_list)
+
+    return list(event_list_dict.values())
+
+def get_shared_value(value, compact_state):
+    value_type = type(value)
+    if value_type is str:
+        return compact_state['value_dict'].setdefault(value, value)
+
+    if isinstance(value, tuple):
+        try:
+            return compact_state['value_dict'].setdefault(
+                (value_type, value, tuple(map(type, value))), value
+            )
+        except TypeError:
+            pass
+
+    return value
+
+def get_row(obj, compact_state):
+    type_index = COMPACT_TYPE_DICT[type(obj)]
+    field_tuple = COMPACT_FIELD_LIST[type_index][1]
+    obj_dict = obj.__dict__
+    if len(obj_dict) == len(field_tuple):
+        extra_dict = None
+    else:
+        extra_dict = {key: value for key, value in obj_dict.items()
+                      if key not in field_tuple}
+
+    return ((type_index,) +
+            tuple(get_shared_value(obj_dict[field], compact_state)
+                  for field in field_tuple) +
+            (extra_dict,))
+
+def get_player_index(player, compact_state):
+    player_index = compact_state['player_dict'].get(id(player))
+    if player_index is None:
+        player_index = len(compact_state['player_table'])
+        compact_state['player_dict'][id(player)] = player_index
+        compact_state['player_table'].append(get_row(player,
+                                                     compact_state))
+
+    return player_index
+
+def get_pickle_bytes(obj, compact_state):
+    filehandle = BytesIO()
+    CompactGamePickler(filehandle, compact_state).dump(obj)
+
+    return filehandle.getvalue()
+
+def get_compact_game(game):
+    compact_state = {'player_dict': {}, 'player_table': [],
+                     'event_list_dict': {}, 'event_dict': {},
+                     'value_dict': {}}
+
+    event_list_list = get_event_list_list(game)
+    event_table = [
+        tuple(get_row(event, compact_state) for event in event_list)
+        for event_list in event_list_list
+    ]
+
+    event_bytes = get_pickle_bytes(event_table, compact_state)
+    for event_list_index, event_list in enumerate(event_list_list):
+        compact_state['event_list_dict'][id(event_list)] = event_list_index
+        for event_index, event in enumerate(event_list):
+            compact_state['event_dict'][id(event)] = (event_list_index,
+                                                      event_index)
+
+    game_bytes = get_pickle_bytes(game, compact_state)
+
+    return (COMPACT_GAME_VERSION, tuple(compact_state['player_table']),
+            event_bytes, game_bytes)
+
+def get_obj_list(row_list):
+    obj_list = []
+    for row in row_list:
+        compact_type, field_tuple = COMPACT_FIELD_LIST[row[0]]
+        obj = object.__new__(compact_type)
+        obj.__dict__.update(zip(field_tuple, row[1:-1]))
+        if row[-1]:
+            obj.__dict__.update(row[-1])
+
+        obj_list.append(obj)
+
+    return obj_list
+
+def get_game_from_compact(compact_game):
+    version = compact_game[0]
+    if version != COMPACT_GAME_VERSION:
+        raise ValueError('Invalid compact game version: {}'.format(version))
+
+    _, player_table, event_bytes, game_bytes = compact_game
+    compact_state = {'player_list': get_obj_list(player_table),
+                     'event_list_list': None}
+
+    compact_state['event_list_list'] = [
+        get_obj_list(row_list)
+        for row_list in CompactGameUnpickler(BytesIO(event_bytes),
+                                             compact_state).load()
+    ]
+
+    return CompactGameUnpickler(BytesIO(game_bytes), compact_state).load()
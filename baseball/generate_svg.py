@@ -1451,21 +1451,9 @@ def get_hit_svg(plate_appearance):
     return hit_svg
 
 def get_count_svg(plate_appearance):
-    balls = 0
-    strikes = 0
-    for event in plate_appearance.event_list:
-        if (isinstance(event, Pitch) and
-                'In play' not in event.pitch_description):
-            if ('Strike' in event.pitch_description or
-                    'Missed Bunt' in event.pitch_description or
-                    'Foul Bunt' in event.pitch_description):
-                strikes += 1
-            elif 'Foul' in event.pitch_description and strikes < 2:
-                strikes += 1
-            elif 'Foul' not in event.pitch_description:
-                balls += 1
-
-    count_str = '{}-{}'.format(balls, strikes)
+    count_str = '{}-{}'.format(plate_appearance.end_game_state.balls,
+                               plate_appearance.end_game_state.strikes)
+
     count_svg = SVG_COUNT_TEMPLATE.format(count_str=count_str)
 
     return count_svg
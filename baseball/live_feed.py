@@ -0,0 +1,164 @@
+from copy import deepcopy
+from os import environ
+
+from requests import RequestException
+
+from baseball.decoders import json_loads
+from baseball.fetch_http import (game_dict_is_final, get_json, get_response,
+                                 map_concurrent)
+
+STATSAPI_URL_DICT = {
+    'base_url': environ.get('BASEBALL_STATSAPI_URL', 'http://statsapi.mlb.com')
+}
+
+GAME_URL_TEMPLATE = '{base_url}/api/v1.1/game/{game_pk}/feed/live'
+DIFF_PATCH_URL_TEMPLATE = (GAME_URL_TEMPLATE +
+                           '/diffPatch?startTimecode={timecode}')
+
+LIVE_FEED_DICT = {}
+
+def set_statsapi_url(base_url):
+    STATSAPI_URL_DICT['base_url'] = base_url.rstrip('/')
+
+def get_live_feed_url(game_pk):
+    return GAME_URL_TEMPLATE.format(base_url=STATSAPI_URL_DICT['base_url'],
+                                    game_pk=game_pk)
+
+def get_diff_patch_url(game_pk, timecode):
+    return DIFF_PATCH_URL_TEMPLATE.format(
+        base_url=STATSAPI_URL_DICT['base_url'],
+        game_pk=game_pk,
+        timecode=timecode
+    )
+
+def get_feed_timecode(game_dict):
+    return game_dict.get('metaData', {}).get('timeStamp')
+
+def get_pointer_key_list(path_str):
+    if not path_str:
+        return []
+
+    if not path_str.startswith('/'):
+        raise ValueError('Invalid JSON pointer: {}'.format(path_str))
+
+    return [key.replace('~1', '/').replace('~0', '~')
+            for key in path_str[1:].split('/')]
+
+def get_container_key(document, path_str):
+    key_list = get_pointer_key_list(path_str)
+    if not key_list:
+        raise ValueError('Cannot patch document root')
+
+    container = document
+    for key in key_list[:-1]:
+        if isinstance(container, list):
+            container = container[int(key)]
+        else:
+            container = container[key]
+
+    return container, key_list[-1]
+
+def get_pointer_value(document, path_str):
+    value = document
+    for key in get_pointer_key_list(path_str):
+        if isinstance(value, list):
+            value = value[int(key)]
+        else:
+            value = value[key]
+
+    return value
+
+def add_pointer_value(document, path_str, value):
+    container, key = get_container_key(document, path_str)
+    if isinstance(container, list):
+        if key == '-':
+            container.append(value)
+        else:
+            container.insert(int(key), value)
+    else:
+        container[key] = value
+
+def remove_pointer_value(document, path_str):
+    container, key = get_container_key(document, path_str)
+    if isinstance(container, list):
+        return container.pop(int(key))
+
+    return container.pop(key)
+
+def replace_pointer_value(document, path_str, value):
+    container, key = get_container_key(document, path_str)
+    if isinstance(container, list):
+        container[int(key)] = value
+    elif key in container:
+        container[key] = value
+    else:
+        raise ValueError('Cannot replace missing value: {}'.format(path_str))
+
+def apply_patch_operation(document, operation_dict):
+    operation = operation_dict['op']
+    path_str = operation_dict['path']
+    if operation == 'add':
+        add_pointer_value(document, path_str, operation_dict['value'])
+    elif operation == 'remove':
+        remove_pointer_value(document, path_str)
+    elif operation == 'replace':
+        replace_pointer_value(document, path_str, operation_dict['value'])
+    elif operation == 'move':
+        value = remove_pointer_value(document, operation_dict['from'])
+        add_pointer_value(document, path_str, value)
+    elif operation == 'copy':
+        value = deepcopy(get_pointer_value(document, operation_dict['from']))
+        add_pointer_value(document, path_str, value)
+    elif operation == 'test':
+        if get_pointer_value(document, path_str) != operation_dict['value']:
+            raise ValueError('Patch test failed: {}'.format(path_str))
+    else:
+        raise ValueError('Unknown patch operation: {}'.format(operation))
+
+def apply_diff_patch(game_dict, diff_patch_list):
+    for diff_patch_dict in diff_patch_list:
+        for operation_dict in diff_patch_dict.get('diff', []):
+            apply_patch_operation(game_dict, operation_dict)
+
+    return game_dict
+
+def store_live_feed(game_pk, game_dict):
+    if game_dict_is_final(game_dict):
+        LIVE_FEED_DICT.pop(game_pk, None)
+    else:
+        LIVE_FEED_DICT[game_pk] = game_dict
+
+    return game_dict
+
+def get_full_live_feed(game_pk):
+    return store_live_feed(game_pk, get_json(get_live_feed_url(game_pk)))
+
+def get_diff_patch(game_pk, timecode):
+    response = get_response(get_diff_patch_url(game_pk, timecode))
+    response.raise_for_status()
+
+    return json_loads(response.text)
+
+def get_live_feed(game_pk):
+    game_dict = LIVE_FEED_DICT.get(game_pk)
+    timecode = get_feed_timecode(game_dict) if game_dict else None
+    if not timecode:
+        return get_full_live_feed(game_pk)
+
+    try:
+        diff_patch = get_diff_patch(game_pk, timecode)
+        if isinstance(diff_patch, dict):
+            if 'gameData' not in diff_patch:
+                raise ValueError('Unexpected diffPatch response')
+
+            game_dict = diff_patch
+        elif diff_patch:
+            game_dict = apply_diff_patch(game_dict, diff_patch)
+    except (RequestException, ValueError, KeyError, IndexError, TypeError,
+            AttributeError):
+        return get_full_live_feed(game_pk)
+
+    return store_live_feed(game_pk, game_dict)
+
+def get_live_feed_list(game_pk_list):
+    return map_concurrent(get_live_feed, game_pk_list)
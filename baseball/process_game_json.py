@@ -1,5 +1,7 @@
 import datetime
 
+from collections import OrderedDict, namedtuple
+from os import environ
 from re import search, sub
 
 from pytz import timezone
@@ -7,8 +9,15 @@ from pytz import timezone
 from baseball.baseball import (Player, PlayerAppearance, PlateAppearance, Game,
                                Inning, Team)
 
-from baseball.baseball_events import (AUTOMATIC_BALL_POSITION, Pitch, Pickoff,
-                                      RunnerAdvance)
+from baseball.baseball_events import (AUTOMATIC_BALL_POSITION, Pitch,
+                                      PitchRecord, Pickoff, RunnerAdvance)
+
+from baseball.stats import (BatterBoxScore, PitcherBoxScore, TeamBoxScore,
+                            get_batter_box_score_dict,
+                            get_box_score_total,
+                            get_pitcher_box_score_dict,
+                            get_pitcher_rate_tuple,
+                            get_team_stats)
 
 from baseball.process_game_xml import (
     get_datetime, get_sub_switch_steal_flags, parse_substitution,
@@ -16,7 +25,29 @@ from baseball.process_game_xml import (
     fix_description
 )
 
-def process_pitch(event):
+BOX_SCORE_SOURCE_LIST = ['computed', 'official', 'verify']
+
+BOX_SCORE_SOURCE_DICT = {
+    'source': environ.get('BASEBALL_BOX_SCORE_SOURCE', 'computed')
+}
+
+BOX_SCORE_KEY_LIST = ['away_batter_box_score_dict',
+                      'away_pitcher_box_score_dict',
+                      'home_batter_box_score_dict',
+                      'home_pitcher_box_score_dict',
+                      'away_team_stats',
+                      'home_team_stats']
+
+BoxScoreDiff = namedtuple('BoxScoreDiff',
+                          'box_score player field official computed')
+
+def set_box_score_source(source):
+    if source not in BOX_SCORE_SOURCE_LIST:
+        raise ValueError('Invalid box score source: {}'.format(source))
+
+    BOX_SCORE_SOURCE_DICT['source'] = source
+
+def get_pitch_field_tuple(event):
     pitch_description = event['details']['call']['description']
     if event['details'].get('type'):
         pitch_type = event['details']['type']['code']
@@ -41,8 +72,11 @@ def process_pitch(event):
     else:
         pitch_speed = None
 
-    pitch_obj = Pitch(pitch_datetime, pitch_description, pitch_type,
-                      pitch_speed, pitch_position)
+    return (pitch_datetime, pitch_description, pitch_type, pitch_speed,
+            pitch_position)
+
+def process_pitch(event):
+    pitch_obj = Pitch(*get_pitch_field_tuple(event))
 
     return pitch_obj
 
@@ -131,12 +165,10 @@ def process_runner_list(plate_appearance, game_obj, event_list,
                         scoring_runners_list, runners_batted_in_list):
     for runner_event in plate_appearance['runners']:
         runner_id = int(runner_event['details']['runner']['id'])
+        runner = (game_obj.away_team.find_player(runner_id) or
+                  game_obj.home_team.find_player(runner_id))
 
-        if runner_id in game_obj.away_team:
-            runner = game_obj.away_team[runner_id]
-        elif runner_id in game_obj.home_team:
-            runner = game_obj.home_team[runner_id]
-        else:
+        if not runner:
             raise ValueError('Runner ID not in player dict')
 
         start_base = runner_event['movement'].get('start') or ''
@@ -256,13 +288,213 @@ def set_pitcher_wls_codes(game_dict, game):
         else:
             pitcher_appearance.pitcher_credit_code = ''
 
-def process_half_inning(plate_appearance_dict_list, inning_half_str, game_obj):
-    if inning_half_str not in ('top', 'bottom'):
-        raise ValueError('Invalid inning half str.')
+def get_player_stats_dict(team_dict):
+    return {
+        x['person']['id']: x['stats']
+        for x in team_dict['players'].values()
+    }
 
-    next_batter_num = 1
-    plate_appearance_list = []
-    inning_num = len(game_obj.inning_list) + 1
+def get_official_batter_box_score(batting_dict):
+    return BatterBoxScore(
+        batting_dict.get('atBats', 0),
+        batting_dict.get('runs', 0),
+        batting_dict.get('hits', 0),
+        batting_dict.get('rbi', 0),
+        batting_dict.get('baseOnBalls', 0),
+        batting_dict.get('strikeOuts', 0),
+        batting_dict.get('leftOnBase', 0)
+    )
+
+def get_official_pitcher_box_score(pitching_dict, pitcher_credit_code):
+    innings_pitched = float(pitching_dict.get('inningsPitched', 0))
+    num_hits = pitching_dict.get('hits', 0)
+    num_walks = (pitching_dict.get('baseOnBalls', 0) -
+                 pitching_dict.get('intentionalWalks', 0))
+
+    era, whip = get_pitcher_rate_tuple(innings_pitched,
+                                       pitching_dict.get('earnedRuns', 0),
+                                       num_hits,
+                                       num_walks)
+
+    return PitcherBoxScore(
+        innings_pitched,
+        pitcher_credit_code,
+        pitching_dict.get('battersFaced', 0),
+        num_hits,
+        pitching_dict.get('runs', 0),
+        pitching_dict.get('earnedRuns', 0),
+        pitching_dict.get('strikeOuts', 0),
+        num_walks,
+        pitching_dict.get('intentionalWalks', 0),
+        pitching_dict.get('hitByPitch', 0),
+        pitching_dict.get('balks', 0),
+        pitching_dict.get('wildPitches', 0),
+        pitching_dict.get('homeRuns', 0),
+        pitching_dict.get('strikes', 0),
+        pitching_dict.get('numberOfPitches', 0),
+        era,
+        whip
+    )
+
+def get_official_team_box_score(team_dict, opponent_team_dict):
+    batting_dict = team_dict['teamStats']['batting']
+    opponent_stats_dict = opponent_team_dict['teamStats']
+
+    return TeamBoxScore(
+        (batting_dict['hits'] - batting_dict['doubles'] -
+         batting_dict['triples'] - batting_dict['homeRuns']),
+        batting_dict['doubles'],
+        batting_dict['triples'],
+        batting_dict['homeRuns'],
+        batting_dict['sacFlies'],
+        batting_dict['sacBunts'],
+        batting_dict['groundIntoDoublePlay'],
+        batting_dict['hitByPitch'],
+        opponent_stats_dict['pitching'].get('wildPitches', 0),
+        opponent_stats_dict['fielding'].get('passedBall', 0),
+        batting_dict['stolenBases'],
+        batting_dict['caughtStealing'],
+        batting_dict['plateAppearances']
+    )
+
+def get_official_box_score_dict(game_obj, game_dict):
+    teams_dict = game_dict['liveData']['boxscore']['teams']
+    box_score_dict = {}
+    for team_str, opponent_str, team in [
+            ('away', 'home', game_obj.away_team),
+            ('home', 'away', game_obj.home_team)]:
+        stats_dict = get_player_stats_dict(teams_dict[team_str])
+        batter_box_score_dict = OrderedDict([])
+        for batting_order_list in team.batting_order_list_list:
+            for batter_appearance in batting_order_list:
+                batter = batter_appearance.player_obj
+                if batter not in batter_box_score_dict:
+                    batter_box_score_dict[batter] = (
+                        get_official_batter_box_score(
+                            stats_dict[batter.mlb_id]['batting']
+                        )
+                    )
+
+        batter_box_score_dict['TOTAL'] = get_box_score_total(
+            batter_box_score_dict
+        )
+
+        pitcher_box_score_dict = OrderedDict([])
+        for pitcher_appearance in team.pitcher_list:
+            pitcher = pitcher_appearance.player_obj
+            pitcher_box_score_dict[pitcher] = get_official_pitcher_box_score(
+                stats_dict[pitcher.mlb_id]['pitching'],
+                pitcher_appearance.pitcher_credit_code
+            )
+
+        box_score_dict[team_str + '_batter_box_score_dict'] = (
+            batter_box_score_dict
+        )
+
+        box_score_dict[team_str + '_pitcher_box_score_dict'] = (
+            pitcher_box_score_dict
+        )
+
+        box_score_dict[team_str + '_team_stats'] = (
+            get_official_team_box_score(teams_dict[team_str],
+                                        teams_dict[opponent_str])
+        )
+
+    return box_score_dict
+
+def get_computed_box_score_dict(game_obj):
+    box_score_dict = {}
+    for team_str, team, batting_half_str, pitching_half_str in [
+            ('away', game_obj.away_team, 'top', 'bottom'),
+            ('home', game_obj.home_team, 'bottom', 'top')]:
+        batter_box_score_dict = get_batter_box_score_dict(game_obj, team,
+                                                          batting_half_str)
+
+        batter_box_score_dict['TOTAL'] = get_box_score_total(
+            batter_box_score_dict
+        )
+
+        box_score_dict[team_str + '_batter_box_score_dict'] = (
+            batter_box_score_dict
+        )
+
+        box_score_dict[team_str + '_pitcher_box_score_dict'] = (
+            get_pitcher_box_score_dict(game_obj, team, pitching_half_str)
+        )
+
+        box_score_dict[team_str + '_team_stats'] = get_team_stats(
+            game_obj, batting_half_str
+        )
+
+    return box_score_dict
+
+def get_box_score_diff_list(official_dict, computed_dict):
+    diff_list = []
+    for key in BOX_SCORE_KEY_LIST:
+        if key.endswith('_team_stats'):
+            tuple_list = [(None, official_dict[key], computed_dict[key])]
+        else:
+            tuple_list = [
+                (player, box_score, computed_dict[key].get(player))
+                for player, box_score in official_dict[key].items()
+            ]
+
+        for player, official_tuple, computed_tuple in tuple_list:
+            for field in official_tuple._fields:
+                official_value = getattr(official_tuple, field)
+                computed_value = getattr(computed_tuple, field, None)
+                if official_value != computed_value:
+                    diff_list.append(BoxScoreDiff(key, player, field,
+                                                  official_value,
+                                                  computed_value))
+
+    return diff_list
+
+def verify_box_scores(game_obj, game_dict):
+    return get_box_score_diff_list(
+        get_official_box_score_dict(game_obj, game_dict),
+        get_computed_box_score_dict(game_obj)
+    )
+
+def set_official_box_scores(game_obj, game_dict):
+    source = BOX_SCORE_SOURCE_DICT['source']
+    if source not in BOX_SCORE_SOURCE_LIST[1:]:
+        return False
+
+    try:
+        official_dict = get_official_box_score_dict(game_obj, game_dict)
+    except (KeyError, TypeError, ValueError):
+        return False
+
+    if source == 'verify':
+        game_obj.box_score_diff_list = get_box_score_diff_list(
+            official_dict, get_computed_box_score_dict(game_obj)
+        )
+
+    for key in BOX_SCORE_KEY_LIST:
+        setattr(game_obj, key, official_dict[key])
+
+    return True
+
+def get_extra_innings_last_batter(inning_half_str, inning_num, game_obj):
+    if inning_half_str == 'top':
+        half_appearance_list = (
+            game_obj.inning_list[inning_num - 2].top_half_appearance_list
+        )
+    else:
+        half_appearance_list = (
+            game_obj.inning_list[inning_num - 2].bottom_half_appearance_list
+        )
+
+    last_pa = half_appearance_list[-1]
+    summary = last_pa.plate_appearance_summary
+    if (summary == 'Runner Out' or 'Caught Stealing' in summary or
+            'Pickoff' in summary):
+        last_pa = half_appearance_list[-2]
+
+    return last_pa.batter
+
+def get_extra_innings_appearance(inning_half_str, inning_num, game_obj):
     est_time = (game_obj.start_datetime if game_obj.start_datetime
                 else game_obj.expected_start_datetime).astimezone(
                     timezone('America/New_York')
@@ -272,55 +504,33 @@ def process_half_inning(plate_appearance_dict_list, inning_half_str, game_obj):
             (inning_num >= 10 or (inning_num >= 8 and game_obj.is_doubleheader))):
         if inning_half_str == 'top':
             batting_team = game_obj.away_team
-            last_pa = (
-                game_obj.inning_list[inning_num - 2].top_half_appearance_list[-1]
-            )
-
-            summary = last_pa.plate_appearance_summary
-            if (summary == 'Runner Out' or 'Caught Stealing' in summary or
-                    'Pickoff' in summary):
-                last_pa = (
-                    game_obj.inning_list[inning_num - 2].top_half_appearance_list[-2]
-                )
-
-            last_batter = last_pa.batter
-
-        elif inning_half_str == 'bottom':
+        else:
             batting_team = game_obj.home_team
-            last_pa = (
-                game_obj.inning_list[inning_num - 2].bottom_half_appearance_list[-1]
-            )
 
-            summary = last_pa.plate_appearance_summary
-            if (summary == 'Runner Out' or 'Caught Stealing' in summary or
-                    'Pickoff' in summary):
-                last_pa = (
-                    game_obj.inning_list[inning_num - 2].bottom_half_appearance_list[-2]
-                )
+        last_batter = get_extra_innings_last_batter(inning_half_str,
+                                                    inning_num, game_obj)
 
-            last_batter = last_pa.batter
+        return PlateAppearance(None, None, batting_team, '',
+                               'Extra Innings Runner', None, last_batter, 0,
+                               [], [], [])
 
-        extra_appearance_obj = PlateAppearance(None, None, batting_team,
-                                               '', 'Extra Innings Runner', None,
-                                               last_batter, 0, [], [], [])
+    return None
 
-        plate_appearance_list.append(extra_appearance_obj)
-        next_batter_num += 1
+def set_extra_innings_runner(plate_appearance_list, inning_half_str,
+                             inning_num, game_obj):
+    extra_appearance_list = [
+        plate_appearance for plate_appearance in plate_appearance_list
+        if plate_appearance.plate_appearance_summary == 'Extra Innings Runner'
+    ]
 
-    for plate_appearance_dict in plate_appearance_dict_list:
-        event_list = []
-        if plate_appearance_dict['result'].get('event') == 'Game Advisory':
-            continue
+    if not extra_appearance_list:
+        return
 
-        plate_appearance_list.append(
-            process_at_bat(plate_appearance_dict,
-                           event_list,
-                           game_obj,
-                           inning_half_str,
-                           inning_num,
-                           next_batter_num))
+    last_batter = get_extra_innings_last_batter(inning_half_str, inning_num,
+                                                game_obj)
 
-        next_batter_num += 1
+    for plate_appearance in extra_appearance_list:
+        plate_appearance.batter = last_batter
 
     batters_set = set([plate_appearance.batter
                        for plate_appearance in plate_appearance_list])
@@ -332,11 +542,45 @@ def process_half_inning(plate_appearance_dict_list, inning_half_str, game_obj):
 
     diff_list = list(runners_set - batters_set)
 
-    for plate_appearance in plate_appearance_list:
-        extra_runner_frame = None
-        if plate_appearance.plate_appearance_summary == 'Extra Innings Runner':
-            if diff_list and len(diff_list) == 1:
-                plate_appearance.batter = diff_list[0]
+    for plate_appearance in extra_appearance_list:
+        if diff_list and len(diff_list) == 1:
+            plate_appearance.batter = diff_list[0]
+
+def append_plate_appearance(plate_appearance_dict, plate_appearance_list,
+                            inning_half_str, inning_num, game_obj):
+    if plate_appearance_dict['result'].get('event') == 'Game Advisory':
+        return None
+
+    plate_appearance_obj = process_at_bat(plate_appearance_dict,
+                                          [],
+                                          game_obj,
+                                          inning_half_str,
+                                          inning_num,
+                                          len(plate_appearance_list) + 1)
+
+    plate_appearance_list.append(plate_appearance_obj)
+
+    return plate_appearance_obj
+
+def process_half_inning(plate_appearance_dict_list, inning_half_str, game_obj,
+                        inning_num=None):
+    if inning_half_str not in ('top', 'bottom'):
+        raise ValueError('Invalid inning half str.')
+
+    inning_num = inning_num or len(game_obj.inning_list) + 1
+    plate_appearance_list = []
+    extra_appearance_obj = get_extra_innings_appearance(inning_half_str,
+                                                        inning_num, game_obj)
+
+    if extra_appearance_obj:
+        plate_appearance_list.append(extra_appearance_obj)
+
+    for plate_appearance_dict in plate_appearance_dict_list:
+        append_plate_appearance(plate_appearance_dict, plate_appearance_list,
+                                inning_half_str, inning_num, game_obj)
+
+    set_extra_innings_runner(plate_appearance_list, inning_half_str,
+                             inning_num, game_obj)
 
     return plate_appearance_list
 
@@ -400,17 +644,29 @@ def set_player_list(team_dict, gamedata_dict, team):
 
         new_player.pitch_hand = gamedata_player_dict['pitchHand']['code']
         new_player.bat_side = gamedata_player_dict['batSide']['code']
+        set_player_era(new_player, this_player_dict)
+        team.append(new_player)
 
-        if this_player_dict['seasonStats']['pitching']['era'] != '-.--':
-            this_era = float(this_player_dict['seasonStats']['pitching']['era'])
-            if this_era != 0.0:
-                new_player.era = this_era
-            else:
-                new_player.era = ''
+def set_player_era(player, player_dict):
+    if player_dict['seasonStats']['pitching']['era'] != '-.--':
+        this_era = float(player_dict['seasonStats']['pitching']['era'])
+        if this_era != 0.0:
+            player.era = this_era
         else:
-            new_player.era = ''
+            player.era = ''
+    else:
+        player.era = ''
 
-        team.append(new_player)
+def update_player_season_stats(team_dict, team):
+    for this_player_dict in team_dict['players'].values():
+        player_id = this_player_dict['person']['id']
+        if player_id not in team:
+            raise ValueError('Player ID not in player_dict')
+
+        player = team[player_id]
+        player.obp = float(this_player_dict['seasonStats']['batting']['obp'])
+        player.slg = float(this_player_dict['seasonStats']['batting']['slg'])
+        set_player_era(player, this_player_dict)
 
 def initialize_team(team_gamedata_dict, team_livedata_dict, full_gamedata_dict):
     team = Team(team_gamedata_dict['name'], team_gamedata_dict['abbreviation'])
@@ -441,18 +697,31 @@ def initialize_team(team_gamedata_dict, team_livedata_dict, full_gamedata_dict):
 
     return team
 
-def get_inning_dict_list(game_dict):
+def add_half_inning_plays(play_dict_list, half_inning_play_dict=None):
+    if half_inning_play_dict is None:
+        half_inning_play_dict = {}
+
+    for this_play_dict in play_dict_list:
+        half_inning_play_dict.setdefault(
+            (this_play_dict['about']['inning'],
+             this_play_dict['about']['halfInning']),
+            []
+        ).append(this_play_dict)
+
+    return half_inning_play_dict
+
+def get_inning_dict_list(game_dict, half_inning_play_dict=None):
+    if half_inning_play_dict is None:
+        half_inning_play_dict = add_half_inning_plays(
+            game_dict['liveData']['plays']['allPlays']
+        )
+
     inning_dict_list = []
     inning_num = 1
     inning_half = 'top'
 
     while True:
-        play_dict_list = []
-        for this_play_dict in game_dict['liveData']['plays']['allPlays']:
-            if (this_play_dict['about']['inning'] == inning_num and
-                    this_play_dict['about']['halfInning'] == inning_half):
-                play_dict_list.append(this_play_dict)
-
+        play_dict_list = half_inning_play_dict.get((inning_num, inning_half))
         if play_dict_list and inning_half == 'top':
             inning_dict_list.append({'top': play_dict_list})
             inning_half = 'bottom'
@@ -471,6 +740,59 @@ def set_game_inning_list(inning_dict_list, game_obj):
     for _, inning_dict in enumerate(inning_dict_list):
         game_obj.inning_list.append(process_inning(inning_dict, game_obj))
 
+def get_player_name_dict(game_dict):
+    return {
+        player_dict['id']: ' '.join(parse_name(player_dict['fullName']))
+        for player_dict in game_dict['gameData']['players'].values()
+    }
+
+def get_pitch_record_generator(game_id, game_dict):
+    player_name_dict = get_player_name_dict(game_dict)
+    for inning_num, inning_dict in enumerate(get_inning_dict_list(game_dict),
+                                             1):
+        for inning_half_str in ('top', 'bottom'):
+            for plate_appearance_dict in inning_dict.get(inning_half_str, []):
+                if (plate_appearance_dict['result'].get('event') ==
+                        'Game Advisory'):
+                    continue
+
+                pitcher_id = int(
+                    plate_appearance_dict['matchup']['pitcher']['id']
+                )
+
+                batter_id = int(
+                    plate_appearance_dict['matchup']['batter']['id']
+                )
+
+                for event in plate_appearance_dict['playEvents']:
+                    if event['type'] == 'pitch':
+                        yield PitchRecord(game_id,
+                                          inning_num,
+                                          inning_half_str,
+                                          pitcher_id,
+                                          player_name_dict.get(pitcher_id),
+                                          batter_id,
+                                          player_name_dict.get(batter_id),
+                                          *get_pitch_field_tuple(event))
+
+def get_start_end_dates(this_game):
+    start_date = None
+    end_date = None
+    if this_game['liveData']['plays'].get('allPlays'):
+        first_play = this_game['liveData']['plays']['allPlays'][0]
+        for play_event in first_play['playEvents']:
+            if play_event['type'] == 'pitch':
+                start_date = get_datetime(
+                    play_event['startTime']
+                )
+                break
+
+        end_date = get_datetime(
+            this_game['liveData']['plays']['allPlays'][-1]['about']['endTime']
+        )
+
+    return start_date, end_date
+
 def initialize_game(this_game, attendance_str, temperature_str, weather_str,
                     start_datetime_str):
     away_team = initialize_team(
@@ -495,21 +817,7 @@ def initialize_game(this_game, attendance_str, temperature_str, weather_str,
             this_game['gameData']['venue']['location'].get('stateAbbrev')
         )
 
-    start_date = None
-    end_date = None
-    if this_game['liveData']['plays'].get('allPlays'):
-        first_play = this_game['liveData']['plays']['allPlays'][0]
-        for play_event in first_play['playEvents']:
-            if play_event['type'] == 'pitch':
-                start_date = get_datetime(
-                    play_event['startTime']
-                )
-                break
-
-        end_date = get_datetime(
-            this_game['liveData']['plays']['allPlays'][-1]['about']['endTime']
-        )
-
+    start_date, end_date = get_start_end_dates(this_game)
     if start_date:
         game_str = '{:04d}-{:02d}-{:02d}-{}-{}{}'.format(
             int(start_date.astimezone(timezone('America/New_York')).year),
@@ -530,6 +838,13 @@ def initialize_game(this_game, attendance_str, temperature_str, weather_str,
     game_obj.start_date = start_date
     game_obj.end_date = end_date
 
+    set_game_info(game_obj, attendance_str, temperature_str, weather_str,
+                  start_datetime_str)
+
+    return game_obj
+
+def set_game_info(game_obj, attendance_str, temperature_str, weather_str,
+                  start_datetime_str):
     if attendance_str:
         game_obj.attendance = int(attendance_str)
 
@@ -542,11 +857,8 @@ def initialize_game(this_game, attendance_str, temperature_str, weather_str,
     if start_datetime_str:
         game_obj.expected_start_datetime = get_datetime(start_datetime_str)
 
-    return game_obj
-
-def get_game_obj(game_dict, is_doubleheader=False):
-    game = initialize_game(
-        game_dict,
+def get_game_info_tuple(game_dict):
+    return (
         game_dict.get('gameData', {}).get('gameInfo', {}).get(
             'attendance', ''),
         game_dict.get('gameData', {}).get('weather', {}).get(
@@ -557,27 +869,219 @@ def get_game_obj(game_dict, is_doubleheader=False):
             'dateTime', '')
     )
 
-    game.is_doubleheader = is_doubleheader
-    inning_dict_list = get_inning_dict_list(game_dict)
-    set_game_inning_list(inning_dict_list, game)
-    set_pitcher_wls_codes(game_dict, game)
+def get_play_key(play_dict):
+    return play_dict['about']['inning'], play_dict['about']['halfInning']
+
+def get_next_play_key(play_key):
+    if play_key is None:
+        return 1, 'top'
+
+    inning_num, inning_half_str = play_key
+    if inning_half_str == 'top':
+        return inning_num, 'bottom'
+
+    return inning_num + 1, 'top'
+
+def play_keys_are_sequential(play_dict_list):
+    play_key = None
+    for play_dict in play_dict_list:
+        this_play_key = get_play_key(play_dict)
+        if this_play_key not in (play_key, get_next_play_key(play_key)):
+            return False
+
+        play_key = this_play_key
+
+    return True
+
+def get_complete_play_count(play_dict_list):
+    for i, play_dict in enumerate(play_dict_list):
+        if not play_dict['about'].get('isComplete', True):
+            return i
+
+    return len(play_dict_list)
+
+def play_has_actions(play_dict):
+    return any(event['type'] == 'action' for event in play_dict['playEvents'])
+
+def get_pending_play_tuple(game_obj):
+    if not game_obj.inning_list:
+        return 0, 0, 0
+
+    last_inning = game_obj.inning_list[-1]
+
+    return (len(game_obj.inning_list),
+            len(last_inning.top_half_appearance_list),
+            len(last_inning.bottom_half_appearance_list or []))
+
+def set_play_state(game_obj, play_dict_list):
+    game_obj.play_count = None
+    game_obj.pending_play_tuple = None
+    complete_play_count = get_complete_play_count(play_dict_list)
+    if not play_keys_are_sequential(play_dict_list):
+        return
+
+    if complete_play_count == len(play_dict_list):
+        game_obj.play_count = complete_play_count
+        return
+
+    pending_play_dict = play_dict_list[-1]
+    if (complete_play_count < len(play_dict_list) - 1 or
+            play_has_actions(pending_play_dict)):
+        return
+
+    (inning_count,
+     top_count,
+     bottom_count) = get_pending_play_tuple(game_obj)
+
+    pending_play_key = get_play_key(pending_play_dict)
+    if (not complete_play_count or
+            get_play_key(play_dict_list[-2]) != pending_play_key):
+        if pending_play_key[1] == 'top':
+            inning_count -= 1
+            top_count = 0
+            bottom_count = 0
+            if inning_count:
+                previous_inning = game_obj.inning_list[inning_count - 1]
+                top_count = len(previous_inning.top_half_appearance_list)
+                bottom_count = len(
+                    previous_inning.bottom_half_appearance_list or []
+                )
+        else:
+            bottom_count = 0
+    elif pending_play_dict['result'].get('event') != 'Game Advisory':
+        if pending_play_key[1] == 'top':
+            top_count -= 1
+        else:
+            bottom_count -= 1
 
-    if game.home_team.batting_order_list_list[0] is None:
-        game.home_team.batting_order_list_list = [[]] * 9
+    game_obj.play_count = complete_play_count
+    game_obj.pending_play_tuple = (inning_count, top_count, bottom_count)
 
-    if game.away_team.batting_order_list_list[0] is None:
-        game.away_team.batting_order_list_list = [[]] * 9
+def get_half_appearance_list(inning_obj, inning_half_str):
+    if inning_half_str == 'top':
+        return inning_obj.top_half_appearance_list
 
-    game.set_batting_box_score_dict()
-    game.set_pitching_box_score_dict()
-    game.set_team_stats()
-    game.set_gametimes()
+    return inning_obj.bottom_half_appearance_list
+
+def remove_pending_play(game_obj):
+    inning_count, top_count, bottom_count = game_obj.pending_play_tuple
+    del game_obj.inning_list[inning_count:]
+    if game_obj.inning_list:
+        last_inning = game_obj.inning_list[-1]
+        del last_inning.top_half_appearance_list[top_count:]
+        if last_inning.bottom_half_appearance_list:
+            del last_inning.bottom_half_appearance_list[bottom_count:]
+
+        last_inning.reset_half_inning_stats()
+
+    game_obj.pending_play_tuple = None
+
+def apply_play(game_obj, play_dict, previous_play_key):
+    play_key = get_play_key(play_dict)
+    inning_num, inning_half_str = play_key
+    if play_key != previous_play_key:
+        plate_appearance_list = process_half_inning([], inning_half_str,
+                                                    game_obj, inning_num)
+
+        if inning_half_str == 'top':
+            game_obj.inning_list.append(Inning(plate_appearance_list, []))
+        else:
+            game_obj.inning_list[-1].bottom_half_appearance_list = (
+                plate_appearance_list
+            )
+
+    plate_appearance_list = get_half_appearance_list(game_obj.inning_list[-1],
+                                                     inning_half_str)
+
+    append_plate_appearance(play_dict, plate_appearance_list, inning_half_str,
+                            inning_num, game_obj)
+
+    return play_key
+
+def update_game_obj(game_obj, game_dict):
+    play_dict_list = game_dict['liveData']['plays'].get('allPlays', [])
+    play_count = getattr(game_obj, 'play_count', None)
+    if play_count is None:
+        return None
+
+    if game_obj.pending_play_tuple:
+        min_play_count = play_count + 1
+    else:
+        min_play_count = play_count
+
+    if (len(play_dict_list) < min_play_count or
+            get_start_end_dates(game_dict)[0] != game_obj.start_date or
+            not play_keys_are_sequential(play_dict_list)):
+        return None
+
+    complete_play_count = get_complete_play_count(play_dict_list)
+    if (complete_play_count < play_count or
+            complete_play_count < len(play_dict_list) - 1 or
+            (complete_play_count < len(play_dict_list) and
+             play_has_actions(play_dict_list[-1]))):
+        return None
+
+    teams_dict = game_dict['liveData']['boxscore']['teams']
+    update_player_season_stats(teams_dict['away'], game_obj.away_team)
+    update_player_season_stats(teams_dict['home'], game_obj.home_team)
+
+    if game_obj.pending_play_tuple:
+        remove_pending_play(game_obj)
+
+    game_obj.start_datetime = None
+    game_obj.end_datetime = None
+    play_key = None
+    if play_count:
+        play_key = get_play_key(play_dict_list[play_count - 1])
+
+    touched_key_set = set()
+    for play_dict in play_dict_list[play_count:complete_play_count]:
+        play_key = apply_play(game_obj, play_dict, play_key)
+        touched_key_set.add(play_key)
+
+    pending_play_tuple = None
+    if complete_play_count < len(play_dict_list):
+        pending_play_tuple = get_pending_play_tuple(game_obj)
+        touched_key_set.add(apply_play(game_obj, play_dict_list[-1], play_key))
+
+    for inning_num, inning_half_str in touched_key_set:
+        inning_obj = game_obj.inning_list[inning_num - 1]
+        plate_appearance_list = get_half_appearance_list(inning_obj,
+                                                         inning_half_str)
+
+        set_extra_innings_runner(plate_appearance_list, inning_half_str,
+                                 inning_num, game_obj)
 
+        inning_obj.reset_half_inning_stats()
+
+    set_pitcher_wls_codes(game_dict, game_obj)
+
+    game_obj.end_date = get_start_end_dates(game_dict)[1]
+    game_obj.attendance = None
+    game_obj.temp = None
+    game_obj.weather = None
+    game_obj.expected_start_datetime = None
+    set_game_info(game_obj, *get_game_info_tuple(game_dict))
+
+    if not set_official_box_scores(game_obj, game_dict):
+        game_obj.update_stats(touched_key_set)
+
+    game_obj.set_gametimes()
+    set_game_flags(game_obj, game_dict)
+    game_obj.play_count = complete_play_count
+    game_obj.pending_play_tuple = pending_play_tuple
+
+    return game_obj
+
+def set_game_flags(game, game_dict):
     est_time = (game.start_datetime if game.start_datetime
                 else game.expected_start_datetime).astimezone(
                     timezone('America/New_York')
                 )
 
+    game.is_postponed = False
+    game.is_suspended = False
+    game.is_today = True
     if ('Postponed' in game_dict.get('gameData', {}).get('status', {}).get(
             'detailedState', {}) or
             (est_time.hour == 23 and est_time.minute == 33)):
@@ -587,4 +1091,31 @@ def get_game_obj(game_dict, is_doubleheader=False):
             'detailedState', {})):
         game.is_suspended = True
 
+def get_game_obj(game_dict, is_doubleheader=False):
+    game = initialize_game(game_dict, *get_game_info_tuple(game_dict))
+    game.is_doubleheader = is_doubleheader
+    inning_dict_list = get_inning_dict_list(game_dict)
+    set_game_inning_list(inning_dict_list, game)
+    set_pitcher_wls_codes(game_dict, game)
+
+    if game.home_team.batting_order_list_list[0] is None:
+        game.home_team.batting_order_list_list = [[]] * 9
+
+    if game.away_team.batting_order_list_list[0] is None:
+        game.away_team.batting_order_list_list = [[]] * 9
+
+    if not set_official_box_scores(game, game_dict) and not game.lazy_stats:
+        game.set_batting_box_score_dict()
+        game.set_pitching_box_score_dict()
+        game.set_team_stats()
+
+    game.set_gametimes()
+    set_game_flags(game, game_dict)
+
+    if (game.home_team.batting_order_list_list[0] and
+            game.away_team.batting_order_list_list[0]):
+        set_play_state(
+            game, game_dict['liveData']['plays'].get('allPlays', [])
+        )
+
     return game
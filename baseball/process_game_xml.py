@@ -14,11 +14,14 @@ from baseball.baseball import (POSITION_CODE_DICT,
 
 from baseball.baseball_events import (AUTOMATIC_BALL_POSITION,
                                       Pitch,
+                                      PitchRecord,
                                       Pickoff,
                                       RunnerAdvance,
                                       Substitution,
                                       Switch)
 
+from baseball.decoders import xml_iterparse
+
 MLB_TEAM_CODE_DICT = {'LAA': 'ana',
                       'SEA': 'sea',
                       'BAL': 'bal',
@@ -116,7 +119,7 @@ def get_datetime(tfs_zulu_str):
 
     return event_datetime
 
-def process_pitch(event):
+def get_pitch_field_tuple(event):
     pitch_description = event.get('des')
     pitch_type = event.get('pitch_type')
     pitch_datetime = get_datetime(event.get('tfs_zulu'))
@@ -137,11 +140,14 @@ def process_pitch(event):
     else:
         pitch_speed = None
 
-    pitch_obj = Pitch(pitch_datetime,
-                      pitch_description,
-                      pitch_type,
-                      pitch_speed,
-                      pitch_position)
+    return (pitch_datetime,
+            pitch_description,
+            pitch_type,
+            pitch_speed,
+            pitch_position)
+
+def process_pitch(event):
+    pitch_obj = Pitch(*get_pitch_field_tuple(event))
 
     return pitch_obj
 
@@ -165,12 +171,10 @@ def process_pickoff(event):
 
 def process_runner_advance(event, game_obj):
     runner_id = int(event.get('id'))
+    runner = (game_obj.away_team.find_player(runner_id) or
+              game_obj.home_team.find_player(runner_id))
 
-    if runner_id in game_obj.away_team:
-        runner = game_obj.away_team[runner_id]
-    elif runner_id in game_obj.home_team:
-        runner = game_obj.home_team[runner_id]
-    else:
+    if not runner:
         raise ValueError('Runner ID not in player dict')
 
     start_base = event.get('start')
@@ -963,6 +967,58 @@ def set_starting_pitchers(game, away_starting_pitcher_id,
         )
     )
 
+def get_inning_xml_generator(inning_filehandle):
+    root = None
+    depth = 0
+    for event, element in xml_iterparse(inning_filehandle, ('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 1:
+                yield element
+                root.clear()
+
+def get_player_name_dict(team_xml):
+    player_name_dict = {}
+    for this_team_xml in team_xml:
+        if this_team_xml.tag == 'team':
+            for player_xml in this_team_xml:
+                if player_xml.tag == 'player' and player_xml.get('id'):
+                    player_id = int(player_xml.get('id'))
+                    player_name_dict[player_id] = '{} {}'.format(
+                        player_xml.get('first'),
+                        player_xml.get('last')
+                    )
+
+    return player_name_dict
+
+def get_pitch_record_generator(game_id, team_xml, game_xml):
+    player_name_dict = get_player_name_dict(team_xml)
+    for inning_num, inning_xml in enumerate(game_xml, 1):
+        for inning_half_str, half_inning_xml in zip(('top', 'bottom'),
+                                                    inning_xml):
+            for event_container in half_inning_xml:
+                if (event_container.tag == 'atbat' and
+                        event_container.get('des')):
+                    pitcher_id = int(event_container.get('pitcher'))
+                    batter_id = int(event_container.get('batter'))
+                    for event in event_container:
+                        if event.tag == 'pitch':
+                            yield PitchRecord(
+                                game_id,
+                                inning_num,
+                                inning_half_str,
+                                pitcher_id,
+                                player_name_dict.get(pitcher_id),
+                                batter_id,
+                                player_name_dict.get(batter_id),
+                                *get_pitch_field_tuple(event)
+                            )
+
 def get_game_obj(boxscore_xml, team_xml, game_xml):
     (game,
      away_pitcher_status_dict,
@@ -988,9 +1044,11 @@ def get_game_obj(boxscore_xml, team_xml, game_xml):
                               away_pitcher_status_dict,
                               home_pitcher_status_dict)
 
-        game.set_batting_box_score_dict()
-        game.set_pitching_box_score_dict()
-        game.set_team_stats()
+        if not game.lazy_stats:
+            game.set_batting_box_score_dict()
+            game.set_pitching_box_score_dict()
+            game.set_team_stats()
+
         game.set_gametimes()
 
     return game
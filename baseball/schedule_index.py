@@ -0,0 +1,188 @@
+from calendar import monthrange
+from datetime import date, timedelta
+from json import dumps, loads
+from os import environ, makedirs, replace
+from os.path import abspath, dirname, exists
+from time import time
+
+from dateutil.parser import parse
+
+from baseball.fetch_http import get_json
+
+SCHEDULE_URL = ('http://statsapi.mlb.com/api/v1/schedule?sportId=1&'
+                'hydrate=team&startDate={start_date}&endDate={end_date}')
+
+SCHEDULE_CURRENT_TTL_SECONDS = 600
+
+SCHEDULE_INDEX_PATH_DICT = {
+    'index_path': environ.get('BASEBALL_SCHEDULE_INDEX_PATH')
+}
+
+SCHEDULE_INDEX_DICT = {}
+
+def set_schedule_index_path(index_path):
+    SCHEDULE_INDEX_PATH_DICT['index_path'] = (
+        abspath(index_path) if index_path else None
+    )
+
+def get_index_date_str(this_datetime):
+    return '{:04d}-{:02d}-{:02d}'.format(this_datetime.year,
+                                         this_datetime.month,
+                                         this_datetime.day)
+
+def get_schedule_key(date_str, away_code, home_code, game_number):
+    return '-'.join([date_str, away_code, home_code, str(int(game_number))])
+
+def load_schedule_index(index_path=None):
+    index_path = index_path or SCHEDULE_INDEX_PATH_DICT['index_path']
+    if index_path and exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as filehandle:
+            schedule_index = loads(filehandle.read())
+    else:
+        schedule_index = SCHEDULE_INDEX_DICT.get(
+            index_path, {'date_list': [], 'game_pk_dict': {}}
+        )
+
+    SCHEDULE_INDEX_DICT[index_path] = schedule_index
+
+    return schedule_index
+
+def write_schedule_index(schedule_index, index_path=None):
+    index_path = index_path or SCHEDULE_INDEX_PATH_DICT['index_path']
+    SCHEDULE_INDEX_DICT[index_path] = schedule_index
+    if not index_path:
+        return
+
+    if dirname(index_path) and not exists(dirname(index_path)):
+        makedirs(dirname(index_path))
+
+    temp_path = index_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as filehandle:
+        filehandle.write(dumps(schedule_index, sort_keys=True))
+
+    replace(temp_path, index_path)
+
+def get_schedule_index(index_path=None):
+    index_path = index_path or SCHEDULE_INDEX_PATH_DICT['index_path']
+    schedule_index = SCHEDULE_INDEX_DICT.get(index_path)
+    if schedule_index is None:
+        schedule_index = load_schedule_index(index_path)
+
+    return schedule_index
+
+def update_schedule_index(start_date_str, end_date_str,
+                          index_path=None):
+    index_path = index_path or SCHEDULE_INDEX_PATH_DICT['index_path']
+    start_date = get_index_date_str(parse(start_date_str))
+    end_date = get_index_date_str(parse(end_date_str))
+    schedule_dict = get_json(SCHEDULE_URL.format(start_date=start_date,
+                                                 end_date=end_date))
+
+    schedule_index = load_schedule_index(index_path)
+    date_set = set(schedule_index['date_list'])
+    game_pk_dict = schedule_index['game_pk_dict']
+
+    for date_dict in schedule_dict.get('dates', []):
+        for game_dict in date_dict.get('games', []):
+            away_code = game_dict['teams']['away']['team'].get('abbreviation')
+            home_code = game_dict['teams']['home']['team'].get('abbreviation')
+            if away_code and home_code:
+                schedule_key = get_schedule_key(date_dict['date'],
+                                                away_code,
+                                                home_code,
+                                                game_dict.get('gameNumber', 1))
+
+                game_pk_dict[schedule_key] = game_dict['gamePk']
+
+    fetch_time_dict = schedule_index.setdefault('fetch_time_dict', {})
+    fetch_time = time()
+    this_date = parse(start_date)
+    while get_index_date_str(this_date) <= end_date:
+        if this_date.date() < date.today():
+            date_set.add(get_index_date_str(this_date))
+            fetch_time_dict.pop(get_index_date_str(this_date), None)
+        else:
+            fetch_time_dict[get_index_date_str(this_date)] = fetch_time
+
+        this_date += timedelta(days=1)
+
+    schedule_index['date_list'] = sorted(date_set)
+    write_schedule_index(schedule_index, index_path)
+
+    return schedule_index
+
+def date_is_indexed(schedule_index, date_str, date_set):
+    if date_str in date_set:
+        return True
+
+    fetch_time = schedule_index.get('fetch_time_dict', {}).get(date_str)
+
+    return (fetch_time is not None and
+            time() - fetch_time < SCHEDULE_CURRENT_TTL_SECONDS)
+
+def get_missing_date_list(schedule_index, start_date_str, end_date_str):
+    date_set = set(schedule_index['date_list'])
+    missing_date_list = []
+    this_date = parse(start_date_str)
+    while get_index_date_str(this_date) <= end_date_str:
+        if not date_is_indexed(schedule_index, get_index_date_str(this_date),
+                               date_set):
+            missing_date_list.append(get_index_date_str(this_date))
+
+        this_date += timedelta(days=1)
+
+    return missing_date_list
+
+def fill_schedule_index(start_date_str, end_date_str, index_path=None):
+    index_path = index_path or SCHEDULE_INDEX_PATH_DICT['index_path']
+    schedule_index = get_schedule_index(index_path)
+    missing_date_list = get_missing_date_list(
+        schedule_index,
+        get_index_date_str(parse(start_date_str)),
+        get_index_date_str(parse(end_date_str))
+    )
+
+    if missing_date_list:
+        schedule_index = update_schedule_index(missing_date_list[0],
+                                               missing_date_list[-1],
+                                               index_path)
+
+    return schedule_index
+
+def get_schedule_month_range(this_datetime):
+    start_date_str = '{:04d}-{:02d}-01'.format(this_datetime.year,
+                                               this_datetime.month)
+
+    if this_datetime.date() >= date.today():
+        return start_date_str, get_index_date_str(this_datetime)
+
+    return start_date_str, '{:04d}-{:02d}-{:02d}'.format(
+        this_datetime.year,
+        this_datetime.month,
+        monthrange(this_datetime.year, this_datetime.month)[1]
+    )
+
+def get_schedule_game_pk(this_datetime, away_code, home_code, game_number,
+                         index_path=None):
+    index_path = index_path or SCHEDULE_INDEX_PATH_DICT['index_path']
+    date_str = get_index_date_str(this_datetime)
+    schedule_index = get_schedule_index(index_path)
+    if not date_is_indexed(schedule_index, date_str,
+                           schedule_index['date_list']):
+        schedule_index = fill_schedule_index(
+            *get_schedule_month_range(this_datetime),
+            index_path=index_path
+        )
+
+    schedule_key = get_schedule_key(date_str, away_code, home_code,
+                                    game_number)
+
+    game_pk = schedule_index['game_pk_dict'].get(schedule_key)
+    is_doubleheader = any(
+        get_schedule_key(date_str, away_code, home_code, this_game_number) in
+        schedule_index['game_pk_dict']
+        for this_game_number in (1, 2)
+        if this_game_number != int(game_number)
+    )
+
+    return game_pk, is_doubleheader
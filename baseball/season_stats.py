@@ -0,0 +1,284 @@
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+from multiprocessing import cpu_count
+from sys import exc_info
+from traceback import format_exception
+
+from baseball.fetch_game import (get_chunksize, get_filename_list,
+                                 get_game_result_from_filename_tuple,
+                                 get_process_pool)
+from baseball.stats import (TeamBoxScore, get_inning_half_list,
+                            get_pitcher_rate_tuple)
+
+BATTING_COUNT_FIELD_LIST = ['G', 'AB', 'R', 'H', 'B2', 'B3', 'HR', 'RBI',
+                            'BB', 'HBP', 'SF', 'SO', 'LOB']
+
+PITCHING_COUNT_FIELD_LIST = ['G', 'OUTS', 'W', 'L', 'SV', 'BF', 'H', 'R',
+                             'ER', 'SO', 'BB', 'IBB', 'HBP', 'BLK', 'WP',
+                             'HR', 'S', 'P']
+
+BATTER_EXTRA_SUMMARY_DICT = {'Double': 0,
+                             'Triple': 1,
+                             'Home Run': 2,
+                             'Hit By Pitch': 3,
+                             'Sac Fly': 4,
+                             'Sac Fly Double Play': 4}
+
+TEAM_COUNT_FIELD_LIST = (['G', 'W', 'L', 'RS', 'RA', 'AB', 'H', 'BB', 'SO',
+                          'LOB'] +
+                         list(TeamBoxScore._fields))
+
+SeasonBattingLine = namedtuple(
+    'SeasonBattingLine',
+    ['name', 'team'] + BATTING_COUNT_FIELD_LIST + ['AVG', 'OBP', 'SLG']
+)
+
+SeasonPitchingLine = namedtuple(
+    'SeasonPitchingLine',
+    (['name', 'team', 'G', 'IP'] + PITCHING_COUNT_FIELD_LIST[2:] +
+     ['ERA', 'WHIP'])
+)
+
+SeasonTeamLine = namedtuple(
+    'SeasonTeamLine',
+    TEAM_COUNT_FIELD_LIST + ['AVG', 'OBP']
+)
+
+SeasonStats = namedtuple('SeasonStats', 'batting pitching team')
+
+def get_rate(numerator, denominator):
+    if not denominator:
+        return 0.0
+
+    return round(float(numerator) / denominator, 3)
+
+def get_innings_pitched_outs(innings_pitched):
+    whole_innings, partial_innings = divmod(round(innings_pitched * 10), 10)
+
+    return whole_innings * 3 + partial_innings
+
+def get_batter_extra_dict(game, inning_half_str):
+    extra_dict = {}
+    for inning_half in get_inning_half_list(game, inning_half_str):
+        for plate_appearance in inning_half:
+            extra_list = extra_dict.setdefault(plate_appearance.batter,
+                                               [0] * 5)
+
+            extra_index = BATTER_EXTRA_SUMMARY_DICT.get(
+                plate_appearance.plate_appearance_summary
+            )
+
+            if extra_index is not None:
+                extra_list[extra_index] += 1
+
+    return extra_dict
+
+def get_game_season_partial(game):
+    partial_dict = {'batting': {}, 'pitching': {}, 'team': {}}
+    away_runs = game.away_batter_box_score_dict['TOTAL'].R
+    home_runs = game.home_batter_box_score_dict['TOTAL'].R
+    for (team, batting_half_str, batter_box_score_dict,
+         pitcher_box_score_dict, team_stats, runs_scored,
+         runs_allowed) in [
+             (game.away_team, 'top', game.away_batter_box_score_dict,
+              game.away_pitcher_box_score_dict, game.away_team_stats,
+              away_runs, home_runs),
+             (game.home_team, 'bottom', game.home_batter_box_score_dict,
+              game.home_pitcher_box_score_dict, game.home_team_stats,
+              home_runs, away_runs)]:
+        extra_dict = get_batter_extra_dict(game, batting_half_str)
+        for batter, box_score in batter_box_score_dict.items():
+            if batter == 'TOTAL':
+                continue
+
+            num_doubles, num_triples, num_hr, num_hbp, num_sf = (
+                extra_dict.get(batter, [0] * 5)
+            )
+
+            partial_dict['batting'][batter.mlb_id] = (
+                batter.full_name(),
+                team.abbreviation,
+                (1, box_score.AB, box_score.R, box_score.H, num_doubles,
+                 num_triples, num_hr, box_score.RBI, box_score.BB, num_hbp,
+                 num_sf, box_score.SO, box_score.LOB)
+            )
+
+        for pitcher, box_score in pitcher_box_score_dict.items():
+            partial_dict['pitching'][pitcher.mlb_id] = (
+                pitcher.full_name(),
+                team.abbreviation,
+                (1, get_innings_pitched_outs(box_score.IP),
+                 int(box_score.WLS == 'W'), int(box_score.WLS == 'L'),
+                 int(box_score.WLS == 'S'), box_score.BF, box_score.H,
+                 box_score.R, box_score.ER, box_score.SO, box_score.BB,
+                 box_score.IBB, box_score.HBP, box_score.BLK, box_score.WP,
+                 box_score.HR, box_score.S, box_score.P)
+            )
+
+        total_box_score = batter_box_score_dict['TOTAL']
+        partial_dict['team'][team.abbreviation] = (
+            (1, int(runs_scored > runs_allowed),
+             int(runs_scored < runs_allowed), runs_scored, runs_allowed,
+             total_box_score.AB, total_box_score.H, total_box_score.BB,
+             total_box_score.SO, total_box_score.LOB) +
+            tuple(team_stats)
+        )
+
+    return partial_dict
+
+def get_season_partial_from_filename_tuple(filename_tuple):
+    game_id, game, exception_str = get_game_result_from_filename_tuple(
+        filename_tuple
+    )
+
+    partial_dict = None
+    if game:
+        try:
+            partial_dict = get_game_season_partial(game)
+        except:
+            exc_type, exc_value, exc_traceback = exc_info()
+            lines = format_exception(exc_type, exc_value, exc_traceback)
+            exception_str = ' '.join(lines)
+
+    return game_id, partial_dict, exception_str
+
+def add_count_tuple(count_list, count_tuple):
+    if count_list is None:
+        return list(count_tuple)
+
+    for index, count in enumerate(count_tuple):
+        count_list[index] += count
+
+    return count_list
+
+def merge_season_partial(season_dict, partial_dict):
+    for stat_str in ['batting', 'pitching']:
+        for player_id, (name, team, count_tuple) in (
+                partial_dict[stat_str].items()):
+            player_name, team_set, count_list = season_dict[stat_str].get(
+                player_id, (name, set(), None)
+            )
+
+            team_set.add(team)
+            season_dict[stat_str][player_id] = (
+                player_name, team_set, add_count_tuple(count_list, count_tuple)
+            )
+
+    for team, count_tuple in partial_dict['team'].items():
+        season_dict['team'][team] = add_count_tuple(
+            season_dict['team'].get(team), count_tuple
+        )
+
+    return season_dict
+
+def get_season_batting_line(name, team_set, count_list):
+    count_dict = dict(zip(BATTING_COUNT_FIELD_LIST, count_list))
+    num_singles = (count_dict['H'] - count_dict['B2'] - count_dict['B3'] -
+                   count_dict['HR'])
+
+    total_bases = (num_singles + 2 * count_dict['B2'] +
+                   3 * count_dict['B3'] + 4 * count_dict['HR'])
+
+    return SeasonBattingLine(
+        name,
+        '/'.join(sorted(team_set)),
+        *count_list,
+        get_rate(count_dict['H'], count_dict['AB']),
+        get_rate(count_dict['H'] + count_dict['BB'] + count_dict['HBP'],
+                 (count_dict['AB'] + count_dict['BB'] + count_dict['HBP'] +
+                  count_dict['SF'])),
+        get_rate(total_bases, count_dict['AB'])
+    )
+
+def get_season_pitching_line(name, team_set, count_list):
+    count_dict = dict(zip(PITCHING_COUNT_FIELD_LIST, count_list))
+    whole_innings, partial_innings = divmod(count_dict['OUTS'], 3)
+    innings_pitched = whole_innings + partial_innings / 10
+    era, whip = get_pitcher_rate_tuple(innings_pitched, count_dict['ER'],
+                                       count_dict['H'], count_dict['BB'])
+
+    return SeasonPitchingLine(
+        name,
+        '/'.join(sorted(team_set)),
+        count_dict['G'],
+        innings_pitched,
+        *count_list[2:],
+        era,
+        whip
+    )
+
+def get_season_team_line(count_list):
+    count_dict = dict(zip(TEAM_COUNT_FIELD_LIST, count_list))
+
+    return SeasonTeamLine(
+        *count_list,
+        get_rate(count_dict['H'], count_dict['AB']),
+        get_rate(count_dict['H'] + count_dict['BB'] + count_dict['HBP'],
+                 (count_dict['AB'] + count_dict['BB'] + count_dict['HBP'] +
+                  count_dict['SF']))
+    )
+
+def get_season_stats(season_dict):
+    return SeasonStats(
+        OrderedDict(
+            (player_id, get_season_batting_line(*season_dict['batting'][
+                player_id
+            ]))
+            for player_id in sorted(season_dict['batting'], key=str)
+        ),
+        OrderedDict(
+            (player_id, get_season_pitching_line(*season_dict['pitching'][
+                player_id
+            ]))
+            for player_id in sorted(season_dict['pitching'], key=str)
+        ),
+        OrderedDict(
+            (team, get_season_team_line(season_dict['team'][team]))
+            for team in sorted(season_dict['team'])
+        )
+    )
+
+def get_season_stats_from_game_list(game_list):
+    season_dict = {'batting': {}, 'pitching': {}, 'team': {}}
+    for game in game_list:
+        merge_season_partial(season_dict, get_game_season_partial(game))
+
+    return get_season_stats(season_dict)
+
+def get_season_partial_result_generator(filename_list, num_processes,
+                                        chunksize):
+    if num_processes > 1 and len(filename_list) > 1:
+        chunksize = chunksize or get_chunksize(len(filename_list),
+                                               num_processes)
+
+        with get_process_pool(
+                min(num_processes, len(filename_list))
+        ) as process_pool:
+            yield from process_pool.imap_unordered(
+                get_season_partial_from_filename_tuple,
+                filename_list,
+                chunksize
+            )
+    else:
+        for filename_tuple in filename_list:
+            yield get_season_partial_from_filename_tuple(filename_tuple)
+
+def get_season_stats_from_file_range(start_date_str, end_date_str, input_dir,
+                                     num_processes=None, chunksize=None,
+                                     team=None, opponent=None,
+                                     game_number=None, date_list=None):
+    filename_list = get_filename_list(start_date_str, end_date_str, input_dir,
+                                      team, opponent, game_number, date_list)
+
+    season_dict = {'batting': {}, 'pitching': {}, 'team': {}}
+    for game_id, partial_dict, exception_str in (
+            get_season_partial_result_generator(
+                filename_list, num_processes or cpu_count(), chunksize
+            )):
+        if exception_str:
+            print('{} ({}) {}'.format(datetime.utcnow(), game_id,
+                                      exception_str))
+        elif partial_dict:
+            merge_season_partial(season_dict, partial_dict)
+
+    return get_season_stats(season_dict)
@@ -1,4 +1,4 @@
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 from baseball.baseball_events import Pickoff, RunnerAdvance, Pitch
 
@@ -6,6 +6,16 @@ NOT_AT_BAT_CODE_LIST = ['SH', 'SF', 'BB', 'CI', 'FI', 'IBB', 'HBP', 'CS', 'PO']
 HIT_CODE_LIST = ['1B', '2B', '3B', 'HR']
 NON_STRIKE_LIST = ['Ball', 'Intent Ball', 'Automatic Ball', 'Ball In Dirt',
                    'Hit By Pitch']
+BASE_CODE_LIST = ['1B', '2B', '3B']
+
+GameStateTuple = namedtuple(
+    'GameStateTuple',
+    'first_base second_base third_base outs balls strikes'
+)
+
+TEAM_SUMMARY_KEYWORD_LIST = ['Single', 'Double', 'Triple', 'Home Run',
+                             'Sac Fly', 'Sac Bunt', 'Double Play',
+                             'Hit By Pitch']
 
 InningStatsTuple = namedtuple('InningStatsTuple', 'S P BB K LOB E H R')
 BatterBoxScore = namedtuple('BatterBoxScore', 'AB R H RBI BB SO LOB')
@@ -40,54 +50,193 @@ def process_pickoffs(plate_appearance, first_base, second_base, third_base):
 
     return first_base, second_base, third_base
 
-def process_baserunners(plate_appearance, last_plate_appearance,
-                        first_base, second_base, third_base):
-    first_base_list = [first_base] if first_base else []
-    second_base_list = [second_base] if second_base else []
-    third_base_list = [third_base] if third_base else []
-    for event in plate_appearance.event_list:
-        if isinstance(event, RunnerAdvance):
-            if (plate_appearance == last_plate_appearance and
-                    ('out' in event.run_description or
-                     'Out' in event.run_description)):
-                break
-            else:
-                if event.end_base == '1B':
-                    first_base_list.append(event.runner)
-                elif event.end_base == '2B':
-                    second_base_list.append(event.runner)
-                    if event.runner in first_base_list:
-                        first_base_list.remove(event.runner)
-                elif event.end_base == '3B':
-                    third_base_list.append(event.runner)
-                    if event.runner in first_base_list:
-                        first_base_list.remove(event.runner)
-                    if event.runner in second_base_list:
-                        second_base_list.remove(event.runner)
-                elif event.end_base == '' or 'score':
-                    if event.runner in first_base_list:
-                        first_base_list.remove(event.runner)
-                    if event.runner in second_base_list:
-                        second_base_list.remove(event.runner)
-                    if event.runner in third_base_list:
-                        third_base_list.remove(event.runner)
-
-    if first_base_list:
-        first_base = first_base_list[0]
+def remove_picked_off_runner(event, first_base_list, second_base_list,
+                             third_base_list):
+    if isinstance(event, Pickoff) and event.pickoff_was_successful:
+        pickoff_base = event.pickoff_base
+    elif (isinstance(event, RunnerAdvance) and
+          'Picked off stealing' in event.run_description):
+        pickoff_base = event.start_base
     else:
-        first_base = None
+        return
+
+    if pickoff_base in BASE_CODE_LIST:
+        base_list = [first_base_list, second_base_list,
+                     third_base_list][BASE_CODE_LIST.index(pickoff_base)]
+
+        del base_list[:]
+
+def move_baserunner(event, first_base_list, second_base_list,
+                    third_base_list):
+    if event.end_base == '1B':
+        first_base_list.append(event.runner)
+    elif event.end_base == '2B':
+        second_base_list.append(event.runner)
+        if event.runner in first_base_list:
+            first_base_list.remove(event.runner)
+    elif event.end_base == '3B':
+        third_base_list.append(event.runner)
+        if event.runner in first_base_list:
+            first_base_list.remove(event.runner)
+        if event.runner in second_base_list:
+            second_base_list.remove(event.runner)
+    elif event.end_base == '' or 'score':
+        if event.runner in first_base_list:
+            first_base_list.remove(event.runner)
+        if event.runner in second_base_list:
+            second_base_list.remove(event.runner)
+        if event.runner in third_base_list:
+            third_base_list.remove(event.runner)
+
+def get_base_tuple(first_base_list, second_base_list, third_base_list):
+    return tuple(base_list[0] if base_list else None
+                 for base_list in [first_base_list, second_base_list,
+                                   third_base_list])
+
+def is_inning_ending_out(event, plate_appearance, last_plate_appearance):
+    return (plate_appearance == last_plate_appearance and
+            ('out' in event.run_description or
+             'Out' in event.run_description))
+
+def get_base_count(game_state):
+    return sum(base is not None
+               for base in [game_state.first_base, game_state.second_base,
+                            game_state.third_base])
+
+def get_batter_lob_base_count(plate_appearance):
+    start_game_state = plate_appearance.start_game_state
+
+    return sum(base is not None
+               for base in process_pickoffs(plate_appearance,
+                                            start_game_state.first_base,
+                                            start_game_state.second_base,
+                                            start_game_state.third_base))
+
+def get_pitch_count(pitch, balls, strikes):
+    if 'In play' not in pitch.pitch_description:
+        if ('Strike' in pitch.pitch_description or
+                'Missed Bunt' in pitch.pitch_description or
+                'Foul Bunt' in pitch.pitch_description):
+            strikes += 1
+        elif 'Foul' in pitch.pitch_description and strikes < 2:
+            strikes += 1
+        elif 'Foul' not in pitch.pitch_description:
+            balls += 1
+
+    return balls, strikes
+
+def set_game_states(appearance_list):
+    if not appearance_list:
+        return
+
+    base_tuple = (None, None, None)
+    num_outs = 0
+    for plate_appearance in appearance_list:
+        plate_appearance.start_game_state = GameStateTuple(*base_tuple,
+                                                           num_outs, 0, 0)
 
-    if second_base_list:
-        second_base = second_base_list[0]
-    else:
-        second_base = None
+        base_list_list = [[base] if base else [] for base in base_tuple]
+        balls = 0
+        strikes = 0
+        inning_ended = False
+        for event in plate_appearance.event_list:
+            if isinstance(event, Pitch):
+                event.game_state = GameStateTuple(
+                    *get_base_tuple(*base_list_list),
+                    num_outs, balls, strikes
+                )
 
-    if third_base_list:
-        third_base = third_base_list[0]
-    else:
-        third_base = None
+                balls, strikes = get_pitch_count(event, balls, strikes)
+            else:
+                remove_picked_off_runner(event, *base_list_list)
+                if isinstance(event, RunnerAdvance) and not inning_ended:
+                    if is_inning_ending_out(event, plate_appearance,
+                                            appearance_list[-1]):
+                        inning_ended = True
+                    else:
+                        move_baserunner(event, *base_list_list)
 
-    return first_base, second_base, third_base
+        base_tuple = get_base_tuple(*base_list_list)
+        num_outs = plate_appearance.inning_outs
+        plate_appearance.end_game_state = GameStateTuple(*base_tuple,
+                                                         num_outs, balls,
+                                                         strikes)
+
+def process_half_inning_stats(appearance_list):
+    if not appearance_list:
+        return None, None
+
+    inning_stat_list = [0] * 8
+    team_stat_list = [0] * 13
+    for plate_appearance in appearance_list:
+        summary = plate_appearance.plate_appearance_summary
+        scorecard_summary = plate_appearance.scorecard_summary
+
+        if 'BB' in scorecard_summary:
+            inning_stat_list[2] += 1
+
+        if 'K' in scorecard_summary or 'ꓘ' in scorecard_summary:
+            inning_stat_list[3] += 1
+
+        if plate_appearance.error_str:
+            inning_stat_list[5] += 1
+
+        inning_stat_list[6] += sum(code in scorecard_summary
+                                   for code in HIT_CODE_LIST)
+
+        inning_stat_list[7] += len(plate_appearance.scoring_runners_list)
+
+        for index, keyword in enumerate(TEAM_SUMMARY_KEYWORD_LIST):
+            if keyword in summary:
+                team_stat_list[index] += 1
+
+        if 'DP' in summary:
+            team_stat_list[6] += 1
+
+        if summary != 'Runner Out' and summary != 'Extra Innings Runner':
+            team_stat_list[12] += 1
+
+        last_error_description = None
+        runner_list = []
+        previous_run_description = None
+        for event in plate_appearance.event_list:
+            if isinstance(event, Pitch):
+                if event.pitch_description not in NON_STRIKE_LIST:
+                    inning_stat_list[0] += 1
+
+                if event.pitch_description != 'Automatic Ball':
+                    inning_stat_list[1] += 1
+            elif isinstance(event, RunnerAdvance):
+                run_description = event.run_description
+                if ('Pickoff Error' in run_description and
+                        last_error_description != run_description):
+                    inning_stat_list[5] += 1
+                    last_error_description = run_description
+
+                if (run_description != previous_run_description or
+                        event.runner in runner_list):
+                    runner_list = [event.runner]
+                    if 'Wild Pitch' in run_description:
+                        team_stat_list[8] += 1
+
+                    if 'Passed Ball' in run_description:
+                        team_stat_list[9] += 1
+                else:
+                    runner_list.append(event.runner)
+
+                previous_run_description = run_description
+                if 'Stolen Base' in run_description:
+                    team_stat_list[10] += 1
+
+                if 'Caught Stealing' in run_description:
+                    team_stat_list[11] += 1
+
+            if not isinstance(event, RunnerAdvance):
+                last_error_description = None
+
+    inning_stat_list[4] = get_base_count(appearance_list[-1].end_game_state)
+
+    return InningStatsTuple(*inning_stat_list), TeamBoxScore(*team_stat_list)
 
 def get_inning_half_list(game, inning_half_str):
     if inning_half_str == 'top':
@@ -104,77 +253,222 @@ def get_inning_half_list(game, inning_half_str):
 
     return inning_half_list
 
-def get_half_inning_stats(top_half_appearance_list,
-                          bottom_half_appearance_list):
-    if top_half_appearance_list:
-        top_half_inning_stats = InningStatsTuple(
-            get_strikes(top_half_appearance_list),
-            get_pitches(top_half_appearance_list),
-            get_walks(top_half_appearance_list),
-            get_strikeouts(top_half_appearance_list),
-            get_lob(top_half_appearance_list),
-            get_errors(top_half_appearance_list),
-            get_hits(top_half_appearance_list),
-            get_runs(top_half_appearance_list)
-        )
-    else:
-        top_half_inning_stats = None
-
-    if bottom_half_appearance_list:
-        bottom_half_inning_stats = InningStatsTuple(
-            get_strikes(bottom_half_appearance_list),
-            get_pitches(bottom_half_appearance_list),
-            get_walks(bottom_half_appearance_list),
-            get_strikeouts(bottom_half_appearance_list),
-            get_lob(bottom_half_appearance_list),
-            get_errors(bottom_half_appearance_list),
-            get_hits(bottom_half_appearance_list),
-            get_runs(bottom_half_appearance_list)
-        )
-    else:
-        bottom_half_inning_stats = None
+def count_unique_run_descriptions(plate_appearance, run_description):
+    num_descriptions = 0
+    last_description = None
+
+    for event in plate_appearance.event_list:
+        if isinstance(event, RunnerAdvance):
+            if (event.run_description == run_description and
+                    last_description != event.run_description):
+                num_descriptions += 1
+                last_description = event.run_description
+        else:
+            last_description = None
+
+    return num_descriptions
+
+def add_batter_stats(stat_dict, inning_half):
+    for plate_appearance in inning_half:
+        scorecard_summary = plate_appearance.scorecard_summary
+        is_hit = plate_appearance_is_hit(plate_appearance)
+        at_bat = is_at_bat(plate_appearance)
+        stat_list = stat_dict.setdefault(plate_appearance.batter, [0] * 7)
+
+        if at_bat:
+            stat_list[0] += 1
+
+        for runner in set(plate_appearance.scoring_runners_list):
+            stat_dict.setdefault(runner, [0] * 7)[1] += 1
+
+        if is_hit:
+            stat_list[2] += 1
+
+        stat_list[3] += len(plate_appearance.runners_batted_in_list)
+
+        if 'BB' in scorecard_summary:
+            stat_list[4] += 1
+
+        if 'K' in scorecard_summary or 'ꓘ' in scorecard_summary:
+            stat_list[5] += 1
+
+        if (at_bat and not is_hit and
+                'BB' not in scorecard_summary and
+                'HBP' not in scorecard_summary):
+            stat_list[6] += (
+                get_batter_lob_base_count(plate_appearance) -
+                len(plate_appearance.scoring_runners_list)
+            )
+
+def get_stat_list(stat_dict_list, player, num_stats):
+    stat_list = [0] * num_stats
+    for stat_dict in stat_dict_list:
+        for index, stat in enumerate(stat_dict.get(player, ())):
+            stat_list[index] += stat
+
+    return stat_list
+
+def get_batter_box_score_dict_from_stats(team, stat_dict_list,
+                                         box_score_dict=None,
+                                         player_set=None):
+    new_box_score_dict = OrderedDict([])
+    for batting_order_list in team.batting_order_list_list:
+        for batter_appearance in batting_order_list:
+            batter = batter_appearance.player_obj
+            if batter in new_box_score_dict:
+                continue
+
+            if (player_set is not None and batter in box_score_dict and
+                    batter not in player_set):
+                new_box_score_dict[batter] = box_score_dict[batter]
+            else:
+                new_box_score_dict[batter] = BatterBoxScore(
+                    *get_stat_list(stat_dict_list, batter, 7)
+                )
+
+    return new_box_score_dict
+
+def get_batter_box_score_dict(game, team, inning_half_str):
+    stat_dict = {}
+    for inning_half in get_inning_half_list(game, inning_half_str):
+        add_batter_stats(stat_dict, inning_half)
+
+    return get_batter_box_score_dict_from_stats(team, [stat_dict])
+
+def add_pitcher_stats(stat_dict, inning_half):
+    if not inning_half:
+        return
+
+    inning_start_pitcher = inning_half[0].pitcher
+    pitcher_change_flag = False
+    num_outs = 0
+
+    for plate_appearance in inning_half:
+        pitcher = plate_appearance.pitcher
+        summary = plate_appearance.plate_appearance_summary
+        scorecard_summary = plate_appearance.scorecard_summary
+        stat_list = stat_dict.setdefault(pitcher, [0] * 14)
+        start_stat_list = stat_dict.setdefault(inning_start_pitcher,
+                                               [0] * 14)
+
+        stat_list[0] += max(0, plate_appearance.inning_outs - num_outs)
+        num_outs = plate_appearance.inning_outs
+
+        if 'CS' not in scorecard_summary and 'PO' not in scorecard_summary:
+            stat_list[1] += 1
+
+        if plate_appearance_is_hit(plate_appearance):
+            stat_list[2] += 1
+
+        if pitcher != inning_start_pitcher and not pitcher_change_flag:
+            pitcher_change_flag = True
+            run_baserunner_count = get_base_count(
+                plate_appearance.start_game_state
+            )
+
+            earned_run_baserunner_count = run_baserunner_count
+
+        for event in plate_appearance.event_list:
+            if isinstance(event, RunnerAdvance) and event.runner_scored:
+                if pitcher_change_flag and run_baserunner_count:
+                    run_baserunner_count -= 1
+                    if pitcher != inning_start_pitcher:
+                        start_stat_list[3] += 1
+                else:
+                    stat_list[3] += 1
+
+                if event.run_earned:
+                    if (pitcher_change_flag and
+                            earned_run_baserunner_count):
+                        earned_run_baserunner_count -= 1
+                        if pitcher != inning_start_pitcher:
+                            start_stat_list[4] += 1
+                    else:
+                        stat_list[4] += 1
+
+        if 'Strikeout' in summary:
+            stat_list[5] += 1
+
+        if summary == 'Walk':
+            stat_list[6] += 1
+        elif summary == 'Intent Walk':
+            stat_list[7] += 1
+        elif summary == 'Hit By Pitch':
+            stat_list[8] += 1
+
+        stat_list[9] += count_unique_run_descriptions(plate_appearance,
+                                                      'Balk')
+
+        stat_list[10] += count_unique_run_descriptions(plate_appearance,
+                                                       'Wild Pitch')
+
+        if scorecard_summary == 'HR':
+            stat_list[11] += 1
+
+        for event in plate_appearance.event_list:
+            if isinstance(event, Pitch):
+                if event.pitch_description not in NON_STRIKE_LIST:
+                    stat_list[12] += 1
 
-    return top_half_inning_stats, bottom_half_inning_stats
+                if event.pitch_description != 'Automatic Ball':
+                    stat_list[13] += 1
 
-def get_all_pitcher_stats(game, team, pitcher, inning_half_str):
-    inning_half_list = get_inning_half_list(game, inning_half_str)
+def get_pitcher_box_score(pitcher, team, stat_list):
+    (num_outs, batters_faced, num_hits, num_runs, num_er, num_strikeouts,
+     num_walks, num_intent_walks, num_hbp, num_balks, num_wp, num_hr,
+     num_strikes, num_pitches) = stat_list
 
-    pitcher_box_score = PitcherBoxScore(
-        get_pitcher_innings_pitched(pitcher, inning_half_list),
+    innings_pitched = (num_outs // 3 * 10 + num_outs % 3) / 10
+    era, whip = get_pitcher_rate_tuple(innings_pitched, num_er, num_hits,
+                                       num_walks)
+
+    return PitcherBoxScore(
+        innings_pitched,
         get_pitcher_win_loss_save(pitcher, team),
-        get_pitcher_batters_faced(pitcher, inning_half_list),
-        get_pitcher_hits(pitcher, inning_half_list),
-        get_pitcher_runs(pitcher, inning_half_list),
-        get_pitcher_earned_runs(pitcher, inning_half_list),
-        get_pitcher_strikeouts(pitcher, inning_half_list),
-        get_pitcher_nonintentional_walks(pitcher, inning_half_list),
-        get_pitcher_intentional_walks(pitcher, inning_half_list),
-        get_pitcher_hit_by_pitch(pitcher, inning_half_list),
-        get_pitcher_balks(pitcher, inning_half_list),
-        get_pitcher_wild_pitches(pitcher, inning_half_list),
-        get_pitcher_home_runs(pitcher, inning_half_list),
-        get_pitcher_strikes(pitcher, inning_half_list),
-        get_pitcher_pitches(pitcher, inning_half_list),
-        get_pitcher_era(pitcher, inning_half_list),
-        get_pitcher_whip(pitcher, inning_half_list)
+        batters_faced,
+        num_hits,
+        num_runs,
+        num_er,
+        num_strikeouts,
+        num_walks,
+        num_intent_walks,
+        num_hbp,
+        num_balks,
+        num_wp,
+        num_hr,
+        num_strikes,
+        num_pitches,
+        era,
+        whip
     )
 
-    return pitcher_box_score
+def get_pitcher_box_score_dict_from_stats(team, stat_dict_list,
+                                          box_score_dict=None,
+                                          player_set=None):
+    new_box_score_dict = OrderedDict([])
+    for pitcher_appearance in team.pitcher_list:
+        pitcher = pitcher_appearance.player_obj
+        if (player_set is not None and pitcher in box_score_dict and
+                pitcher not in player_set):
+            box_score = box_score_dict[pitcher]
+            pitcher_credit_code = get_pitcher_win_loss_save(pitcher, team)
+            if box_score.WLS != pitcher_credit_code:
+                box_score = box_score._replace(WLS=pitcher_credit_code)
+        else:
+            box_score = get_pitcher_box_score(
+                pitcher, team, get_stat_list(stat_dict_list, pitcher, 14)
+            )
+
+        new_box_score_dict[pitcher] = box_score
 
-def get_all_batter_stats(game, batter, inning_half_str):
-    inning_half_list = get_inning_half_list(game, inning_half_str)
+    return new_box_score_dict
 
-    batter_box_score = BatterBoxScore(
-        get_batter_at_bats(batter, inning_half_list),
-        get_batter_runs(batter, inning_half_list),
-        get_batter_hits(batter, inning_half_list),
-        get_batter_runs_batted_in(batter, inning_half_list),
-        get_batter_walks(batter, inning_half_list),
-        get_batter_strikeouts(batter, inning_half_list),
-        get_batter_lob(batter, inning_half_list)
-    )
+def get_pitcher_box_score_dict(game, team, inning_half_str):
+    stat_dict = {}
+    for inning_half in get_inning_half_list(game, inning_half_str):
+        add_pitcher_stats(stat_dict, inning_half)
 
-    return batter_box_score
+    return get_pitcher_box_score_dict_from_stats(team, [stat_dict])
 
 def get_box_score_total(box_score_dict):
     total_ab = 0
@@ -204,39 +498,6 @@ def get_box_score_total(box_score_dict):
 
     return box_score_total_tuple
 
-def get_batter_strikeouts(batter, inning_half_list):
-    num_strikeouts = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if batter == plate_appearance.batter:
-                if ('K' in plate_appearance.scorecard_summary or
-                        'ꓘ' in plate_appearance.scorecard_summary):
-                    num_strikeouts += 1
-
-    return num_strikeouts
-
-def get_batter_walks(batter, inning_half_list):
-    num_walks = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if batter == plate_appearance.batter:
-                if 'BB' in plate_appearance.scorecard_summary:
-                    num_walks += 1
-
-    return num_walks
-
-def get_batter_runs_batted_in(batter, inning_half_list):
-    num_rbis = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if batter == plate_appearance.batter:
-                num_rbis += len(plate_appearance.runners_batted_in_list)
-
-    return num_rbis
-
 def plate_appearance_is_hit(plate_appearance):
     is_hit = False
 
@@ -246,27 +507,6 @@ def plate_appearance_is_hit(plate_appearance):
 
     return is_hit
 
-def get_batter_hits(batter, inning_half_list):
-    num_hits = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if (batter == plate_appearance.batter and
-                    plate_appearance_is_hit(plate_appearance)):
-                num_hits += 1
-
-    return num_hits
-
-def get_batter_runs(batter, inning_half_list):
-    num_runs = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if batter in plate_appearance.scoring_runners_list:
-                num_runs += 1
-
-    return num_runs
-
 def is_at_bat(plate_appearance):
     at_bat_flag = True
 
@@ -280,87 +520,6 @@ def is_at_bat(plate_appearance):
 
     return at_bat_flag
 
-def get_batter_at_bats(batter, inning_half_list):
-    at_bats = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if (batter == plate_appearance.batter and
-                    is_at_bat(plate_appearance)):
-                at_bats += 1
-
-    return at_bats
-
-def get_batter_lob(batter, inning_half_list):
-    player_lob = 0
-
-    for inning_half in inning_half_list:
-        first_base = None
-        second_base = None
-        third_base = None
-
-        for plate_appearance in inning_half:
-            (first_base,
-             second_base,
-             third_base) = process_pickoffs(plate_appearance,
-                                            first_base,
-                                            second_base,
-                                            third_base)
-
-            if (not plate_appearance_is_hit(plate_appearance) and
-                    'BB' not in plate_appearance.scorecard_summary and
-                    'HBP' not in plate_appearance.scorecard_summary):
-                num_lob = 0
-
-                if first_base:
-                    num_lob += 1
-
-                if second_base:
-                    num_lob += 1
-
-                if third_base:
-                    num_lob += 1
-
-                num_lob -= len(plate_appearance.scoring_runners_list)
-
-                if (batter == plate_appearance.batter and
-                        is_at_bat(plate_appearance)):
-                    player_lob += num_lob
-
-            (first_base,
-             second_base,
-             third_base) = process_baserunners(plate_appearance,
-                                               inning_half[-1],
-                                               first_base,
-                                               second_base,
-                                               third_base)
-
-    return player_lob
-
-def get_ip_incr(num_innings_pitched):
-    if num_innings_pitched % 10 < 2:
-        increment = 1
-    elif num_innings_pitched % 10 == 2:
-        increment = 8
-    else:
-        increment = 0
-
-    return increment
-
-def get_pitcher_innings_pitched(pitcher, inning_half_list):
-    innings_pitched = 0
-    for inning_half in inning_half_list:
-        num_outs = 0
-        for plate_appearance in inning_half:
-            this_plate_appearance_outs = plate_appearance.inning_outs - num_outs
-            num_outs += this_plate_appearance_outs
-
-            if pitcher == plate_appearance.pitcher:
-                for _ in range(this_plate_appearance_outs):
-                    innings_pitched += get_ip_incr(innings_pitched)
-
-    return innings_pitched / 10
-
 def get_pitcher_win_loss_save(pitcher, team):
     for pitcher_appearance in team.pitcher_list:
         if pitcher_appearance.player_obj == pitcher:
@@ -368,264 +527,7 @@ def get_pitcher_win_loss_save(pitcher, team):
 
     raise ValueError('Invalid pitcher')
 
-def get_pitcher_batters_faced(pitcher, inning_half_list):
-    num_batters_faced = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if (pitcher == plate_appearance.pitcher and
-                    'CS' not in plate_appearance.scorecard_summary and
-                    'PO' not in plate_appearance.scorecard_summary):
-                num_batters_faced += 1
-
-    return num_batters_faced
-
-def get_pitcher_hits(pitcher, inning_half_list):
-    num_hits = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if (pitcher == plate_appearance.pitcher and
-                    plate_appearance_is_hit(plate_appearance)):
-                num_hits += 1
-
-    return num_hits
-
-def get_pitcher_runs(pitcher, inning_half_list):
-    num_runs = 0
-
-    for inning_half in inning_half_list:
-        if inning_half:
-            inning_start_pitcher = inning_half[0].pitcher
-            pitcher_change_flag = False
-            first_base, second_base, third_base = None, None, None
-
-            for plate_appearance in inning_half:
-                if (plate_appearance.pitcher != inning_start_pitcher and
-                        not pitcher_change_flag):
-                    pitcher_change_flag = True
-
-                    change_baserunner_count = sum(
-                        x is not None
-                        for x in [first_base, second_base, third_base]
-                    )
-
-                (first_base,
-                 second_base,
-                 third_base) = process_baserunners(plate_appearance,
-                                                   inning_half[-1],
-                                                   first_base,
-                                                   second_base,
-                                                   third_base)
-
-                for event in plate_appearance.event_list:
-                    if (isinstance(event, RunnerAdvance) and
-                            event.runner_scored):
-                        if pitcher_change_flag and change_baserunner_count:
-                            change_baserunner_count -= 1
-                            if (plate_appearance.pitcher != pitcher and
-                                    inning_start_pitcher == pitcher):
-                                num_runs += 1
-
-                        elif pitcher == plate_appearance.pitcher:
-                            num_runs += 1
-
-    return num_runs
-
-def get_pitcher_errors(pitcher, inning_half_list):
-    num_errors = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if pitcher == plate_appearance.pitcher:
-                if plate_appearance.error_str == 'E1':
-                    num_errors += 1
-
-                last_description = None
-
-                for event in plate_appearance.event_list:
-                    if isinstance(event, RunnerAdvance):
-                        if ('Pickoff Error' in event.run_description and
-                                last_description != event.run_description):
-                            num_errors += 1
-                            last_description = event.run_description
-                    else:
-                        last_description = None
-
-    return num_errors
-
-def get_pitcher_earned_runs(pitcher, inning_half_list):
-    num_er = 0
-
-    for inning_half in inning_half_list:
-        if inning_half:
-            inning_start_pitcher = inning_half[0].pitcher
-            pitcher_change_flag = False
-            first_base, second_base, third_base = None, None, None
-
-            for plate_appearance in inning_half:
-                if (plate_appearance.pitcher != inning_start_pitcher and
-                        not pitcher_change_flag):
-                    pitcher_change_flag = True
-
-                    change_baserunner_count = sum(
-                        x is not None
-                        for x in [first_base, second_base, third_base]
-                    )
-
-                (first_base,
-                 second_base,
-                 third_base) = process_baserunners(plate_appearance,
-                                                   inning_half[-1],
-                                                   first_base,
-                                                   second_base,
-                                                   third_base)
-
-                for event in plate_appearance.event_list:
-                    if (isinstance(event, RunnerAdvance) and
-                            event.runner_scored and
-                            event.run_earned):
-                        if pitcher_change_flag and change_baserunner_count:
-                            if (plate_appearance.pitcher != pitcher and
-                                    inning_start_pitcher == pitcher):
-                                num_er += 1
-
-                            change_baserunner_count -= 1
-                        elif pitcher == plate_appearance.pitcher:
-                            num_er += 1
-
-    return num_er
-
-def get_pitcher_strikeouts(pitcher, inning_half_list):
-    num_strikeouts = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            summary = plate_appearance.plate_appearance_summary
-
-            if (pitcher == plate_appearance.pitcher and
-                    'Strikeout' in summary):
-                num_strikeouts += 1
-
-    return num_strikeouts
-
-def get_pitcher_nonintentional_walks(pitcher, inning_half_list):
-    num_walks = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            summary = plate_appearance.plate_appearance_summary
-
-            if pitcher == plate_appearance.pitcher and summary == 'Walk':
-                num_walks += 1
-
-    return num_walks
-
-def get_pitcher_intentional_walks(pitcher, inning_half_list):
-    num_intent_walks = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            summary = plate_appearance.plate_appearance_summary
-
-            if (pitcher == plate_appearance.pitcher and
-                    summary == 'Intent Walk'):
-                num_intent_walks += 1
-
-    return num_intent_walks
-
-def get_pitcher_hit_by_pitch(pitcher, inning_half_list):
-    num_hbp = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            summary = plate_appearance.plate_appearance_summary
-
-            if (pitcher == plate_appearance.pitcher and
-                    summary == 'Hit By Pitch'):
-                num_hbp += 1
-
-    return num_hbp
-
-def get_pitcher_balks(pitcher, inning_half_list):
-    num_balks = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if pitcher == plate_appearance.pitcher:
-                last_description = None
-
-                for event in plate_appearance.event_list:
-                    if isinstance(event, RunnerAdvance):
-                        if (event.run_description == 'Balk' and
-                                last_description != event.run_description):
-                            num_balks += 1
-                            last_description = event.run_description
-                    else:
-                        last_description = None
-
-    return num_balks
-
-def get_pitcher_wild_pitches(pitcher, inning_half_list):
-    num_wp = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if pitcher == plate_appearance.pitcher:
-                last_description = None
-
-                for event in plate_appearance.event_list:
-                    if isinstance(event, RunnerAdvance):
-                        if (event.run_description == 'Wild Pitch' and
-                                last_description != event.run_description):
-                            num_wp += 1
-                            last_description = event.run_description
-                    else:
-                        last_description = None
-
-    return num_wp
-
-def get_pitcher_home_runs(pitcher, inning_half_list):
-    num_hr = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if (pitcher == plate_appearance.pitcher and
-                    plate_appearance.scorecard_summary == 'HR'):
-                num_hr += 1
-
-    return num_hr
-
-def get_pitcher_strikes(pitcher, inning_half_list):
-    num_strikes = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if pitcher == plate_appearance.pitcher:
-                for event in plate_appearance.event_list:
-                    if (isinstance(event, Pitch) and
-                            event.pitch_description not in NON_STRIKE_LIST):
-                        num_strikes += 1
-
-    return num_strikes
-
-def get_pitcher_pitches(pitcher, inning_half_list):
-    num_pitches = 0
-
-    for inning_half in inning_half_list:
-        for plate_appearance in inning_half:
-            if pitcher == plate_appearance.pitcher:
-                for event in plate_appearance.event_list:
-                    if (isinstance(event, Pitch) and
-                            event.pitch_description != 'Automatic Ball'):
-                        num_pitches += 1
-
-    return num_pitches
-
-def get_innings_pitched_calc_num(pitcher, inning_half_list):
-    innings_pitched = get_pitcher_innings_pitched(pitcher,
-                                                  inning_half_list)
-
+def get_innings_pitched_num(innings_pitched):
     if str(innings_pitched)[-2:] == '.1':
         innings_pitched_num = float(str(innings_pitched)[:-2]) + (1.0/3.0)
     elif str(innings_pitched)[-2:] == '.2':
@@ -635,33 +537,12 @@ def get_innings_pitched_calc_num(pitcher, inning_half_list):
 
     return innings_pitched_num
 
-def get_pitcher_era(pitcher, inning_half_list):
-    if get_pitcher_innings_pitched(pitcher, inning_half_list) == 0:
+def get_pitcher_rate_tuple(innings_pitched, num_er, num_hits, num_walks):
+    innings_pitched_num = get_innings_pitched_num(innings_pitched)
+    if innings_pitched == 0:
         era = '&#8734;'
     else:
-        innings_pitched_num = get_innings_pitched_calc_num(pitcher,
-                                                           inning_half_list)
-
-        era = round(
-            9.0 *
-            (
-                float(get_pitcher_earned_runs(pitcher, inning_half_list)) /
-                innings_pitched_num
-            ),
-            3
-        )
-
-    return era
-
-def get_pitcher_whip(pitcher, inning_half_list):
-    num_hits = get_pitcher_hits(pitcher, inning_half_list)
-    num_walks = get_pitcher_nonintentional_walks(pitcher,
-                                                 inning_half_list)
-
-    innings_pitched_num = get_innings_pitched_calc_num(
-        pitcher,
-        inning_half_list
-    )
+        era = round(9.0 * (float(num_er) / innings_pitched_num), 3)
 
     if innings_pitched_num == 0:
         whip = '&#8734;'
@@ -671,229 +552,28 @@ def get_pitcher_whip(pitcher, inning_half_list):
             3
         )
 
-    return whip
-
-def get_strikes(appearance_list):
-    num_strikes = 0
-
-    for plate_appearance in appearance_list:
-        for event in plate_appearance.event_list:
-            if (isinstance(event, Pitch) and
-                    event.pitch_description not in NON_STRIKE_LIST):
-                num_strikes += 1
-
-    return num_strikes
-
-def get_pitches(appearance_list):
-    num_pitches = 0
-
-    for plate_appearance in appearance_list:
-        for event in plate_appearance.event_list:
-            if (isinstance(event, Pitch) and
-                    event.pitch_description != 'Automatic Ball'):
-                num_pitches += 1
-
-    return num_pitches
-
-def get_walks(appearance_list):
-    num_walks = 0
-
-    for plate_appearance in appearance_list:
-        if 'BB' in plate_appearance.scorecard_summary:
-            num_walks += 1
-
-    return num_walks
-
-
-def get_strikeouts(appearance_list):
-    num_strikeouts = 0
+    return era, whip
 
-    for plate_appearance in appearance_list:
-        if ('K' in plate_appearance.scorecard_summary or
-                'ꓘ' in plate_appearance.scorecard_summary):
-            num_strikeouts += 1
-
-    return num_strikeouts
-
-def get_lob(appearance_list):
-    first_base = None
-    second_base = None
-    third_base = None
-
-    for plate_appearance in appearance_list:
-        (first_base,
-         second_base,
-         third_base) = process_baserunners(plate_appearance,
-                                           appearance_list[-1],
-                                           first_base,
-                                           second_base,
-                                           third_base)
-
-    num_lob = 0
-
-    if first_base:
-        num_lob += 1
-    if second_base:
-        num_lob += 1
-    if third_base:
-        num_lob += 1
-
-    return num_lob
-
-def get_errors(appearance_list):
-    num_errors = 0
-
-    for plate_appearance in appearance_list:
-        if plate_appearance.error_str:
-            num_errors += 1
-
-        last_description = None
-
-        for event in plate_appearance.event_list:
-            if isinstance(event, RunnerAdvance):
-                if ('Pickoff Error' in event.run_description and
-                        last_description != event.run_description):
-                    num_errors += 1
-                    last_description = event.run_description
-            else:
-                last_description = None
-
-    return num_errors
-
-def get_hits(appearance_list):
-    num_hits = 0
-
-    for plate_appearance in appearance_list:
-        for code in HIT_CODE_LIST:
-            if code in plate_appearance.scorecard_summary:
-                num_hits += 1
-                continue
-
-    return num_hits
-
-def get_runs(appearance_list):
-    num_runs = 0
-
-    for plate_appearance in appearance_list:
-        num_runs += len(plate_appearance.scoring_runners_list)
-
-    return num_runs
-
-def count_summaries_by_keyword(inning_half_list, keyword):
-    num_keyword_appearances = 0
-    for appearance_list in inning_half_list:
-        for appearance in appearance_list:
-            if keyword in appearance.plate_appearance_summary:
-                num_keyword_appearances += 1
-
-    return num_keyword_appearances
-
-def count_runner_advance_unique_keywords(inning_half_list, keyword):
-    num_keyword_appearances = 0
-
-    for appearance_list in inning_half_list:
-        for appearance in appearance_list:
-            runner_list = []
-            previous_run_description = None
-            new_event_next = True
-            for event in appearance.event_list:
-                if isinstance(event, RunnerAdvance):
-                    if event.run_description != previous_run_description:
-                        runner_list = [event.runner]
-                        new_event_next = True
-                    elif (event.run_description == previous_run_description and
-                          event.runner in runner_list):
-                        runner_list = [event.runner]
-                        new_event_next = True
-                    else:
-                        runner_list.append(event.runner)
-                        new_event_next = False
-
-                    if new_event_next and keyword in event.run_description:
-                        num_keyword_appearances += 1
-
-                    previous_run_description = event.run_description
-
-    return num_keyword_appearances
-
-def count_runner_advance_total_keywords(inning_half_list, keyword):
-    num_keyword_appearances = 0
-
-    for appearance_list in inning_half_list:
-        for appearance in appearance_list:
-            for event in appearance.event_list:
-                if isinstance(event, RunnerAdvance):
-                    if keyword in event.run_description:
-                        num_keyword_appearances += 1
-
-    return num_keyword_appearances
-
-def get_team_singles(inning_half_list):
-    return count_summaries_by_keyword(inning_half_list, 'Single')
-
-def get_team_doubles(inning_half_list):
-    return count_summaries_by_keyword(inning_half_list, 'Double')
-
-def get_team_triples(inning_half_list):
-    return count_summaries_by_keyword(inning_half_list, 'Triple')
-
-def get_team_home_runs(inning_half_list):
-    return count_summaries_by_keyword(inning_half_list, 'Home Run')
-
-def get_team_sac_flies(inning_half_list):
-    return count_summaries_by_keyword(inning_half_list, 'Sac Fly')
-
-def get_team_sac_bunts(inning_half_list):
-    return count_summaries_by_keyword(inning_half_list, 'Sac Bunt')
-
-def get_team_batted_into_double_plays(inning_half_list):
-    return (
-        count_summaries_by_keyword(inning_half_list, 'Double Play') +
-        count_summaries_by_keyword(inning_half_list, 'DP')
-    )
-
-def get_team_hit_by_pitches(inning_half_list):
-    return count_summaries_by_keyword(inning_half_list, 'Hit By Pitch')
-
-def get_team_received_wild_pitches(inning_half_list):
-    return count_runner_advance_unique_keywords(inning_half_list, 'Wild Pitch')
-
-def get_team_received_passed_balls(inning_half_list):
-    return count_runner_advance_unique_keywords(inning_half_list, 'Passed Ball')
-
-def get_team_stolen_bases(inning_half_list):
-    return count_runner_advance_total_keywords(inning_half_list, 'Stolen Base')
-
-def get_team_caught_stealing(inning_half_list):
-    return count_runner_advance_total_keywords(inning_half_list,
-                                               'Caught Stealing')
+def get_team_stats(game, inning_half_str):
+    if inning_half_str == 'top':
+        team_stats_list = [inning.top_half_team_stats
+                           for inning in game.inning_list]
+    elif inning_half_str == 'bottom':
+        team_stats_list = [inning.bottom_half_team_stats
+                           for inning in game.inning_list]
+    else:
+        raise ValueError(
+            'Invalid inning half str: {}'.format(inning_half_str)
+        )
 
-def get_team_plate_appearances(inning_half_list):
-    return len(
-        [appearance
-         for appearance_list in inning_half_list
-         for appearance in appearance_list
-         if (appearance.plate_appearance_summary != 'Runner Out' and
-             appearance.plate_appearance_summary != 'Extra Innings Runner')]
-    )
+    team_stats_list = [team_stats for team_stats in team_stats_list
+                       if team_stats]
 
-def get_team_stats(game, inning_half_str):
-    inning_half_list = get_inning_half_list(game, inning_half_str)
-
-    team_box_score = TeamBoxScore(
-        get_team_singles(inning_half_list),
-        get_team_doubles(inning_half_list),
-        get_team_triples(inning_half_list),
-        get_team_home_runs(inning_half_list),
-        get_team_sac_flies(inning_half_list),
-        get_team_sac_bunts(inning_half_list),
-        get_team_batted_into_double_plays(inning_half_list),
-        get_team_hit_by_pitches(inning_half_list),
-        get_team_received_wild_pitches(inning_half_list),
-        get_team_received_passed_balls(inning_half_list),
-        get_team_stolen_bases(inning_half_list),
-        get_team_caught_stealing(inning_half_list),
-        get_team_plate_appearances(inning_half_list)
-    )
+    if team_stats_list:
+        team_box_score = TeamBoxScore(
+            *[sum(stat_tuple) for stat_tuple in zip(*team_stats_list)]
+        )
+    else:
+        team_box_score = TeamBoxScore(*([0] * len(TeamBoxScore._fields)))
 
     return team_box_score
@@ -0,0 +1 @@
+__version__ = '16.3'
@@ -0,0 +1,23 @@
+from os.path import dirname, join
+from shutil import copytree, rmtree
+
+from baseball.archive_manifest import (build_archive_manifest,
+                                       update_archive_manifest)
+
+ARCHIVE_DIR = join(dirname(__file__), 'data', 'archive')
+
+def test_removed_day_is_dropped_from_manifest(tmp_path):
+    input_dir = str(tmp_path / 'archive')
+    copytree(ARCHIVE_DIR, input_dir)
+
+    manifest = build_archive_manifest(input_dir)
+    assert manifest['date_list'] == ['2017-04-05', '2019-04-05']
+
+    rmtree(join(input_dir, '2019', 'month_04', 'day_05'))
+
+    manifest = update_archive_manifest(input_dir, 2017, 2017)
+    assert manifest['date_list'] == ['2017-04-05', '2019-04-05']
+
+    manifest = update_archive_manifest(input_dir)
+    assert manifest['date_list'] == ['2017-04-05']
+    assert '2019-04-05' not in manifest['day_dict']
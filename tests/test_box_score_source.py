@@ -0,0 +1,73 @@
+from json import loads
+from os.path import dirname, join
+
+import pytest
+
+from baseball.fetch_game import get_filename_list
+from baseball.game_cache import get_game_cache_key
+from baseball.process_game_json import (BOX_SCORE_SOURCE_DICT, get_game_obj,
+                                        set_box_score_source)
+
+ARCHIVE_DIR = join(dirname(__file__), 'data', 'archive')
+
+TEAM_BATTING_KEY_LIST = ['hits', 'doubles', 'triples', 'homeRuns',
+                         'sacFlies', 'sacBunts', 'groundIntoDoublePlay',
+                         'hitByPitch', 'stolenBases', 'caughtStealing',
+                         'plateAppearances']
+
+@pytest.fixture
+def box_score_source():
+    previous_source = BOX_SCORE_SOURCE_DICT['source']
+    yield set_box_score_source
+    set_box_score_source(previous_source)
+
+def get_sample_filename_tuple(date_str):
+    return get_filename_list(date_str, date_str, ARCHIVE_DIR)[0]
+
+def get_zero_stats_game_dict():
+    with open(get_sample_filename_tuple('2019-04-05')[4], 'r',
+              encoding='utf-8') as filehandle:
+        game_dict = loads(filehandle.read())
+
+    for team_dict in game_dict['liveData']['boxscore']['teams'].values():
+        team_dict['teamStats'] = {
+            'batting': dict.fromkeys(TEAM_BATTING_KEY_LIST, 0),
+            'pitching': {},
+            'fielding': {}
+        }
+
+    return game_dict
+
+def test_cache_key_depends_on_source_for_json_games(box_score_source):
+    json_filename_tuple = get_sample_filename_tuple('2019-04-05')
+    xml_filename_tuple = get_sample_filename_tuple('2017-04-05')
+
+    box_score_source('computed')
+    json_key = get_game_cache_key(json_filename_tuple)
+    xml_key = get_game_cache_key(xml_filename_tuple)
+
+    box_score_source('official')
+    assert get_game_cache_key(json_filename_tuple) != json_key
+    assert get_game_cache_key(xml_filename_tuple) == xml_key
+
+def test_official_source_uses_feed_stats(box_score_source):
+    box_score_source('official')
+    game = get_game_obj(get_zero_stats_game_dict())
+
+    assert game.away_team_stats.PA == 0
+
+def test_verify_source_keeps_game_and_records_mismatch(box_score_source):
+    box_score_source('verify')
+    game = get_game_obj(get_zero_stats_game_dict())
+
+    assert game.away_team_stats.PA == 0
+    assert ('away_team_stats', None, 'PA') in [
+        (diff.box_score, diff.player, diff.field)
+        for diff in game.box_score_diff_list
+    ]
+
+def test_computed_source_records_no_mismatch(box_score_source):
+    box_score_source('computed')
+    game = get_game_obj(get_zero_stats_game_dict())
+
+    assert game.box_score_diff_list is None
@@ -0,0 +1,34 @@
+from os.path import dirname, join
+
+import pytest
+
+from baseball.decoders import (DECODER_BACKEND_DICT, JSON_BACKEND_LIST,
+                               XML_BACKEND_LIST, set_decoder_backends)
+from baseball.fetch_game import (get_filename_list,
+                                 load_game_from_filename_tuple)
+
+ARCHIVE_DIR = join(dirname(__file__), 'data', 'archive')
+
+SAMPLE_DATE_STR_LIST = ['2017-04-05', '2019-04-05']
+
+def get_sample_json_list(xml_backend, json_backend):
+    previous_backend_dict = dict(DECODER_BACKEND_DICT)
+    try:
+        set_decoder_backends(xml_backend, json_backend)
+        return [
+            load_game_from_filename_tuple(filename_tuple).json()
+            for date_str in SAMPLE_DATE_STR_LIST
+            for filename_tuple in get_filename_list(date_str, date_str,
+                                                    ARCHIVE_DIR)
+        ]
+    finally:
+        DECODER_BACKEND_DICT.update(previous_backend_dict)
+
+def test_samples_cover_both_eras():
+    assert len(get_sample_json_list('stdlib', 'stdlib')) == 2
+
+@pytest.mark.parametrize('xml_backend', XML_BACKEND_LIST)
+@pytest.mark.parametrize('json_backend', JSON_BACKEND_LIST)
+def test_backends_match_stdlib(xml_backend, json_backend):
+    assert (get_sample_json_list(xml_backend, json_backend) ==
+            get_sample_json_list('stdlib', 'stdlib'))
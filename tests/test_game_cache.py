@@ -0,0 +1,33 @@
+from glob import glob
+from multiprocessing import get_start_method, set_start_method
+from os.path import dirname, join
+
+import pytest
+
+from baseball.fetch_game import get_game_list_from_file_range
+from baseball.game_cache import GAME_CACHE_DIR_DICT, set_game_cache_dir
+
+ARCHIVE_DIR = join(dirname(__file__), 'data', 'archive')
+
+@pytest.fixture
+def spawn_start_method():
+    start_method = get_start_method()
+    set_start_method('spawn', force=True)
+
+    yield
+
+    set_start_method(start_method, force=True)
+
+def test_game_cache_dir_reaches_spawned_workers(spawn_start_method,
+                                                tmp_path):
+    cache_dir = GAME_CACHE_DIR_DICT['cache_dir']
+    set_game_cache_dir(str(tmp_path))
+    try:
+        game_list = get_game_list_from_file_range('2017-04-05', '2019-04-05',
+                                                  ARCHIVE_DIR,
+                                                  num_processes=2)
+    finally:
+        GAME_CACHE_DIR_DICT['cache_dir'] = cache_dir
+
+    assert len(game_list) == 2
+    assert len(glob(str(tmp_path / '*' / '*.pickle'))) == 2
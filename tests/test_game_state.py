@@ -0,0 +1,92 @@
+from os.path import dirname, join
+from re import sub
+
+from baseball.baseball import (LAZY_GAME_STATS_DICT, Inning,
+                               PlateAppearance, Player, Team,
+                               set_lazy_game_stats)
+from baseball.baseball_events import Pickoff, Pitch, RunnerAdvance
+from baseball.fetch_game import get_game_from_xml_strings
+
+GAME_DIR = join(dirname(__file__), 'data', 'archive', '2017', 'month_04',
+                'day_05', 'gid_2017_04_05_atlmlb_lanmlb_1')
+
+def read_game_file(filename):
+    with open(join(GAME_DIR, filename), 'r', encoding='utf-8') as filehandle:
+        return filehandle.read()
+
+def test_pickoff_is_applied_in_event_order():
+    inning_raw_xml = sub(
+        r'<po des="Pickoff Attempt 1B"/>\n(<pitch [^\n]*/>)\n',
+        r'\1\n<po des="Pickoff 1B"/>\n',
+        read_game_file('inning/inning_all.xml'),
+        count=1
+    )
+
+    game = get_game_from_xml_strings(read_game_file('boxscore.xml'),
+                                     read_game_file('players.xml'),
+                                     inning_raw_xml)
+
+    plate_appearance = next(
+        plate_appearance
+        for inning in game.inning_list
+        for inning_half in [inning.top_half_appearance_list,
+                            inning.bottom_half_appearance_list or []]
+        for plate_appearance in inning_half
+        if any(isinstance(event, Pickoff) and event.pickoff_was_successful
+               for event in plate_appearance.event_list)
+    )
+
+    pitch_list = [event for event in plate_appearance.event_list
+                  if isinstance(event, Pitch)]
+
+    runner = plate_appearance.start_game_state.first_base
+    assert runner is not None
+    assert pitch_list[0].game_state.first_base is runner
+    assert pitch_list[1].game_state.first_base is None
+
+def test_picked_off_runner_is_not_left_on_base():
+    team = Team('Away', 'AWY')
+    pitcher = Player('Pitcher', 'Pat', 1, None, None, 1)
+    runner = Player('Runner', 'Ron', 2, None, None, 2)
+    batter = Player('Batter', 'Bob', 3, None, None, 3)
+    single = PlateAppearance(
+        None, None, team, 'Ron Runner singles on a line drive.', 'Single',
+        pitcher, runner, 0, [], [],
+        [Pitch(None, 'In play, no out', 'FF', 95, (0, 0)),
+         RunnerAdvance('Single', runner, '', '1B', False, False, False)]
+    )
+
+    strikeout = PlateAppearance(
+        None, None, team, 'Bob Batter strikes out swinging.', 'Strikeout',
+        pitcher, batter, 2, [], [],
+        [Pickoff('Pickoff 1B', '1B', True),
+         Pitch(None, 'Swinging Strike', 'FF', 95, (0, 0))]
+    )
+
+    inning = Inning([single, strikeout], [])
+
+    assert strikeout.start_game_state.first_base is runner
+    assert strikeout.end_game_state.first_base is None
+    assert inning.top_half_inning_stats.LOB == 0
+
+def test_inning_stats_are_computed_on_first_access():
+    previous_is_lazy = LAZY_GAME_STATS_DICT['is_lazy']
+    try:
+        set_lazy_game_stats(True)
+        game = get_game_from_xml_strings(read_game_file('boxscore.xml'),
+                                         read_game_file('players.xml'),
+                                         read_game_file(
+                                             'inning/inning_all.xml'))
+    finally:
+        set_lazy_game_stats(previous_is_lazy)
+
+    inning = game.inning_list[0]
+    assert '_top_half_inning_stats' not in inning.__dict__
+    assert inning.top_half_appearance_list[0].start_game_state is not None
+
+    inning_stats = inning.top_half_inning_stats
+    assert inning.__dict__['_top_half_team_stats'] is not None
+    assert inning.top_half_inning_stats is inning_stats
+    assert game.away_team_stats.PA == sum(
+        this_inning.top_half_team_stats.PA for this_inning in game.inning_list
+    )
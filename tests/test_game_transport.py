@@ -0,0 +1,68 @@
+from os.path import dirname, join
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+
+import pytest
+
+from baseball.baseball_events import Pitch
+from baseball.fetch_game import (get_filename_list,
+                                 load_game_from_filename_tuple)
+from baseball.game_transport import get_compact_game, get_game_from_compact
+
+ARCHIVE_DIR = join(dirname(__file__), 'data', 'archive')
+
+def load_sample_game(date_str):
+    filename_tuple, = get_filename_list(date_str, date_str, ARCHIVE_DIR)
+
+    return load_game_from_filename_tuple(filename_tuple)
+
+def get_round_trip_game(game):
+    return get_game_from_compact(
+        loads(dumps(get_compact_game(game), HIGHEST_PROTOCOL))
+    )
+
+def get_plate_appearance_list(game):
+    return [plate_appearance
+            for inning in game.inning_list
+            for inning_half in [inning.top_half_appearance_list,
+                                inning.bottom_half_appearance_list]
+            for plate_appearance in inning_half or []]
+
+@pytest.mark.parametrize('date_str', ['2017-04-05', '2019-04-05'])
+def test_round_trip_keeps_game(date_str):
+    game = load_sample_game(date_str)
+    new_game = get_round_trip_game(game)
+
+    assert new_game.json() == game.json()
+    assert new_game.get_svg_str() == game.get_svg_str()
+    assert repr(new_game) == repr(game)
+
+@pytest.mark.parametrize('date_str', ['2017-04-05', '2019-04-05'])
+def test_round_trip_shares_players(date_str):
+    new_game = get_round_trip_game(load_sample_game(date_str))
+    team_player_set = {
+        id(player_appearance.player_obj)
+        for team in [new_game.away_team, new_game.home_team]
+        for batting_order_list in team.batting_order_list_list
+        for player_appearance in batting_order_list
+    }
+
+    for plate_appearance in get_plate_appearance_list(new_game):
+        assert id(plate_appearance.batter) in team_player_set
+        for event in plate_appearance.event_list:
+            if isinstance(event, Pitch) and event.game_state.first_base:
+                assert id(event.game_state.first_base) in team_player_set
+
+def test_round_trip_keeps_extra_attributes():
+    game = load_sample_game('2017-04-05')
+    plate_appearance = get_plate_appearance_list(game)[0]
+    plate_appearance.event_list[0].note = 'first pitch'
+    plate_appearance.batter.note = 'leadoff'
+    aliased_list = [plate_appearance.event_list[0]]
+    game.aliased_list = aliased_list
+
+    new_game = get_round_trip_game(game)
+    new_plate_appearance = get_plate_appearance_list(new_game)[0]
+
+    assert new_plate_appearance.event_list[0].note == 'first pitch'
+    assert new_plate_appearance.batter.note == 'leadoff'
+    assert new_game.aliased_list[0] is new_plate_appearance.event_list[0]
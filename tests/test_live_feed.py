@@ -0,0 +1,143 @@
+from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from threading import Thread
+from time import time
+
+import pytest
+
+from baseball import live_feed as live_feed_module
+from baseball.fetch_game import update_live_games
+
+GAME_PK = 565997
+
+LIVE_FEED_PATH = '/api/v1.1/game/{}/feed/live'.format(GAME_PK)
+
+FEED_DICT = {
+    'metaData': {'timeStamp': '20190328_200000'},
+    'gameData': {'status': {'codedGameState': 'I'}},
+    'liveData': {'plays': {'allPlays': [{'atBatIndex': 0}]}},
+}
+
+class StatsapiHandler(BaseHTTPRequestHandler):
+    response_dict = {}
+    path_list = []
+
+    def do_GET(self):
+        self.path_list.append(self.path)
+        if self.path not in self.response_dict:
+            self.send_error(404)
+            return
+
+        body = dumps(self.response_dict[self.path]).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def live_feed():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StatsapiHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    StatsapiHandler.response_dict = {LIVE_FEED_PATH: deepcopy(FEED_DICT)}
+    StatsapiHandler.path_list = []
+
+    previous_base_url = live_feed_module.STATSAPI_URL_DICT['base_url']
+    live_feed_module.set_statsapi_url(
+        'http://127.0.0.1:{}'.format(server.server_port)
+    )
+
+    yield live_feed_module
+
+    server.shutdown()
+    server.server_close()
+    live_feed_module.set_statsapi_url(previous_base_url)
+    live_feed_module.LIVE_FEED_DICT.clear()
+
+def get_diff_patch_path(timecode):
+    return '{}/diffPatch?startTimecode={}'.format(LIVE_FEED_PATH, timecode)
+
+def test_diff_patch_is_applied(live_feed):
+    assert live_feed.get_live_feed(GAME_PK) == FEED_DICT
+
+    StatsapiHandler.response_dict[get_diff_patch_path('20190328_200000')] = [
+        {'diff': [
+            {'op': 'replace', 'path': '/metaData/timeStamp',
+             'value': '20190328_200500'},
+            {'op': 'add', 'path': '/liveData/plays/allPlays/-',
+             'value': {'atBatIndex': 1}},
+        ]},
+    ]
+
+    game_dict = live_feed.get_live_feed(GAME_PK)
+
+    assert game_dict['metaData']['timeStamp'] == '20190328_200500'
+    assert game_dict['liveData']['plays']['allPlays'] == [{'atBatIndex': 0},
+                                                          {'atBatIndex': 1}]
+    assert StatsapiHandler.path_list == [
+        LIVE_FEED_PATH, get_diff_patch_path('20190328_200000')
+    ]
+    assert live_feed.LIVE_FEED_DICT[GAME_PK] is game_dict
+
+def test_bad_diff_patch_falls_back_to_full_fetch(live_feed):
+    live_feed.get_live_feed(GAME_PK)
+
+    StatsapiHandler.response_dict[get_diff_patch_path('20190328_200000')] = [
+        {'diff': [{'op': 'replace', 'path': '/liveData/missing',
+                   'value': 1}]},
+    ]
+
+    full_feed_dict = deepcopy(FEED_DICT)
+    full_feed_dict['metaData']['timeStamp'] = '20190328_201000'
+    StatsapiHandler.response_dict[LIVE_FEED_PATH] = full_feed_dict
+
+    assert live_feed.get_live_feed(GAME_PK) == full_feed_dict
+    assert StatsapiHandler.path_list == [
+        LIVE_FEED_PATH, get_diff_patch_path('20190328_200000'), LIVE_FEED_PATH
+    ]
+
+def test_failed_diff_patch_request_falls_back_to_full_fetch(live_feed):
+    live_feed.get_live_feed(GAME_PK)
+
+    assert live_feed.get_live_feed(GAME_PK) == FEED_DICT
+    assert StatsapiHandler.path_list == [
+        LIVE_FEED_PATH, get_diff_patch_path('20190328_200000'), LIVE_FEED_PATH
+    ]
+
+def test_final_game_is_evicted(live_feed):
+    live_feed.get_live_feed(GAME_PK)
+
+    StatsapiHandler.response_dict[get_diff_patch_path('20190328_200000')] = [
+        {'diff': [{'op': 'replace', 'path': '/gameData/status/codedGameState',
+                   'value': 'F'}]},
+    ]
+
+    game_dict = live_feed.get_live_feed(GAME_PK)
+
+    assert game_dict['gameData']['status']['codedGameState'] == 'F'
+    assert GAME_PK not in live_feed.LIVE_FEED_DICT
+
+def test_fetch_error_backs_off_one_game(live_feed):
+    missing_game_pk = GAME_PK + 1
+    game_state_dict = {
+        game_pk: {'next_poll_time': 0, 'signature': None,
+                  'game_dict': {'gamePk': game_pk}, 'game': None,
+                  'num_fetch_errors': 0}
+        for game_pk in [GAME_PK, missing_game_pk]
+    }
+
+    now_time = time()
+    update_live_games(game_state_dict, [GAME_PK, missing_game_pk], None,
+                      None, False)
+
+    assert game_state_dict[GAME_PK]['game_dict'] == FEED_DICT
+    assert game_state_dict[GAME_PK]['num_fetch_errors'] == 0
+
+    missing_game_state = game_state_dict[missing_game_pk]
+    assert missing_game_state['game_dict'] == {'gamePk': missing_game_pk}
+    assert missing_game_state['num_fetch_errors'] == 1
+    assert missing_game_state['next_poll_time'] > now_time
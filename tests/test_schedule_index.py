@@ -0,0 +1,61 @@
+from datetime import datetime
+
+import pytest
+
+from baseball import schedule_index
+
+GAME_PK = 565997
+
+@pytest.fixture
+def schedule_request_dict(monkeypatch, tmp_path):
+    schedule_request_dict = {'date_str': None, 'url_list': []}
+
+    def get_json(url):
+        schedule_request_dict['url_list'].append(url)
+        game_dict = {'gamePk': GAME_PK, 'gameNumber': 1,
+                     'teams': {'away': {'team': {'abbreviation': 'LAD'}},
+                               'home': {'team': {'abbreviation': 'BOS'}}}}
+
+        return {'dates': [{'date': schedule_request_dict['date_str'],
+                           'games': [game_dict]}]}
+
+    monkeypatch.setattr(schedule_index, 'get_json', get_json)
+    monkeypatch.setitem(schedule_index.SCHEDULE_INDEX_PATH_DICT, 'index_path',
+                        str(tmp_path / 'schedule.json'))
+    schedule_index.SCHEDULE_INDEX_DICT.clear()
+
+    yield schedule_request_dict
+
+    schedule_index.SCHEDULE_INDEX_DICT.clear()
+
+def test_current_date_is_reused_until_it_expires(schedule_request_dict):
+    today_datetime = datetime.now()
+    date_str = schedule_index.get_index_date_str(today_datetime)
+    schedule_request_dict['date_str'] = date_str
+    for _ in range(2):
+        assert schedule_index.get_schedule_game_pk(
+            today_datetime, 'LAD', 'BOS', 1
+        ) == (GAME_PK, False)
+
+    assert len(schedule_request_dict['url_list']) == 1
+
+    index = schedule_index.get_schedule_index()
+    assert date_str not in index['date_list']
+
+    index['fetch_time_dict'][date_str] -= (
+        schedule_index.SCHEDULE_CURRENT_TTL_SECONDS
+    )
+
+    schedule_index.get_schedule_game_pk(today_datetime, 'LAD', 'BOS', 1)
+    assert len(schedule_request_dict['url_list']) == 2
+
+def test_past_date_is_fetched_once(schedule_request_dict):
+    past_datetime = datetime(2019, 4, 5)
+    schedule_request_dict['date_str'] = '2019-04-05'
+    for _ in range(2):
+        assert schedule_index.get_schedule_game_pk(
+            past_datetime, 'LAD', 'BOS', 1
+        ) == (GAME_PK, False)
+
+    assert len(schedule_request_dict['url_list']) == 1
+    assert '2019-04-30' in schedule_index.get_schedule_index()['date_list']
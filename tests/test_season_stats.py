@@ -0,0 +1,70 @@
+from os.path import dirname, join
+from shutil import copytree
+
+import pytest
+
+from baseball.fetch_game import (get_filename_list,
+                                 load_game_from_filename_tuple)
+from baseball.season_stats import get_season_stats_from_file_range
+
+ARCHIVE_DIR = join(dirname(__file__), 'data', 'archive')
+
+EXTRA_FIELD_LIST = ['B2', 'B3', 'HR', 'HBP', 'SF']
+
+@pytest.mark.parametrize('date_str', ['2017-04-05', '2019-04-05'])
+def test_season_totals_match_box_scores(date_str):
+    filename_tuple, = get_filename_list(date_str, date_str, ARCHIVE_DIR)
+    game = load_game_from_filename_tuple(filename_tuple)
+    season_stats = get_season_stats_from_file_range(date_str, date_str,
+                                                    ARCHIVE_DIR,
+                                                    num_processes=1)
+
+    for team, batter_box_score_dict, pitcher_box_score_dict, team_stats in [
+            (game.away_team, game.away_batter_box_score_dict,
+             game.away_pitcher_box_score_dict, game.away_team_stats),
+            (game.home_team, game.home_batter_box_score_dict,
+             game.home_pitcher_box_score_dict, game.home_team_stats)]:
+        batting_line_list = []
+        for batter, box_score in batter_box_score_dict.items():
+            if batter == 'TOTAL':
+                continue
+
+            batting_line = season_stats.batting[batter.mlb_id]
+            batting_line_list.append(batting_line)
+            assert batting_line.G == 1
+            for field in box_score._fields:
+                assert getattr(batting_line, field) == getattr(box_score,
+                                                               field)
+
+            assert (batting_line.B2 + batting_line.B3 + batting_line.HR <=
+                    batting_line.H)
+
+        for field in EXTRA_FIELD_LIST:
+            assert (sum(getattr(batting_line, field)
+                        for batting_line in batting_line_list) ==
+                    getattr(team_stats, field))
+
+        for pitcher, box_score in pitcher_box_score_dict.items():
+            pitching_line = season_stats.pitching[pitcher.mlb_id]
+            assert pitching_line.IP == box_score.IP
+            assert pitching_line.ER == box_score.ER
+            assert pitching_line.SO == box_score.SO
+
+        team_line = season_stats.team[team.abbreviation]
+        assert team_line.H == batter_box_score_dict['TOTAL'].H
+        for field in team_stats._fields:
+            assert getattr(team_line, field) == getattr(team_stats, field)
+
+def test_load_errors_are_reported_from_workers(tmp_path, capsys):
+    input_dir = str(tmp_path / 'archive')
+    copytree(ARCHIVE_DIR, input_dir)
+    filename_tuple, = get_filename_list('2019-04-05', '2019-04-05', input_dir)
+    with open(filename_tuple[4], 'w', encoding='utf-8') as filehandle:
+        filehandle.write('{"gamePk": ')
+
+    season_stats = get_season_stats_from_file_range('2017-04-05',
+                                                    '2019-04-05', input_dir,
+                                                    num_processes=2)
+
+    assert sorted(season_stats.team) == ['ATL', 'LAD']
+    assert '({})'.format(filename_tuple[0]) in capsys.readouterr().out
@@ -0,0 +1,59 @@
+from copy import deepcopy
+from json import loads
+from os.path import dirname, join
+
+from baseball.process_game_json import get_game_obj, update_game_obj
+
+LIVE_FILE = join(dirname(__file__), 'data', 'archive', '2019', 'month_04',
+                 'day_05', 'gid_2019_04_05_lanmlb_bosmlb_1', 'live')
+
+BOX_SCORE_KEY_LIST = ['away_batter_box_score_dict',
+                      'away_pitcher_box_score_dict',
+                      'home_batter_box_score_dict',
+                      'home_pitcher_box_score_dict',
+                      'away_team_stats',
+                      'home_team_stats']
+
+def get_partial_game_dict(game_dict, num_plays):
+    partial_game_dict = deepcopy(game_dict)
+    partial_game_dict['liveData']['plays']['allPlays'] = (
+        partial_game_dict['liveData']['plays']['allPlays'][:num_plays]
+    )
+
+    return partial_game_dict
+
+def get_box_score_list(game):
+    box_score_list = []
+    for key in BOX_SCORE_KEY_LIST:
+        box_score = getattr(game, key)
+        if isinstance(box_score, dict):
+            box_score = [(getattr(player, 'mlb_id', player), player_box_score)
+                         for player, player_box_score in box_score.items()]
+
+        box_score_list.append(box_score)
+
+    return box_score_list
+
+def test_updated_box_scores_match_full_build():
+    with open(LIVE_FILE, 'r', encoding='utf-8') as filehandle:
+        game_dict = loads(filehandle.read())
+
+    num_plays = len(game_dict['liveData']['plays']['allPlays'])
+    game = get_game_obj(get_partial_game_dict(game_dict, 10))
+    get_box_score_list(game)
+    num_reused_rows = 0
+    for this_num_plays in range(12, num_plays + 2, 2):
+        partial_game_dict = get_partial_game_dict(game_dict, this_num_plays)
+        previous_box_score_dict = game.away_batter_box_score_dict
+        game = update_game_obj(game, partial_game_dict)
+
+        assert get_box_score_list(game) == get_box_score_list(
+            get_game_obj(partial_game_dict)
+        )
+
+        num_reused_rows += sum(
+            box_score is previous_box_score_dict.get(batter)
+            for batter, box_score in game.away_batter_box_score_dict.items()
+        )
+
+    assert num_reused_rows